@@ -2,6 +2,7 @@ import argparse
 from pathlib import Path
 from lft.app import InstantApp, RecordApp, ReplayApp
 from lft.app.app import Mode
+from lft.event import RecordFormat
 
 
 def main():
@@ -14,14 +15,31 @@ def main():
                         help="Record data path(ignored on instant mode), (default: %(default)s)")
     parser.add_argument("--target", "-t", type=bytes.fromhex, default=b"", required=False,
                         help="Target node ID for replay(only for replay mode)")
+    parser.add_argument("--virtual-clock", action="store_true",
+                        help="Run delayed events on a virtual clock instead of waiting(ignored on replay mode)")
+    parser.add_argument("--format", "-f", type=RecordFormat, default=RecordFormat.json.value, required=False,
+                        help="Record format, [json|binary](ignored on instant mode), (default: %(default)s)")
+    parser.add_argument("--start-number", type=int, default=0, required=False,
+                        help="Event number to start replay from(only for replay mode)")
+    parser.add_argument("--start-round", type=int, nargs=2, default=None, required=False, metavar=("EPOCH", "ROUND"),
+                        help="Epoch and round to start replay from(only for replay mode)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Replay without UI as fast as possible, exit at the end and report throughput"
+                             "(only for replay mode)")
+    parser.add_argument("--vote-batch-size", type=int, default=1, required=False,
+                        help="Number of received votes verified at once, it must be the same on record and replay, "
+                             "(default: %(default)s)")
 
     args = parser.parse_args()
     if args.mode == Mode.instant:
-        app = InstantApp(args.number)
+        app = InstantApp(args.number, args.virtual_clock, args.vote_batch_size)
     elif args.mode == Mode.record:
-        app = RecordApp(args.number, args.data)
+        app = RecordApp(args.number, args.data, args.virtual_clock, args.format,
+                        vote_batch_size=args.vote_batch_size)
     elif args.mode == Mode.replay:
-        app = ReplayApp(args.data, args.target)
+        app = ReplayApp(args.data, args.target, args.format,
+                        args.start_number, tuple(args.start_round) if args.start_round else None, args.fast,
+                        args.vote_batch_size)
     else:
         raise RuntimeError("Invalid mode, {args.mode}")
     app.start()
@@ -1,25 +1,31 @@
 import asyncio
+import logging
 import os
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from lft.app import Node
 from lft.app.data import DefaultData
 from lft.app.ui.listener import Listener
 from lft.app.epoch import RotateEpoch
-from lft.consensus.events import InitializeEvent
+from lft.consensus.events import InitializeEvent, RoundEndEvent
+from lft.event import VirtualClock, RecordFormat, RecordBufferConfig, EventStats
 
 RECORD_PATH = "record.log"
+RECORD_INDEX_PATH = "record.log.idx"
+CHECKPOINT_PATH = "checkpoint.log"
 
-__all__ = ("RECORD_PATH", "App", "InstantApp", "ReplayApp", "RecordApp", "Mode")
+__all__ = ("RECORD_PATH", "RECORD_INDEX_PATH", "CHECKPOINT_PATH", "App", "InstantApp", "ReplayApp", "RecordApp", "Mode")
 
 
 class App(ABC):
-    def __init__(self):
+    def __init__(self, virtual_clock: bool = False, vote_batch_size: int = 1):
         self.listener = Listener(self)
         self.nodes: Optional[List[Node]] = None
         self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.clock: Optional[VirtualClock] = VirtualClock() if virtual_clock else None
+        self.vote_batch_size = vote_batch_size
 
     def __del__(self):
         self.close()
@@ -88,8 +94,8 @@ class App(ABC):
 
 
 class InstantApp(App):
-    def __init__(self, number: int):
-        super().__init__()
+    def __init__(self, number: int, virtual_clock: bool = False, vote_batch_size: int = 1):
+        super().__init__(virtual_clock, vote_batch_size)
         self.number = number
 
     def _start(self, nodes: List[Node]):
@@ -99,38 +105,72 @@ class InstantApp(App):
             self._raise_init_event(node, nodes)
 
     def _gen_nodes(self) -> List[Node]:
-        return [Node(os.urandom(16)) for _ in range(self.number)]
+        return [Node(os.urandom(16), self.clock, vote_batch_size=self.vote_batch_size) for _ in range(self.number)]
 
 
 class RecordApp(App):
-    def __init__(self, number: int, path: Path):
-        super().__init__()
+    def __init__(self, number: int, path: Path, virtual_clock: bool = False,
+                 record_format: RecordFormat = RecordFormat.json,
+                 buffer_config: Optional[RecordBufferConfig] = None, vote_batch_size: int = 1):
+        super().__init__(virtual_clock, vote_batch_size)
         self.number = number
         self.path = path
+        self.record_format = record_format
+        self.buffer_config = buffer_config or RecordBufferConfig()
 
     def _start(self, nodes: List[Node]):
         for node in nodes:
             node_path = self.path.joinpath(node.node_id.hex())
             node_path.mkdir()
 
-            record_io = open(str(node_path.joinpath(RECORD_PATH)), 'w')
-            node.start_record(record_io, blocking=False)
+            record_io = open(str(node_path.joinpath(RECORD_PATH)), 'w' + self.record_format.io_mode)
+            index_io = open(str(node_path.joinpath(RECORD_INDEX_PATH)), 'wb')
+            checkpoint_io = open(str(node_path.joinpath(CHECKPOINT_PATH)), 'wb')
+            node.start_record(record_io, blocking=False, record_format=self.record_format,
+                              buffer_config=self.buffer_config, index_io=index_io, checkpoint_io=checkpoint_io)
 
             self._raise_init_event(node, nodes)
 
     def _gen_nodes(self) -> List[Node]:
         self.path.mkdir(parents=True, exist_ok=True)
-        return [Node(os.urandom(16)) for _ in range(self.number)]
+        return [Node(os.urandom(16), self.clock, vote_batch_size=self.vote_batch_size) for _ in range(self.number)]
 
 
 class ReplayApp(App):
-    def __init__(self, path: Path, node: bytes):
-        super().__init__()
+    def __init__(self, path: Path, node: bytes, record_format: RecordFormat = RecordFormat.json,
+                 start_number: int = 0, start_round: Optional[Tuple[int, int]] = None, fast: bool = False,
+                 vote_batch_size: int = 1):
+        super().__init__(vote_batch_size=vote_batch_size)
         self.path = path
         self.node = node
+        self.record_format = record_format
+        self.start_number = start_number
+        self.start_round = start_round
+        self.fast = fast  # Headless, exits at the end of the record and reports throughput
+
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        if not self.fast:
+            return super().start()
+
+        self.nodes = self._gen_nodes()
+        for node in self.nodes:
+            node.logger.setLevel(logging.WARNING)
+        self._start(self.nodes)
+
+        commits = {node.node_id: len(node.commit_datums) for node in self.nodes}
+        stats = [node.event_system.simulator.profile() for node in self.nodes]
+        self.loop = asyncio.get_event_loop()
+        self.loop.run_until_complete(asyncio.gather(*self._tasks))
+
+        for node, node_stats in zip(self.nodes, stats):
+            _print_report(node, node_stats, len(node.commit_datums) - commits[node.node_id])
+            node.close()
 
     def _gen_nodes(self) -> List[Node]:
-        return [Node(self.node)]
+        # Size flushes are not recorded, the size must be the one of the record.
+        return [Node(self.node, vote_batch_size=self.vote_batch_size)]
 
     def _get_nodes_id(self):
         return [Path(path) for path in os.listdir(str(self.path))]
@@ -138,9 +178,34 @@ class ReplayApp(App):
     def _start(self, nodes: List[Node]):
         for node in nodes:
             node_path = self.path.joinpath(node.node_id.hex())
-            record_io = open(str(node_path.joinpath(RECORD_PATH)), 'r')
-
-            node.start_replay(record_io, blocking=False)
+            record_io = open(str(node_path.joinpath(RECORD_PATH)), 'r' + self.record_format.io_mode)
+
+            index_io = _open_if_exists(node_path.joinpath(RECORD_INDEX_PATH))
+            checkpoint_io = _open_if_exists(node_path.joinpath(CHECKPOINT_PATH))
+
+            task = node.start_replay(record_io, blocking=False, record_format=self.record_format, index_io=index_io,
+                                     start_number=self.start_number, start_round=self.start_round,
+                                     checkpoint_io=checkpoint_io, stop_at_end=self.fast)
+            self._tasks.append(task)
+            for io in (index_io, checkpoint_io):
+                if io:
+                    io.close()
+
+
+def _open_if_exists(path: Path):
+    return open(str(path), 'rb') if path.exists() else None
+
+
+def _print_report(node: Node, stats: EventStats, commits: int):
+    elapsed = stats.elapsed or float("inf")
+    rounds = stats.get_count(RoundEndEvent)
+    print(f"node={node.node_id.hex()} elapsed={stats.elapsed:.3f}s events={stats.count} "
+          f"events/sec={stats.count / elapsed:.0f} rounds/sec={rounds / elapsed:.1f} "
+          f"commits/sec={commits / elapsed:.1f}")
+    print(f"{'event':<24}{'count':>10}{'total(ms)':>12}{'avg(us)':>10}")
+    for event_type, type_stats in sorted(stats.types.items(), key=lambda item: -item[1].time):
+        print(f"{event_type.__name__:<24}{type_stats.count:>10}"
+              f"{type_stats.time * 1000:>12.1f}{type_stats.avg_time * 1000000:>10.1f}")
 
 
 class Mode(Enum):
@@ -1,7 +1,8 @@
 from hashlib import sha3_256
-from typing import Sequence, Type, TypeVar
+from typing import Optional, Sequence, Type, TypeVar, Union
 from lft.app.vote import DefaultVote
 from lft.consensus.messages.data import Data, DataVerifier, DataFactory
+from lft.consensus.messages.vote import VoteCertificate
 
 __all__ = ("DefaultData", "DefaultDataFactory", "DefaultDataVerifier")
 
@@ -19,14 +20,20 @@ class DefaultData(Data):
                  number: int,
                  epoch_num: int,
                  round_num: int,
-                 prev_votes: Sequence['DefaultVote'] = ()):
+                 prev_votes: Union[Sequence['DefaultVote'], VoteCertificate] = ()):
         self._id = id_
         self._prev_id = prev_id
         self._proposer_id = proposer_id
         self._number = number
         self._epoch_num = epoch_num
         self._round_num = round_num
-        self._prev_votes: Sequence['DefaultVote'] = prev_votes
+        if isinstance(prev_votes, VoteCertificate):
+            # Consensus expands it with the voters of the epoch
+            self._prev_votes: Sequence['DefaultVote'] = ()
+            self._prev_votes_certificate: Optional[VoteCertificate] = prev_votes
+        else:
+            self._prev_votes: Sequence['DefaultVote'] = prev_votes
+            self._prev_votes_certificate: Optional[VoteCertificate] = None
 
     @property
     def id(self) -> bytes:
@@ -56,6 +63,10 @@ class DefaultData(Data):
     def prev_votes(self) -> Sequence['DefaultVote']:
         return self._prev_votes
 
+    @property
+    def prev_votes_certificate(self) -> Optional[VoteCertificate]:
+        return self._prev_votes_certificate
+
     def is_none(self) -> bool:
         return self._id == self.NoneData
 
@@ -70,7 +81,8 @@ class DefaultData(Data):
             "number": self.number,
             "epoch": self.epoch_num,
             "round": self.round_num,
-            "prev_votes": tuple(self.prev_votes)
+            "prev_votes": (tuple(self.prev_votes) if self._prev_votes_certificate is None
+                           else self._prev_votes_certificate)
         }
 
     @classmethod
@@ -82,7 +94,7 @@ class DefaultData(Data):
             number=kwargs["number"],
             epoch_num=kwargs["epoch"],
             round_num=kwargs["round"],
-            prev_votes=tuple(kwargs["prev_votes"])
+            prev_votes=_deserialize_prev_votes(kwargs["prev_votes"])
         )
 
     def __repr__(self):
@@ -93,14 +105,21 @@ class DefaultData(Data):
         return f"{self.__class__.__qualname__}({serialized})"
 
 
+def _deserialize_prev_votes(prev_votes):
+    if isinstance(prev_votes, VoteCertificate):
+        return prev_votes
+    return tuple(prev_votes)
+
+
 class DefaultDataVerifier(DataVerifier):
     async def verify(self, data: 'DefaultData'):
         pass
 
 
 class DefaultDataFactory(DataFactory):
-    def __init__(self, node_id: bytes):
+    def __init__(self, node_id: bytes, compact_prev_votes: bool = False):
         self._node_id = node_id
+        self._compact_prev_votes = compact_prev_votes
 
     def _create_id(self,
                    prev_id: bytes,
@@ -108,10 +127,15 @@ class DefaultDataFactory(DataFactory):
                    data_number: int,
                    epoch_num: int,
                    round_num: int,
-                   prev_votes: Sequence['DefaultVote']) -> bytes:
+                   prev_votes: Union[Sequence['DefaultVote'], VoteCertificate]) -> bytes:
+        if isinstance(prev_votes, VoteCertificate):
+            prev_votes_source = (prev_votes.voters.to_bytes((prev_votes.voters.bit_length() + 7) // 8, 'big') +
+                                 prev_votes.commit_id + b"".join(prev_votes.vote_ids))
+        else:
+            prev_votes_source = b"".join(prev_vote.id if prev_vote else bytes(16) for prev_vote in prev_votes)
         source = (prev_id + propose_id + data_number.to_bytes(64, 'big') +
                   epoch_num.to_bytes(64, 'big') + round_num.to_bytes(64, 'big') +
-                  b"".join(prev_vote.id if prev_vote else bytes(16) for prev_vote in prev_votes))
+                  prev_votes_source)
         return sha3_256(source).digest()[:16]
 
     async def create_data(self,
@@ -120,6 +144,8 @@ class DefaultDataFactory(DataFactory):
                           epoch_num: int,
                           round_num: int,
                           prev_votes: Sequence['DefaultVote']) -> DefaultData:
+        if self._compact_prev_votes:
+            prev_votes = VoteCertificate.from_votes(prev_votes) or prev_votes
         data_id = self._create_id(prev_id, self._node_id, data_number, epoch_num, round_num, prev_votes)
         return DefaultData(data_id, prev_id, self._node_id, data_number, epoch_num, round_num, prev_votes=prev_votes)
 
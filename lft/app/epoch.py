@@ -15,6 +15,7 @@ class RotateEpoch(Epoch):
         self._rotate_bound = rotate_bound
         self._voters = tuple(voters)
         self._voters_num = len(self._voters)
+        self._voter_indexes = {voter: i for i, voter in reversed(tuple(enumerate(self._voters)))}
 
     @property
     def voters(self) -> Sequence[bytes]:
@@ -40,9 +41,8 @@ class RotateEpoch(Epoch):
             self.verify_voter(vote.voter_id, vote_index)
 
     def verify_proposer(self, proposer_id: bytes, round_num: int):
-        expected = self.get_proposer_id(round_num)
-        if proposer_id != expected:
-            raise InvalidProposer(proposer_id, expected)
+        if not self.is_proposer(proposer_id, round_num):
+            raise InvalidProposer(proposer_id, self.get_proposer_id(round_num))
 
     def verify_voter(self, voter: bytes, vote_index: int = -1):
         if vote_index >= 0:
@@ -50,9 +50,12 @@ class RotateEpoch(Epoch):
             if voter != expected:
                 raise InvalidVoter(voter, expected)
         else:
-            if voter not in self._voters:
+            if voter not in self._voter_indexes:
                 raise InvalidVoter(voter, bytes(0))
 
+    def is_voter(self, voter: bytes) -> bool:
+        return voter in self._voter_indexes
+
     def get_proposer_id(self, round_num: int) -> bytes:
         if len(self._voters) == 0:
             return b''
@@ -65,6 +68,9 @@ class RotateEpoch(Epoch):
     def get_voters_id(self) -> Sequence[bytes]:
         return self._voters
 
+    def get_voter_index(self, voter: bytes) -> int:
+        return self._voter_indexes[voter]
+
     def _serialize(self) -> dict:
         return {
             "num": self.num,
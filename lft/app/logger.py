@@ -12,6 +12,9 @@ __all__ = ("Logger", )
 class Logger:
     def __init__(self, node_id: bytes):
         self.logger = logging.getLogger(node_id.hex())
+        if hasattr(self.logger, "_debug"):
+            # Already patched by a node of the same id
+            return
 
         style = coloredlogs.DEFAULT_LEVEL_STYLES.copy()
         style['debug'] = {'color': 'cyan'}
@@ -42,6 +45,8 @@ class LoggerPatcher:
         self._encoder = _JSONEncoder()
 
     def log(self, level: str, msg: Union[str, Event], *arg, **kwargs):
+        if not self._logger.isEnabledFor(_levels[level]):
+            return
         if isinstance(msg, Event):
             msg = self._make_log(msg)
 
@@ -85,5 +90,15 @@ class _JSONEncoder(json.JSONEncoder):
             return super().encode(o)
 
 
+_levels = {
+    "_debug": logging.DEBUG,
+    "_info": logging.INFO,
+    "_warning": logging.WARNING,
+    "_error": logging.ERROR,
+    "_critical": logging.CRITICAL,
+    "_fatal": logging.FATAL
+}
+
+
 def shorten(b: bytes):
     return b.hex()[:4]
@@ -1,10 +1,11 @@
+import math
 import random
 
-from typing import TYPE_CHECKING, DefaultDict, Set
-from lft.event import EventRegister, EventSystem
-from lft.event.mediators import DelayedEventMediator
+from typing import TYPE_CHECKING, DefaultDict, Dict, Set, Tuple
+from lft.event import EventRegister, EventSystem, get_timing_wheel
+from lft.event.mediators import DelayedEventMediator, DelayedHandler
 from lft.consensus.events import (BroadcastDataEvent, BroadcastVoteEvent,
-                                  ReceiveDataEvent, ReceiveVoteEvent)
+                                  ReceiveDataEvent, ReceiveVotesEvent)
 
 if TYPE_CHECKING:
     from lft.consensus.messages.data import Data
@@ -21,6 +22,7 @@ class Network(EventRegister):
         super().__init__(event_system.simulator)
         self._peers: Set['Network'] = set()
         self._delayed_mediator = event_system.get_mediator(DelayedEventMediator)
+        self._vote_deliveries: Dict[int, Tuple[ReceiveVotesEvent, DelayedHandler]] = {}
 
     def add_peer(self, peer: 'Network'):
         self._peers.add(peer)
@@ -36,11 +38,30 @@ class Network(EventRegister):
         self._delayed_mediator.execute(delay, event)
 
     def receive_vote(self, vote: 'Vote'):
-        event = ReceiveVoteEvent(vote)
-        event.deterministic = False
-
+        # Votes delivered in the same tick of the timing wheel are received as one event.
+        # The event is recorded when it is raised, so votes appended until then are replayed with it.
+        wheel = get_timing_wheel(self._event_simulator.clock)
+        now = wheel.time()
         delay = self.random_delay()
-        self._delayed_mediator.execute(delay, event)
+        tick = math.ceil(round((now + delay) * wheel.ticks_per_second, 6))
+
+        delivery = self._vote_deliveries.get(tick)
+        if delivery:
+            event, handler = delivery
+            if handler in handler.handlers:
+                event.votes.append(vote)
+                return
+
+        event = ReceiveVotesEvent([vote])
+        event.deterministic = False
+        handler = self._delayed_mediator.execute(delay, event)
+        if handler:
+            self._prune_vote_deliveries(math.floor(now * wheel.ticks_per_second))
+            self._vote_deliveries[tick] = (event, handler)
+
+    def _prune_vote_deliveries(self, current_tick: int):
+        for tick in [tick for tick in self._vote_deliveries if tick <= current_tick]:
+            del self._vote_deliveries[tick]
 
     def broadcast_data(self, data: 'Data'):
         for peer in self._peers:
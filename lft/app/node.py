@@ -1,32 +1,39 @@
-from typing import IO, Dict, Type, OrderedDict
+import pickle
+from concurrent.futures import Executor
+from typing import IO, Dict, Type, OrderedDict, Optional, Tuple
 from lft.app.data import DefaultDataFactory
 from lft.app.epoch import RotateEpoch
 from lft.app.vote import DefaultVoteFactory
 from lft.app.network import Network
 from lft.app.logger import Logger
 from lft.consensus.messages.data import Data
-from lft.event import EventSystem, EventMediator
-from lft.event.mediators import DelayedEventMediator
+from lft.event import EventSystem, EventMediator, VirtualClock, RecordFormat, RecordBufferConfig, EventCheckpointable
+from lft.event.mediators import DelayedEventMediator, ExecutorEventMediator
 from lft.consensus.consensus import Consensus
 from lft.consensus.events import RoundStartEvent, RoundEndEvent, InitializeEvent
 
 __all__ = ("Node", )
 
 
-class Node:
-    def __init__(self, node_id: bytes):
+class Node(EventCheckpointable):
+    def __init__(self, node_id: bytes, clock: Optional[VirtualClock] = None,
+                 verify_pool: Optional[Executor] = None, compact_prev_votes: bool = False,
+                 vote_batch_size: int = 1):
         self.node_id = node_id
         self.logger = Logger(node_id).logger
-        self.event_system = EventSystem(self.logger)
+        self.event_system = EventSystem(self.logger, clock=clock)
         self.event_system.set_mediator(DelayedEventMediator)
+        self.event_system.set_mediator(ExecutorEventMediator)
 
         self._nodes = None
         self._network = Network(self.event_system)
         self._consensus = Consensus(
             self.event_system,
             self.node_id,
-            DefaultDataFactory(self.node_id),
-            DefaultVoteFactory(self.node_id)
+            DefaultDataFactory(self.node_id, compact_prev_votes),
+            DefaultVoteFactory(self.node_id),
+            vote_batch_size=vote_batch_size,
+            verify_pool=verify_pool
         )
         self._epoch_num = -1
         self._round_num = -1
@@ -36,14 +43,29 @@ class Node:
 
         self.event_system.simulator.register_handler(InitializeEvent, self._on_init_event)
         self.event_system.simulator.register_handler(RoundEndEvent, self._on_round_end_event)
+        self.event_system.simulator.register_handler(RoundStartEvent, self._on_round_start_event)
+
+        self.event_system.checkpointer.register("node", self)
+        self.event_system.checkpointer.register("consensus", self._consensus)
+
+    def snapshot(self) -> bytes:
+        return pickle.dumps((self._nodes, self._epoch_num, self._round_num, self.commit_datums))
+
+    def restore(self, snapshot: bytes):
+        self._nodes, self._epoch_num, self._round_num, self.commit_datums = pickle.loads(snapshot)
 
     async def _on_init_event(self, init_event: InitializeEvent):
         self._nodes = init_event.epoch_pool[-1].voters
 
+    async def _on_round_start_event(self, round_start_event: RoundStartEvent):
+        self.event_system.recorder.mark(_round_key(round_start_event.epoch.num, round_start_event.round_num))
+
     async def _on_round_end_event(self, round_end_event: RoundEndEvent):
         if round_end_event.is_success and round_end_event.commit_id:
             data = self._consensus._data_pool.get_data(round_end_event.commit_id)
             self.commit_datums[data.number] = data
+            self.event_system.recorder.sync()
+            self.event_system.checkpointer.request()
 
         if (self._epoch_num, self._round_num) > (round_end_event.epoch_num, round_end_event.round_num):
             return
@@ -79,14 +101,29 @@ class Node:
     def start(self, blocking=True):
         self.event_system.start(blocking)
 
-    def start_record(self, record_io: IO, mediator_ios: Dict[Type[EventMediator], IO]=None, blocking=True):
-        self.event_system.start_record(record_io, mediator_ios, blocking)
-
-    def start_replay(self, record_io: IO, mediator_ios: Dict[Type[EventMediator], IO]=None, blocking=True):
-        self.event_system.start_replay(record_io, mediator_ios, blocking)
+    def start_record(self, record_io: IO, mediator_ios: Dict[Type[EventMediator], IO]=None, blocking=True,
+                     record_format: RecordFormat = RecordFormat.json,
+                     buffer_config: Optional[RecordBufferConfig] = None, index_io: Optional[IO] = None,
+                     checkpoint_io: Optional[IO] = None):
+        self.event_system.start_record(record_io, mediator_ios, blocking,
+                                       record_format=record_format, buffer_config=buffer_config,
+                                       index_io=index_io, checkpoint_io=checkpoint_io)
+
+    def start_replay(self, record_io: IO, mediator_ios: Dict[Type[EventMediator], IO]=None, blocking=True,
+                     record_format: RecordFormat = RecordFormat.json, index_io: Optional[IO] = None,
+                     start_number: int = 0, start_round: Optional[Tuple[int, int]] = None,
+                     checkpoint_io: Optional[IO] = None, stop_at_end: bool = False):
+        start_mark = _round_key(*start_round) if start_round else None
+        return self.event_system.start_replay(record_io, mediator_ios, blocking, record_format=record_format,
+                                              index_io=index_io, start_number=start_number, start_mark=start_mark,
+                                              checkpoint_io=checkpoint_io, stop_at_end=stop_at_end)
 
     def register_peer(self, peer: 'Node'):
         self._network.add_peer(peer._network)
 
     def unregister_peer(self, peer: 'Node'):
         self._network.remove_peer(peer._network)
+
+
+def _round_key(epoch_num: int, round_num: int):
+    return (epoch_num << 32) | round_num
@@ -27,6 +27,9 @@ class Console:
             IPython.start_ipython(argv=[], user_ns=user_ns)
         finally:
             for node in app.nodes:
+                if node.event_system.simulator.clock:
+                    # Virtual time does not pass while the console is running.
+                    continue
                 mediator = node.event_system.get_mediator(DelayedEventMediator)
                 self._restore_delayed_mediator(start_time, mediator)
 
@@ -38,13 +41,11 @@ class Console:
                 not isinstance(executor, DelayedEventRecorderMediatorExecutor)):
             return
 
-        old_handlers = executor.handlers
-        executor.handlers = set()
-
-        for old_handler in old_handlers:
-            old_handler.timer_handler.cancel()
-            diff = old_handler.timer_handler.when() - start_time
-            mediator.execute(diff, old_handler.event)
+        # Reschedule in place, the handlers are still held by their owners, e.g. timers of rounds.
+        for handler in executor.handlers:
+            handler.timer_handler.cancel()
+            diff = handler.timer_handler.when() - start_time
+            handler.timer_handler = executor.timing_wheel.call_later(diff, handler)
 
 
 def debug_patch(node: 'Node'):
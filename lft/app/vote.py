@@ -105,5 +105,9 @@ class DefaultVoteFactory(VoteFactory):
         vote_id = self._create_id(voter_id, voter_id, voter_id, epoch_num, round_num)
         return DefaultVote(vote_id, DefaultVote.LazyVote, DefaultVote.LazyVote, voter_id, epoch_num, round_num)
 
+    def restore_vote(self, vote_id: bytes, data_id: bytes, commit_id: bytes, voter_id: bytes,
+                     epoch_num: int, round_num: int) -> DefaultVote:
+        return DefaultVote(vote_id, data_id, commit_id, voter_id, epoch_num, round_num)
+
     async def create_vote_verifier(self) -> DefaultVoteVerifier:
         return DefaultVoteVerifier()
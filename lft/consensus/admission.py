@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Tuple
+from lft.consensus.messages.message import Message, MessageCache
+
+__all__ = ("AdmissionFilter", "AdmissionStats", "AdmissionResult")
+
+
+class AdmissionResult(IntEnum):
+    # Ordinary rejections of received messages. They are too common to be raised as exceptions.
+    ACCEPTED = 0
+    INVALID_EPOCH = 1
+    INVALID_ROUND = 2
+    INVALID_PROPOSER = 3
+    INVALID_VOTER = 4
+    ALREADY_PROPOSED = 5
+    ALREADY_VOTED = 6
+
+
+@dataclass
+class AdmissionStats:
+    admitted: int = 0
+    duplicated: int = 0
+    stale: int = 0
+
+    @property
+    def dropped(self):
+        return self.duplicated + self.stale
+
+
+class AdmissionFilter:
+    # Drops received messages before they are dispatched, if consensus would reject them anyway.
+    # Messages accepted already are duplicated and messages at or below the commit are stale.
+    def __init__(self, data_cache: MessageCache, vote_cache: MessageCache):
+        self.stats = AdmissionStats()
+        self.watermark: Tuple[int, int] = (-1, -1)  # (epoch_num, round_num) of the commit
+
+        self._data_cache = data_cache
+        self._vote_cache = vote_cache
+
+    def admit_data(self, data: Message) -> bool:
+        return self._admit(data, self._data_cache)
+
+    def admit_vote(self, vote: Message) -> bool:
+        return self._admit(vote, self._vote_cache)
+
+    def _admit(self, message: Message, cache: MessageCache) -> bool:
+        if (message.epoch_num, message.round_num) <= self.watermark:
+            self.stats.stale += 1
+            return False
+        if cache.has(message):
+            self.stats.duplicated += 1
+            return False
+        self.stats.admitted += 1
+        return True
@@ -1,14 +1,25 @@
+import io
 import logging
+import pickle
+from collections import defaultdict, deque
+from concurrent.futures import Executor
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Iterable, Optional
-from lft.event import EventRegister
+from typing import TYPE_CHECKING, Any, DefaultDict, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from lft.event import EventRegister, EventCheckpointable
+from lft.event.mediators import DelayedEventMediator, DelayedHandler, ExecutorEventMediator
 from lft.consensus.epoch import EpochPool
-from lft.consensus.messages.data import DataPool
-from lft.consensus.messages.vote import VotePool
+from lft.consensus.messages.data import DataPool, DataVerifier
+from lft.consensus.messages.message import MessageCache
+from lft.consensus.messages.vote import VotePool, VoteVerifier
+from lft.consensus.admission import AdmissionFilter, AdmissionResult
+from lft.consensus.pruning import PoolSizes, PruneStats
 from lft.consensus.round import Round, RoundPool
 from lft.consensus.election import Election
-from lft.consensus.events import InitializeEvent, RoundStartEvent, ReceiveDataEvent, ReceiveVoteEvent
-from lft.consensus.exceptions import InvalidRound, InvalidEpoch, InvalidProposer, InvalidVoter
+from lft.consensus.events import (InitializeEvent, RoundStartEvent,
+                                  ReceiveDataEvent, ReceiveVoteEvent, ReceiveVotesEvent,
+                                  VoteTimeoutEvent, VoteBatchTimeoutEvent, DataVerifiedEvent, VotesVerifiedEvent,
+                                  PruneMessagesEvent)
+from lft.consensus.exceptions import InvalidEpoch
 
 if TYPE_CHECKING:
     from lft.event import EventSystem
@@ -17,12 +28,16 @@ if TYPE_CHECKING:
     from lft.consensus.messages.vote import Vote, VoteFactory
     from lft.consensus.messages.message import Message
 
-__all__ = ("Consensus", )
+__all__ = ("Consensus", "VOTE_BATCH_DELAY")
 
+VOTE_BATCH_DELAY = 0.01
 
-class Consensus(EventRegister):
+
+class Consensus(EventRegister, EventCheckpointable):
     def __init__(self, event_system: 'EventSystem', node_id: bytes,
-                 data_factory: 'DataFactory', vote_factory: 'VoteFactory'):
+                 data_factory: 'DataFactory', vote_factory: 'VoteFactory',
+                 vote_batch_size: int = 1, vote_batch_delay: float = VOTE_BATCH_DELAY,
+                 verify_pool: Optional[Executor] = None, deferred_pruning: bool = False):
         super().__init__(event_system.simulator)
 
         self._event_system = event_system
@@ -34,9 +49,65 @@ class Consensus(EventRegister):
         self._round_pool = RoundPool()
         self._data_pool = DataPool()
         self._vote_pool = VotePool()
+        self._data_cache = MessageCache()
+        self._vote_cache = MessageCache()  # Accepted votes, received again as prev votes of data
+        self._admission = AdmissionFilter(self._data_cache, self._vote_cache)
+
+        # Received votes wait here to be verified at once, until the size is reached or the delay is passed.
+        self._vote_verifier: Optional[VoteVerifier] = None
+        self._vote_batch: List['Vote'] = []
+        self._vote_batch_size = vote_batch_size
+        self._vote_batch_delay = vote_batch_delay
+        self._vote_batch_timer: Optional[DelayedHandler] = None
+
+        # Rounds whose candidate changed, waiting for _advance_candidate.
+        self._changed_rounds: Deque[Round] = deque()
+        self._advancing_candidate = False
+
+        # Verification runs in the pool if it is given. Results come back as events.
+        # Time of a VirtualClock does not pass while the pool is verifying.
+        self._verify_pool = verify_pool
+
+        # Messages before the commit are pruned by an event after the current one, if deferred.
+        # It is not deferred to an idle moment of the simulator. When it is idle depends on arrival times, which
+        # are not recorded, and pools pruned at another point would diverge on replay and in checkpoints.
+        # As a deterministic event it runs before any received message, but out of the handler which committed.
+        self._deferred_pruning = deferred_pruning
+        self._prune_stats = PruneStats()
 
         self._logger = logging.getLogger(node_id.hex())
 
+    @property
+    def prune_stats(self) -> PruneStats:
+        return self._prune_stats
+
+    def snapshot(self) -> bytes:
+        buffer = io.BytesIO()
+        pickler = _SnapshotPickler(buffer, self._snapshot_externals())
+        pickler.dump((self._epoch_pool, self._round_pool, self._data_pool, self._vote_pool,
+                      self._data_cache, self._vote_cache, self._admission, self._vote_batch))
+        return buffer.getvalue()
+
+    def restore(self, snapshot: bytes):
+        unpickler = _SnapshotUnpickler(io.BytesIO(snapshot), self._snapshot_externals())
+        (self._epoch_pool, self._round_pool, self._data_pool, self._vote_pool,
+         self._data_cache, self._vote_cache, self._admission, self._vote_batch) = unpickler.load()
+        self._vote_batch_timer = None  # The timeout is replayed from the record
+
+    def _snapshot_externals(self) -> Dict[str, Any]:
+        return {
+            "event_system": self._event_system,
+            "data_factory": self._data_factory,
+            "vote_factory": self._vote_factory,
+            "verify_pool": self._verify_pool
+        }
+
+    def _admit_receive_data(self, event: ReceiveDataEvent):
+        return self._admission.admit_data(event.data)
+
+    def _admit_receive_vote(self, event: ReceiveVoteEvent):
+        return self._admission.admit_vote(event.vote)
+
     async def _on_event_initialize(self, event: InitializeEvent):
         await self.initialize(event.commit_id, event.epoch_pool, event.data_pool, event.vote_pool)
 
@@ -49,29 +120,52 @@ class Consensus(EventRegister):
     async def _on_event_receive_vote(self, event: ReceiveVoteEvent):
         await self.receive_vote(event.vote)
 
+    async def _on_event_receive_votes(self, event: ReceiveVotesEvent):
+        # A batch is not dropped by the filters, each vote is admitted here.
+        await self.receive_votes(vote for vote in event.votes if self._admission.admit_vote(vote))
+
+    async def _on_event_vote_timeout(self, event: VoteTimeoutEvent):
+        await self.vote_timeout(event.epoch_num, event.round_num)
+
+    async def _on_event_vote_batch_timeout(self, event: VoteBatchTimeoutEvent):
+        await self.flush_votes()
+
+    async def _on_event_votes_verified(self, event: VotesVerifiedEvent):
+        await self.votes_verified(event.votes, event.verified)
+
+    async def _on_event_data_verified(self, event: DataVerifiedEvent):
+        await self.data_verified(event.data, event.verified)
+
+    async def _on_event_prune_messages(self, event: PruneMessagesEvent):
+        self._prune_messages(event.epoch_num, event.round_num)
+
     async def initialize(self, commit_id: bytes,
                          epoch_pool: Iterable['Epoch'], data_pool: Iterable['Data'], vote_pool: Iterable['Vote']):
         for epoch in epoch_pool:
             self._epoch_pool.add_epoch(epoch)
 
+        # Messages are grouped by round in one pass, then received round by round.
+        datums_by_round: DefaultDict[Tuple[int, int], List['Data']] = defaultdict(list)
         for data in data_pool:
-            if data.id == commit_id:
-                self._data_pool.add_data(data)
-            else:
-                self._new_round(data.epoch_num, data.round_num, commit_id)
+            datums_by_round[data.epoch_num, data.round_num].append(data)
+        votes_by_round: DefaultDict[Tuple[int, int], List['Vote']] = defaultdict(list)
+        for vote in vote_pool:
+            votes_by_round[vote.epoch_num, vote.round_num].append(vote)
 
-        for round_ in self._round_pool.rounds:
-            datums = (data for data in data_pool
-                      if data.epoch_num == round_.epoch_num
-                      if data.round_num == round_.num)
+        for (epoch_num, round_num), datums in datums_by_round.items():
             for data in datums:
+                if data.id == commit_id:
+                    self._data_pool.add_data(data)
+            if any(data.id != commit_id for data in datums):
+                self._new_round(epoch_num, round_num, commit_id)
+
+        for round_ in tuple(self._round_pool.rounds):  # Rounds may be pruned while receiving
+            key = (round_.epoch_num, round_.num)
+            for data in datums_by_round.get(key, ()):
                 await self.receive_data(data)
-
-            votes = (vote for vote in vote_pool
-                     if vote.epoch_num == round_.epoch_num
-                     if vote.round_num == round_.num)
-            for vote in votes:
-                await self.receive_vote(vote)
+            # Votes of a round are verified and counted at once
+            await self.receive_votes(votes_by_round.get(key, ()))
+        self._update_watermark()
 
     async def round_start(self, new_epoch: 'Epoch', new_round_num: int):
         if self._get_candidate_round().is_newer_than(new_epoch.num, new_round_num):
@@ -86,54 +180,126 @@ class Consensus(EventRegister):
     async def receive_data(self, data: 'Data'):
         await self._receive_prev_votes(data)
 
-        try:
-            self._verify_acceptable_data(data)
-        except (InvalidEpoch, InvalidRound, InvalidProposer):
+        if self._check_acceptable_data(data) != AdmissionResult.ACCEPTED:
             return
         self._data_pool.add_data(data)
+        self._data_cache.add(data)
 
-        try:
-            self._verify_round_message(data)
-        except InvalidRound:
+        if self._check_round_message(data) != AdmissionResult.ACCEPTED:
             return
         await self._receive_data_and_change_candidate_if_available(data)
 
     async def receive_vote(self, vote: 'Vote'):
-        try:
-            self._verify_acceptable_vote(vote)
-        except (InvalidEpoch, InvalidRound, InvalidVoter):
+        if self._vote_cache.check(vote):
+            return
+
+        self._vote_batch.append(vote)
+        if len(self._vote_batch) >= self._vote_batch_size:
+            await self.flush_votes()
+        elif len(self._vote_batch) == 1:
+            self._start_vote_batch_timer()
+
+    async def flush_votes(self):
+        if self._vote_batch_timer:
+            self._vote_batch_timer.cancel()
+            self._vote_batch_timer = None
+        if not self._vote_batch:
             return
-        self._vote_pool.add_vote(vote)
 
+        # Receiving a vote may receive data and its prev votes again.
+        votes, self._vote_batch = self._vote_batch, []
+        if not self._vote_verifier:
+            self._vote_verifier = await self._vote_factory.create_vote_verifier()
+        if self._verify_pool:
+            self._submit_verify_votes(votes)
+        else:
+            await self.votes_verified(votes, await self._vote_verifier.verify_batch(votes))
+
+    async def receive_votes(self, votes: Iterable['Vote']):
+        # The votes are verified with the pending votes and received round by round.
+        self._vote_batch.extend(vote for vote in votes if not self._vote_cache.check(vote))
+        await self.flush_votes()
+
+    async def votes_verified(self, votes: Sequence['Vote'], results: Sequence[bool]):
+        await self._receive_verified_votes([vote for vote, verified in zip(votes, results) if verified])
+
+    async def data_verified(self, data: 'Data', verified: bool):
         try:
-            self._verify_round_message(vote)
-        except InvalidRound:
+            round_ = self._round_pool.get_round(data.epoch_num, data.round_num)
+        except KeyError:
             return
-        await self._receive_vote_and_change_candidate_if_available(vote)
+        await round_.data_verified(data, verified)
+
+    async def _receive_verified_votes(self, votes: Iterable['Vote']):
+        votes_by_round: Dict[Tuple[int, int], List['Vote']] = {}
+        for vote in votes:
+            if vote.id in self._vote_pool:
+                continue  # Duplicated in a batch
+            if self._check_acceptable_vote(vote) != AdmissionResult.ACCEPTED:
+                continue
+            self._vote_pool.add_vote(vote)
+            self._vote_cache.add(vote)
+            votes_by_round.setdefault((vote.epoch_num, vote.round_num), []).append(vote)
+
+        # Tallies, candidate change and round end are evaluated once per round, in order of arrival.
+        for round_votes in votes_by_round.values():
+            if self._check_round_message(round_votes[0]) != AdmissionResult.ACCEPTED:
+                continue
+            await self._receive_votes_and_change_candidate_if_available(round_votes)
+
+    async def vote_timeout(self, epoch_num: int, round_num: int):
+        try:
+            round_ = self._round_pool.get_round(epoch_num, round_num)
+        except KeyError:
+            return
+        await self._receive_verified_votes(round_.new_lazy_votes())  # Made by itself
 
     async def _receive_prev_votes(self, data: 'Data'):
-        for prev_vote in data.prev_votes:
-            if prev_vote:
-                await self.receive_vote(prev_vote)
+        # Data needs its prev votes at once, they are verified with the pending votes.
+        self._vote_batch.extend(prev_vote for prev_vote in self._get_prev_votes(data)
+                                if prev_vote and not self._vote_cache.check(prev_vote))
+        await self.flush_votes()
+
+    def _get_prev_votes(self, data: 'Data') -> Sequence[Optional['Vote']]:
+        certificate = data.prev_votes_certificate
+        if certificate is None:
+            return data.prev_votes
+        # Voters of the certificate are positions in the voters of the epoch of data
+        epoch = self._epoch_pool.find_epoch(data.epoch_num)
+        if epoch is None:
+            return ()
+        return certificate.expand(epoch.voters, self._vote_factory)
+
+    def _submit_verify_votes(self, votes: Sequence['Vote']):
+        mediator = self._event_system.get_mediator(ExecutorEventMediator)
+        mediator.execute_verify_batch(self._verify_pool, self._vote_verifier, votes,
+                                      lambda results: VotesVerifiedEvent(votes, results))
+
+    def _start_vote_batch_timer(self):
+        event = VoteBatchTimeoutEvent()
+        event.deterministic = False
+
+        mediator = self._event_system.get_mediator(DelayedEventMediator)
+        self._vote_batch_timer = mediator.execute(self._vote_batch_delay, event)
 
     async def _receive_data_and_change_candidate_if_available(self, data: 'Data'):
         round_ = self._new_or_get_round(data.epoch_num, data.round_num)
         if data.is_real():
             if data.is_genesis() or data.prev_id in self._data_pool:
-                async with self._try_change_candidate(round_, pruning_messages=True):
+                async with self._try_change_candidate(round_):
                     await round_.receive_data(data)
         else:
             await round_.receive_data(data)
 
-    async def _receive_vote_and_change_candidate_if_available(self, vote: 'Vote'):
-        round_ = self._new_or_get_round(vote.epoch_num, vote.round_num)
-        if not vote.is_none() and not vote.is_lazy():
-            async with self._try_change_candidate(round_, pruning_messages=True):
-                await round_.receive_vote(vote)
+    async def _receive_votes_and_change_candidate_if_available(self, votes: Sequence['Vote']):
+        round_ = self._new_or_get_round(votes[0].epoch_num, votes[0].round_num)
+        if any(not vote.is_none() and not vote.is_lazy() for vote in votes):
+            async with self._try_change_candidate(round_):
+                await round_.receive_votes(votes)
         else:
-            await round_.receive_vote(vote)
+            await round_.receive_votes(votes)
 
-    def _verify_acceptable_message(self, message: 'Message'):
+    def _check_acceptable_message(self, message: 'Message') -> AdmissionResult:
         # To avoid MMO attack, app must prevent to receive newer messages than current round's.
         # To get the messages at the round of messages the app has to gossip.
 
@@ -143,30 +309,44 @@ class Consensus(EventRegister):
             commit_id = candidate_round.candidate_id
             commit_data = self._data_pool.get_data(commit_id)
             if (message.epoch_num, message.round_num) <= (commit_data.epoch_num, commit_data.round_num):
-                raise InvalidRound(message.epoch_num, message.round_num, commit_data.epoch_num, commit_data.round_num)
+                return AdmissionResult.INVALID_ROUND
 
         if candidate_round.epoch_num + 1 < message.epoch_num:
-            raise InvalidEpoch(message.epoch_num, candidate_round.epoch_num)
+            return AdmissionResult.INVALID_EPOCH
 
         # This condition cannot cover that round 0 of new epoch is timeout round
         # if candidate_round.epoch_num + 1 == message.epoch_num:
         #     if message.round_num > 0:
-        #         raise InvalidEpoch(message.epoch_num, candidate_round.epoch_num)
-
-    def _verify_acceptable_data(self, data: 'Data'):
-        self._verify_acceptable_message(data)
-        epoch = self._get_epoch(data.epoch_num)
-        epoch.verify_proposer(data.proposer_id, data.round_num)
-
-    def _verify_acceptable_vote(self, vote: 'Vote'):
-        self._verify_acceptable_message(vote)
-        epoch = self._get_epoch(vote.epoch_num)
-        epoch.verify_voter(vote.voter_id)
-
-    def _verify_round_message(self, message: 'Message'):
+        #         return AdmissionResult.INVALID_EPOCH
+        return AdmissionResult.ACCEPTED
+
+    def _check_acceptable_data(self, data: 'Data') -> AdmissionResult:
+        result = self._check_acceptable_message(data)
+        if result != AdmissionResult.ACCEPTED:
+            return result
+        epoch = self._epoch_pool.find_epoch(data.epoch_num)
+        if epoch is None:
+            return AdmissionResult.INVALID_EPOCH
+        if not epoch.is_proposer(data.proposer_id, data.round_num):
+            return AdmissionResult.INVALID_PROPOSER
+        return AdmissionResult.ACCEPTED
+
+    def _check_acceptable_vote(self, vote: 'Vote') -> AdmissionResult:
+        result = self._check_acceptable_message(vote)
+        if result != AdmissionResult.ACCEPTED:
+            return result
+        epoch = self._epoch_pool.find_epoch(vote.epoch_num)
+        if epoch is None:
+            return AdmissionResult.INVALID_EPOCH
+        if not epoch.is_voter(vote.voter_id):
+            return AdmissionResult.INVALID_VOTER
+        return AdmissionResult.ACCEPTED
+
+    def _check_round_message(self, message: 'Message') -> AdmissionResult:
         candidate_round = self._get_candidate_round()
         if candidate_round.is_newer_than(message.epoch_num, message.round_num):
-            raise InvalidRound(message.epoch_num, message.round_num, candidate_round.epoch_num, candidate_round.num)
+            return AdmissionResult.INVALID_ROUND
+        return AdmissionResult.ACCEPTED
 
     def _get_epoch(self, epoch_num: int):
         try:
@@ -177,7 +357,8 @@ class Consensus(EventRegister):
     def _new_round(self, epoch_num: int, round_num: int, candidate_id: bytes):
         epoch = self._get_epoch(epoch_num)
         election = Election(self._node_id, epoch, round_num, self._event_system,
-                            self._data_factory, self._vote_factory, self._data_pool, self._vote_pool)
+                            self._data_factory, self._vote_factory, self._data_pool, self._vote_pool,
+                            self._verify_pool)
         new_round = Round(election, self._node_id, epoch, round_num,
                           self._event_system, self._data_factory, self._vote_factory)
         new_round.candidate_id = candidate_id
@@ -196,12 +377,26 @@ class Consensus(EventRegister):
         return self._round_pool.first_round()
 
     def _prune_round(self, latest_epoch_num: int, latest_round_num: int):
+        before = self._get_pool_sizes()
         self._epoch_pool.prune_epoch(latest_epoch_num - 1)  # Need prev epoch
         self._round_pool.prune_round(latest_epoch_num, latest_round_num)
+        self._prune_stats.prunes += 1
+        self._prune_stats.rounds_before = before
+        self._prune_stats.rounds_after = self._get_pool_sizes()
 
     def _prune_messages(self, latest_epoch_num: int, latest_round_num: int):
+        before = self._get_pool_sizes()
         self._data_pool.prune_data(latest_epoch_num, latest_round_num)
+        self._data_cache.prune(latest_epoch_num, latest_round_num)
         self._vote_pool.prune_vote(latest_epoch_num, latest_round_num)
+        self._vote_cache.prune(latest_epoch_num, latest_round_num)
+        self._prune_stats.prunes += 1
+        self._prune_stats.messages_before = before
+        self._prune_stats.messages_after = self._get_pool_sizes()
+
+    def _get_pool_sizes(self):
+        return PoolSizes(epochs=len(self._epoch_pool), rounds=len(self._round_pool),
+                         datums=len(self._data_pool), votes=len(self._vote_pool))
 
     def _prune_messages_before_commit(self):
         candidate_round = self._get_candidate_round()
@@ -212,28 +407,64 @@ class Consensus(EventRegister):
             # Already pruned
             pass
         else:
-            self._prune_messages(commit_data.epoch_num, commit_data.round_num)
+            if self._deferred_pruning:
+                self._prune_stats.deferred += 1
+                self._event_system.simulator.raise_event(
+                    PruneMessagesEvent(commit_data.epoch_num, commit_data.round_num))
+            else:
+                self._prune_messages(commit_data.epoch_num, commit_data.round_num)
 
     @asynccontextmanager
-    async def _try_change_candidate(self, target_round: Round, pruning_messages=False):
+    async def _try_change_candidate(self, target_round: Round):
         is_candidate_changed = self._is_candidate_changed(target_round)
         try:
             yield
         finally:
             if is_candidate_changed():
-                self._prune_round(target_round.epoch_num, target_round.num)
-                await self._propagate_candidate_changed(target_round)
-                await self._try_change_candidate_connected_datums(target_round.result_id)
+                self._changed_rounds.append(target_round)
+                if not self._advancing_candidate:
+                    await self._advance_candidate()
+
+    async def _advance_candidate(self) -> int:
+        # Changed rounds and their connected datums are processed in a loop, not recursively.
+        # Changes found while receiving connected datums are queued for the same loop.
+        self._advancing_candidate = True
+        advanced = 0
+        pending_datums: List[Iterator['Data']] = []
+        try:
+            while self._changed_rounds or pending_datums:
+                if self._changed_rounds:
+                    target_round = self._changed_rounds.popleft()
+                    self._prune_round(target_round.epoch_num, target_round.num)
+                    await self._propagate_candidate_changed(target_round)
+                    pending_datums.append(iter(self._data_pool.get_datums_connected(target_round.result_id)))
+                    advanced += 1
+                    continue
+
+                data = next(pending_datums[-1], None)
+                if data is None:
+                    pending_datums.pop()
+                    continue
+                await self.receive_data(data)
+        finally:
+            self._advancing_candidate = False
+            self._changed_rounds.clear()
 
-                if pruning_messages:
-                    self._prune_messages_before_commit()
+        self._prune_messages_before_commit()
+        self._update_watermark()
+        self._logger.debug(f"Candidate advanced {advanced} rounds")
+        return advanced
 
-    async def _try_change_candidate_connected_datums(self, prev_id: bytes):
-        datums = self._data_pool.get_datums_connected(prev_id)
-        for data in datums:
-            round_ = self._new_or_get_round(data.epoch_num, data.round_num)
-            async with self._try_change_candidate(round_):
-                await self.receive_data(data)
+    def _update_watermark(self):
+        # Same bound as _check_acceptable_message
+        candidate_round = self._get_candidate_round()
+        if candidate_round.epoch_num == 0 and candidate_round.num == 0:
+            return
+        try:
+            commit_data = self._data_pool.get_data(candidate_round.candidate_id)
+        except KeyError:
+            return
+        self._admission.watermark = (commit_data.epoch_num, commit_data.round_num)
 
     async def _propagate_candidate_changed(self, target_round: Round):
         candidate = self._data_pool.get_data(target_round.result_id)
@@ -251,9 +482,48 @@ class Consensus(EventRegister):
             return True
         return _checker
 
+    _filter_prototypes = {
+        ReceiveDataEvent: _admit_receive_data,
+        ReceiveVoteEvent: _admit_receive_vote,
+    }
+
     _handler_prototypes = {
         InitializeEvent: _on_event_initialize,
         RoundStartEvent: _on_event_round_start,
         ReceiveDataEvent: _on_event_receive_data,
         ReceiveVoteEvent: _on_event_receive_vote,
+        ReceiveVotesEvent: _on_event_receive_votes,
+        VoteTimeoutEvent: _on_event_vote_timeout,
+        VoteBatchTimeoutEvent: _on_event_vote_batch_timeout,
+        VotesVerifiedEvent: _on_event_votes_verified,
+        DataVerifiedEvent: _on_event_data_verified,
+        PruneMessagesEvent: _on_event_prune_messages,
     }
+
+
+class _SnapshotPickler(pickle.Pickler):
+    # Collaborators of rounds are not a part of the state. They are rebound on restore.
+    def __init__(self, file, externals: Dict[str, Any]):
+        super().__init__(file)
+        self._externals = externals
+
+    def persistent_id(self, obj: Any):
+        for name, external in self._externals.items():
+            if obj is external and external is not None:
+                return name
+        if isinstance(obj, (DataVerifier, VoteVerifier)):
+            return "verifier"  # Created again by the factory
+        if isinstance(obj, DelayedHandler):
+            return "timer"  # Timers are replayed from the record
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, externals: Dict[str, Any]):
+        super().__init__(file)
+        self._externals = externals
+
+    def persistent_load(self, pid: str):
+        if pid in ("verifier", "timer"):
+            return None
+        return self._externals[pid]
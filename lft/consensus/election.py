@@ -1,12 +1,14 @@
 import logging
-from typing import DefaultDict, OrderedDict, Set, Optional, Dict
+from concurrent.futures import Executor
+from typing import DefaultDict, OrderedDict, Optional, Sequence
 from lft.consensus.messages.data import Data, DataFactory, DataPool, DataVerifier
 from lft.consensus.messages.vote import Vote, VoteFactory, VotePool
 from lft.consensus.events import (RoundEndEvent, BroadcastDataEvent, BroadcastVoteEvent,
-                                  ReceiveDataEvent, ReceiveVoteEvent)
-from lft.consensus.epoch import Epoch
+                                  ReceiveDataEvent, ReceiveVoteEvent, DataVerifiedEvent)
+from lft.consensus.epoch import Epoch, VoterIndexer, VoterBitset
 from lft.consensus.exceptions import InvalidProposer
 from lft.event import EventSystem
+from lft.event.mediators import ExecutorEventMediator
 
 __all__ = ("Election", "ElectionMessages")
 
@@ -20,7 +22,8 @@ class Election:
                  data_factory: DataFactory,
                  vote_factory: VoteFactory,
                  data_pool: DataPool,
-                 vote_pool: VotePool):
+                 vote_pool: VotePool,
+                 verify_pool: Optional[Executor] = None):
         self._node_id: bytes = node_id
         self._epoch = epoch
         self._round_num = round_num
@@ -34,6 +37,7 @@ class Election:
         self._logger = logging.getLogger(node_id.hex())
 
         self._data_verifier: DataVerifier = None
+        self._verify_pool = verify_pool
 
         self._candidate_id: bytes = None
         self._messages: ElectionMessages = ElectionMessages(epoch, round_num, data_factory)
@@ -52,6 +56,10 @@ class Election:
         else:
             return None
 
+    @property
+    def is_ended(self):
+        return self._is_ended
+
     async def round_start(self):
         self._is_started = True
         self._data_verifier = await self._data_factory.create_data_verifier()
@@ -69,12 +77,23 @@ class Election:
         await self._vote_if_available(data)
 
     async def receive_vote(self, vote: Vote):
-        if vote.is_real() and vote.voter_id == self._node_id:
-            self._is_voted = True
+        await self.receive_votes([vote])
 
-        self._messages.add_vote(vote)
+    async def receive_votes(self, votes: Sequence[Vote]):
+        for vote in votes:
+            if vote.is_real() and vote.voter_id == self._node_id:
+                self._is_voted = True
+            self._messages.add_vote(vote)
         await self._update_result()
 
+    async def data_verified(self, data: Data, verified: bool):
+        if self._is_ended:
+            return
+        # The candidate may be changed while the data was verified in the pool. The late result is dropped.
+        if not self._is_connected_data(data):
+            return
+        await self._broadcast_vote(data, verified)
+
     async def _raise_broadcast_data(self, data):
         self._event_system.simulator.raise_event(
             BroadcastDataEvent(
@@ -184,7 +203,18 @@ class Election:
         self._is_voted = True
 
     async def _verify_and_broadcast_vote(self, data):
-        if await self._verify_data(data):
+        if data.proposer_id == self._node_id:
+            await self._broadcast_vote(data, True)
+        elif not self._is_connected_data(data) or data.is_lazy():
+            await self._broadcast_vote(data, False)
+        elif self._verify_pool:
+            # The vote is broadcast when DataVerifiedEvent comes back.
+            await self._submit_verify_data(data)
+        else:
+            await self._broadcast_vote(data, await self._verify_data(data))
+
+    async def _broadcast_vote(self, data: Data, verified: bool):
+        if verified:
             vote = await self._vote_factory.create_vote(data_id=data.id,
                                                         commit_id=self._candidate_id,
                                                         epoch_num=self._epoch.num,
@@ -194,16 +224,15 @@ class Election:
                                                        round_num=self._round_num)
         await self._raise_broadcast_vote(vote)
 
-    async def _verify_data(self, data):
-        if data.proposer_id == self._node_id:
-            return True
+    def _is_connected_data(self, data):
         if self._candidate_id != data.prev_id:
             return False
         candidate_data = self._data_pool.get_data(self._candidate_id)
-        if candidate_data.number + 1 != data.number:
-            return False
-        if data.is_lazy():
-            return False
+        return candidate_data.number + 1 == data.number
+
+    async def _verify_data(self, data):
+        if not self._data_verifier:
+            self._data_verifier = await self._data_factory.create_data_verifier()
         try:
             await self._data_verifier.verify(data)
         except Exception as e:
@@ -211,9 +240,17 @@ class Election:
         else:
             return True
 
+    async def _submit_verify_data(self, data):
+        if not self._data_verifier:
+            self._data_verifier = await self._data_factory.create_data_verifier()
+
+        mediator = self._event_system.get_mediator(ExecutorEventMediator)
+        mediator.execute_verify_batch(self._verify_pool, self._data_verifier, (data, ),
+                                      lambda results: DataVerifiedEvent(data, results[0]))
+
 
 Datums = OrderedDict[bytes, Data]  # dict[data_id] = data
-Votes = DefaultDict[bytes, Dict[bytes, Vote]]  # dict[data_id][voter_id] = vote
+Voters = DefaultDict[bytes, VoterBitset]  # dict[data_id] = voters
 
 
 class ElectionMessages:
@@ -223,9 +260,10 @@ class ElectionMessages:
         self._data_factory = data_factory
 
         self._datums: Datums = OrderedDict()
-        self._votes: Votes = DefaultDict(dict)
-
-        self._voters: Set[bytes] = set()
+        self._voter_indexer = VoterIndexer(epoch)
+        self._voters_by_data_id: Voters = DefaultDict(VoterBitset)
+        self._voters = VoterBitset()
+        self._quorum_data_ids: OrderedDict[bytes, None] = OrderedDict()  # In order of reaching the quorum
         self._result: Optional[Data] = None
 
     @property
@@ -238,10 +276,20 @@ class ElectionMessages:
 
     def add_data(self, data: Data):
         self._datums[data.id] = data
-
-    def add_vote(self, vote: Vote):
-        self._voters.add(vote.voter_id)
-        self._votes[vote.data_id][vote.voter_id] = vote
+        voters = self._voters_by_data_id.get(data.id)
+        if (voters.count if voters else 0) >= self._epoch.quorum_num:
+            # Votes are not necessary if there are no voters
+            self._quorum_data_ids[data.id] = None
+
+    def add_vote(self, vote: Vote) -> bool:
+        # Returns True only for the vote which makes its data reach the quorum
+        voter_index = self._voter_indexer.get_index(vote.voter_id)
+        self._voters.add(voter_index)
+        voters = self._voters_by_data_id[vote.data_id]
+        if voters.add(voter_index) and voters.count == self._epoch.quorum_num:
+            self._quorum_data_ids[vote.data_id] = None
+            return True
+        return False
 
     def update(self):
         # RealData : Determine round success and round end
@@ -258,8 +306,7 @@ class ElectionMessages:
         self._result = None
 
     def _update_quorum_data(self):
-        quorum_datums = [data for data in self._datums.values()
-                         if len(self._votes[data.id]) >= self._epoch.quorum_num]
+        quorum_datums = [self._datums[data_id] for data_id in self._quorum_data_ids if data_id in self._datums]
         quorum_datums.sort(key=lambda data: not data.is_determinative())
         assert ((len(quorum_datums) <= 1) or
                 (len(quorum_datums) == 2 and quorum_datums[0].is_determinative() and quorum_datums[1].is_lazy()))
@@ -270,8 +317,8 @@ class ElectionMessages:
         return False
 
     def _update_lazy_data(self):
-        assert len(self._voters) <= len(self._epoch.voters)
-        if len(self._voters) == len(self._epoch.voters):
+        assert self._voters.count <= len(self._epoch.voters)
+        if self._voters.count == len(self._epoch.voters):
             self._result = self._find_lazy_data()
             return True
         return False
@@ -11,13 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
 from abc import abstractmethod
-from typing import Sequence, Dict
+from typing import Sequence, Dict, List, Optional
 
 from lft.consensus.messages.data import Data, Vote
 from lft.serialization import Serializable
 
-__all__ = ("Epoch", "EpochPool")
+__all__ = ("Epoch", "EpochPool", "VoterIndexer", "VoterBitset")
 
 
 class Epoch(Serializable):
@@ -57,6 +58,16 @@ class Epoch(Serializable):
     def verify_voter(self, voter: bytes, vote_index: int = -1):
         raise NotImplementedError
 
+    def is_proposer(self, proposer_id: bytes, round_num: int) -> bool:
+        return proposer_id == self.get_proposer_id(round_num)
+
+    def is_voter(self, voter: bytes) -> bool:
+        try:
+            self.get_voter_index(voter)
+        except KeyError:
+            return False
+        return True
+
     @abstractmethod
     def get_proposer_id(self, round_num: int) -> bytes:
         raise NotImplementedError
@@ -69,6 +80,13 @@ class Epoch(Serializable):
     def get_voters_id(self) -> Sequence[bytes]:
         raise NotImplementedError
 
+    def get_voter_index(self, voter: bytes) -> int:
+        # Raises KeyError if the voter is not a voter of the epoch
+        try:
+            return self.voters.index(voter)
+        except ValueError:
+            raise KeyError(voter)
+
     @abstractmethod
     def __eq__(self, other):
         raise NotImplementedError
@@ -77,13 +95,67 @@ class Epoch(Serializable):
 class EpochPool:
     def __init__(self):
         self._epochs: Dict[int, Epoch] = {}
+        self._epoch_nums: List[int] = []  # In order, for pruning
+
+    def __len__(self):
+        return len(self._epochs)
 
     def add_epoch(self, epoch: Epoch):
+        if epoch.num not in self._epochs:
+            bisect.insort(self._epoch_nums, epoch.num)
         self._epochs[epoch.num] = epoch
 
     def get_epoch(self, epoch_num: int):
         return self._epochs[epoch_num]
 
+    def find_epoch(self, epoch_num: int) -> Optional[Epoch]:
+        return self._epochs.get(epoch_num)
+
     def prune_epoch(self, latest_epoch_num: int):
-        self._epochs = {epoch_num: epoch for epoch_num, epoch in self._epochs.items()
-                       if epoch.num >= latest_epoch_num}
+        i = bisect.bisect_left(self._epoch_nums, latest_epoch_num)
+        for epoch_num in self._epoch_nums[:i]:
+            del self._epochs[epoch_num]
+        del self._epoch_nums[:i]
+
+
+class VoterIndexer:
+    # Bit positions of voters. Voters out of the epoch take positions after the voters of the epoch.
+    def __init__(self, epoch: Optional[Epoch] = None):
+        self._epoch = epoch
+        self._others: Dict[bytes, int] = {}
+        self._others_base = epoch.voters_num if epoch else 0
+
+    def get_index(self, voter: bytes) -> int:
+        if self._epoch:
+            try:
+                return self._epoch.get_voter_index(voter)
+            except KeyError:
+                pass
+        try:
+            return self._others[voter]
+        except KeyError:
+            index = self._others[voter] = self._others_base + len(self._others)
+            return index
+
+
+class VoterBitset:
+    # Voters as an integer bitset of their positions, the count is kept on adding.
+    __slots__ = ("bits", "count")
+
+    def __init__(self):
+        self.bits = 0
+        self.count = 0
+
+    def __contains__(self, index: int):
+        return bool(self.bits >> index & 1)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, index: int) -> bool:
+        bit = 1 << index
+        if self.bits & bit:
+            return False
+        self.bits |= bit
+        self.count += 1
+        return True
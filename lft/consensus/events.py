@@ -5,8 +5,9 @@ from lft.consensus.epoch import Epoch
 from lft.event import Event
 from lft.consensus.messages.data import Data, Vote
 
-__all__ = ("InitializeEvent", "ReceiveDataEvent", "ReceiveVoteEvent",
-           "BroadcastDataEvent", "BroadcastVoteEvent", "RoundStartEvent", "RoundEndEvent")
+__all__ = ("InitializeEvent", "ReceiveDataEvent", "ReceiveVoteEvent", "ReceiveVotesEvent",
+           "BroadcastDataEvent", "BroadcastVoteEvent", "RoundStartEvent", "RoundEndEvent", "VoteTimeoutEvent",
+           "VoteBatchTimeoutEvent", "DataVerifiedEvent", "VotesVerifiedEvent", "PruneMessagesEvent")
 
 
 @dataclass
@@ -27,6 +28,11 @@ class ReceiveVoteEvent(Event):
     vote: 'Vote'
 
 
+@dataclass
+class ReceiveVotesEvent(Event):
+    votes: Sequence['Vote']
+
+
 @dataclass
 class BroadcastDataEvent(Event):
     data: 'Data'
@@ -50,3 +56,32 @@ class RoundEndEvent(Event):
     round_num: int
     candidate_id: Optional[bytes]
     commit_id: Optional[bytes]
+
+
+@dataclass
+class VoteTimeoutEvent(Event):
+    epoch_num: int
+    round_num: int
+
+
+@dataclass
+class VoteBatchTimeoutEvent(Event):
+    pass
+
+
+@dataclass
+class DataVerifiedEvent(Event):
+    data: 'Data'
+    verified: bool
+
+
+@dataclass
+class VotesVerifiedEvent(Event):
+    votes: Sequence['Vote']
+    verified: Sequence[bool]
+
+
+@dataclass
+class PruneMessagesEvent(Event):
+    epoch_num: int
+    round_num: int
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Sequence, Iterable
+from typing import Dict, Sequence, Iterable, Optional
 
-from lft.consensus.messages.message import Message, MessagePool
-from lft.consensus.messages.vote import Vote
+from lft.consensus.messages.message import Message, MessagePool, verify_each
+from lft.consensus.messages.vote import Vote, VoteCertificate
 
 __all__ = ("Data", "DataFactory", "DataPool", "DataVerifier")
 
@@ -28,6 +28,11 @@ class Data(Message):
     def prev_votes(self) -> Sequence['Vote']:
         raise NotImplementedError
 
+    @property
+    def prev_votes_certificate(self) -> Optional['VoteCertificate']:
+        # If it is given, prev votes are expanded from it by consensus instead of prev_votes.
+        return None
+
     @abstractmethod
     def is_none(self) -> bool:
         raise NotImplementedError
@@ -52,7 +57,8 @@ class Data(Message):
                and self.proposer_id == other.proposer_id \
                and self.epoch_num == other.epoch_num \
                and self.round_num == other.round_num \
-               and self.prev_votes == other.prev_votes
+               and self.prev_votes == other.prev_votes \
+               and self.prev_votes_certificate == other.prev_votes_certificate
 
     def __hash__(self):
         return int.from_bytes(self.id, "big")
@@ -63,6 +69,9 @@ class DataVerifier(ABC):
     async def verify(self, data: 'Data'):
         raise NotImplementedError
 
+    async def verify_batch(self, datums: Sequence['Data']) -> Sequence[bool]:
+        return await verify_each(self, datums)
+
 
 class DataFactory(ABC):
     @abstractmethod
@@ -94,6 +103,10 @@ class DataFactory(ABC):
 
 
 class DataPool(MessagePool):
+    def __init__(self):
+        super().__init__()
+        self._datums_connected: Dict[bytes, Dict[bytes, Data]] = {}  # prev_id -> {data_id: data}
+
     def add_data(self, data: Data):
         if data.is_real():
             self.add_message(data)
@@ -101,7 +114,7 @@ class DataPool(MessagePool):
             # To avoid id collision dummy_id is generated.
             # Unreal data must be added for node recovery and removed by only pruning
             dummy_id = self._int_to_bytes(data.epoch_num) + data.id + self._int_to_bytes(data.round_num)
-            self._messages[dummy_id] = data
+            self._add_message(dummy_id, data)
 
     def get_data(self, data_id: bytes) -> Data:
         # Only real data can be gotten.
@@ -111,12 +124,22 @@ class DataPool(MessagePool):
         return self.get_messages(epoch_num, round_num)
 
     def get_datums_connected(self, prev_id: bytes) -> Iterable[Data]:
-        for data in self._messages.values():
-            if data.prev_id == prev_id:
-                yield data
+        datums = self._datums_connected.get(prev_id)
+        return tuple(datums.values()) if datums else ()
 
     def prune_data(self, latest_epoch_num: int, latest_round_num: int):
         super().prune_message(latest_epoch_num, latest_round_num)
 
+    def _add_message(self, message_id: bytes, data: Data):
+        super()._add_message(message_id, data)
+        self._datums_connected.setdefault(data.prev_id, {})[message_id] = data
+
+    def _remove_message(self, message_id: bytes, data: Data):
+        super()._remove_message(message_id, data)
+        datums = self._datums_connected[data.prev_id]
+        del datums[message_id]
+        if not datums:
+            del self._datums_connected[data.prev_id]
+
     def _int_to_bytes(self, x: int) -> bytes:
         return x.to_bytes((x.bit_length() + 7) // 8, 'big')
@@ -13,12 +13,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
 from abc import abstractmethod
-from typing import Dict, Iterable
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
 
 from lft.serialization import Serializable
 
-__all__ = ("Message", "MessagePool")
+__all__ = ("Message", "MessagePool", "MessageCache", "MessageCacheStats", "verify_each")
 
 
 class Message(Serializable):
@@ -39,27 +41,127 @@ class Message(Serializable):
 
 
 class MessagePool:
+    # Messages are also bucketed by (epoch_num, round_num) in order, for range queries and pruning.
     def __init__(self):
         self._messages: Dict[bytes, Message] = {}
+        self._buckets: Dict[Tuple[int, int], Dict[bytes, Message]] = {}
+        self._bucket_keys: List[Tuple[int, int]] = []
 
     def __contains__(self, id_: bytes):
         assert isinstance(id_, bytes)
         return id_ in self._messages
 
+    def __len__(self):
+        return len(self._messages)
+
     def add_message(self, message: Message):
-        self._messages[message.id] = message
+        self._add_message(message.id, message)
 
     def get_message(self, message_id: bytes) -> Message:
         return self._messages[message_id]
 
     def get_messages(self, epoch_num: int, round_num: int) -> Iterable[Message]:
-        for message in self._messages.values():
-            if message.epoch_num == epoch_num and message.round_num == round_num:
-                yield message
+        bucket = self._buckets.get((epoch_num, round_num))
+        return tuple(bucket.values()) if bucket else ()
 
     def prune_message(self, latest_epoch_num: int, latest_round_num: int):
-        self._messages = {
-            mid: message for mid, message in self._messages.items()
-            if ((message.epoch_num > latest_epoch_num) or
-                (message.epoch_num == latest_epoch_num and message.round_num >= latest_round_num))
-        }
+        i = bisect.bisect_left(self._bucket_keys, (latest_epoch_num, latest_round_num))
+        for key in self._bucket_keys[:i]:
+            for message_id, message in self._buckets.pop(key).items():
+                self._remove_message(message_id, message)
+        del self._bucket_keys[:i]
+
+    def _add_message(self, message_id: bytes, message: Message):
+        old_message = self._messages.get(message_id)
+        if old_message is not None:
+            self._discard_from_bucket(message_id, old_message)
+            self._remove_message(message_id, old_message)
+        self._messages[message_id] = message
+
+        key = (message.epoch_num, message.round_num)
+        try:
+            bucket = self._buckets[key]
+        except KeyError:
+            bucket = self._buckets[key] = {}
+            bisect.insort(self._bucket_keys, key)
+        bucket[message_id] = message
+
+    def _remove_message(self, message_id: bytes, message: Message):
+        del self._messages[message_id]
+
+    def _discard_from_bucket(self, message_id: bytes, message: Message):
+        key = (message.epoch_num, message.round_num)
+        bucket = self._buckets[key]
+        del bucket[message_id]
+        if not bucket:
+            del self._buckets[key]
+            del self._bucket_keys[bisect.bisect_left(self._bucket_keys, key)]
+
+
+@dataclass
+class MessageCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class MessageCache:
+    # Ids of accepted messages by generation, i.e. (epoch_num, round_num).
+    # It is pruned with the message pool and drops the oldest generation if it grows over max_size.
+    def __init__(self, max_size: int = 65536):
+        self.stats = MessageCacheStats()
+
+        self._max_size = max_size
+        self._size = 0
+        self._generations: Dict[Tuple[int, int], Set[bytes]] = {}
+        self._generation_keys: List[Tuple[int, int]] = []
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, message_id: bytes):
+        return any(message_id in message_ids for message_ids in self._generations.values())
+
+    def has(self, message: Message) -> bool:
+        message_ids = self._generations.get((message.epoch_num, message.round_num))
+        return message_ids is not None and message.id in message_ids
+
+    def check(self, message: Message) -> bool:
+        if self.has(message):
+            self.stats.hits += 1
+            return True
+        self.stats.misses += 1
+        return False
+
+    def add(self, message: Message):
+        key = (message.epoch_num, message.round_num)
+        try:
+            message_ids = self._generations[key]
+        except KeyError:
+            message_ids = self._generations[key] = set()
+            bisect.insort(self._generation_keys, key)
+
+        if message.id not in message_ids:
+            message_ids.add(message.id)
+            self._size += 1
+        while self._size > self._max_size and len(self._generation_keys) > 1:
+            self._size -= len(self._generations.pop(self._generation_keys.pop(0)))
+
+    def prune(self, latest_epoch_num: int, latest_round_num: int):
+        i = bisect.bisect_left(self._generation_keys, (latest_epoch_num, latest_round_num))
+        for key in self._generation_keys[:i]:
+            self._size -= len(self._generations.pop(key))
+        del self._generation_keys[:i]
+
+
+async def verify_each(verifier: Any, messages: Sequence[Message]) -> List[bool]:
+    # Default of verify_batch of verifiers. Override it if the backend amortizes checking many signatures at once.
+    results = []
+    for message in messages:
+        try:
+            await verifier.verify(message)
+        except Exception:
+            results.append(False)
+        else:
+            results.append(True)
+    return results
+
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, Optional, Sequence, Tuple
 
-from lft.consensus.messages.message import Message, MessagePool
+from lft.consensus.messages.message import Message, MessagePool, verify_each
+from lft.serialization import Serializable
 
-__all__ = ("Vote", "VoteFactory", "VotePool", "VoteVerifier")
+__all__ = ("Vote", "VoteCertificate", "VoteFactory", "VotePool", "VoteVerifier")
 
 
 class Vote(Message):
@@ -50,6 +51,9 @@ class VoteVerifier(ABC):
     async def verify(self, vote: 'Vote'):
         raise NotImplementedError
 
+    async def verify_batch(self, votes: Sequence['Vote']) -> Sequence[bool]:
+        return await verify_each(self, votes)
+
 
 class VoteFactory(ABC):
     async def create_vote(self, data_id: bytes, commit_id: bytes, epoch_num: int, round_num: int) -> 'Vote':
@@ -61,10 +65,74 @@ class VoteFactory(ABC):
     def create_lazy_vote(self, voter_id: bytes, epoch_num: int, round_num: int) -> 'Vote':
         raise NotImplementedError
 
+    def restore_vote(self, vote_id: bytes, data_id: bytes, commit_id: bytes, voter_id: bytes,
+                     epoch_num: int, round_num: int) -> 'Vote':
+        # Needed to expand a VoteCertificate.
+        raise NotImplementedError
+
     async def create_vote_verifier(self) -> 'VoteVerifier':
         raise NotImplementedError
 
 
+class VoteCertificate(Serializable):
+    # Compact form of votes for one data, e.g. prev votes of data.
+    # Votes share data_id, commit_id, epoch_num and round_num, voters are bits of their positions in the epoch.
+    def __init__(self, data_id: bytes, commit_id: bytes, epoch_num: int, round_num: int,
+                 voters: int, vote_ids: Sequence[bytes]):
+        self.data_id = data_id
+        self.commit_id = commit_id
+        self.epoch_num = epoch_num
+        self.round_num = round_num
+        self.voters = voters
+        self.vote_ids = tuple(vote_ids)
+
+    def __len__(self):
+        return len(self.vote_ids)
+
+    def __eq__(self, other):
+        return isinstance(other, VoteCertificate) and self._serialize() == other._serialize()
+
+    @classmethod
+    def from_votes(cls, votes: Sequence[Optional[Vote]]) -> Optional['VoteCertificate']:
+        # None if the votes do not share the fields or there is no vote.
+        present_votes = [vote for vote in votes if vote]
+        if not present_votes:
+            return None
+        first = present_votes[0]
+        shared = (first.data_id, first.commit_id, first.epoch_num, first.round_num)
+        if any((vote.data_id, vote.commit_id, vote.epoch_num, vote.round_num) != shared
+               or vote.is_none() or vote.is_lazy() for vote in present_votes):
+            return None
+
+        voters = 0
+        for index, vote in enumerate(votes):
+            if vote:
+                voters |= 1 << index
+        return cls(*shared, voters=voters, vote_ids=[vote.id for vote in present_votes])
+
+    def voter_indices(self) -> Tuple[int, ...]:
+        return tuple(index for index in range(self.voters.bit_length()) if self.voters >> index & 1)
+
+    def expand(self, voters: Sequence[bytes], vote_factory: VoteFactory) -> Tuple[Optional[Vote], ...]:
+        # Votes by position of voters, None for voters who did not vote.
+        votes = [None] * len(voters)
+        for index, vote_id in zip(self.voter_indices(), self.vote_ids):
+            if index < len(votes):
+                votes[index] = vote_factory.restore_vote(vote_id, self.data_id, self.commit_id, voters[index],
+                                                         self.epoch_num, self.round_num)
+        return tuple(votes)
+
+    def _serialize(self) -> dict:
+        return {
+            "data_id": self.data_id,
+            "commit_id": self.commit_id,
+            "epoch_num": self.epoch_num,
+            "round_num": self.round_num,
+            "voters": self.voters,
+            "vote_ids": self.vote_ids
+        }
+
+
 class VotePool(MessagePool):
     def add_vote(self, vote: Vote):
         self.add_message(vote)
@@ -77,3 +145,4 @@ class VotePool(MessagePool):
 
     def prune_vote(self, latest_epoch_num: int, latest_round_num: int):
         super().prune_message(latest_epoch_num, latest_round_num)
+
@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+
+__all__ = ("PoolSizes", "PruneStats")
+
+
+@dataclass
+class PoolSizes:
+    epochs: int = 0
+    rounds: int = 0
+    datums: int = 0
+    votes: int = 0
+
+
+@dataclass
+class PruneStats:
+    # Gauges of the pools before and after the last pruning of each kind.
+    prunes: int = 0
+    deferred: int = 0
+    rounds_before: PoolSizes = field(default_factory=PoolSizes)
+    rounds_after: PoolSizes = field(default_factory=PoolSizes)
+    messages_before: PoolSizes = field(default_factory=PoolSizes)
+    messages_after: PoolSizes = field(default_factory=PoolSizes)
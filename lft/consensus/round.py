@@ -1,14 +1,14 @@
 import logging
-from bisect import insort
-from typing import List, OrderedDict, DefaultDict, Set, Union, Sequence
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, OrderedDict, DefaultDict, Tuple, Union, Sequence
 from lft.consensus.messages.data import Data, DataFactory
 from lft.consensus.messages.vote import Vote, VoteFactory
-from lft.consensus.events import ReceiveDataEvent, ReceiveVoteEvent
-from lft.consensus.epoch import Epoch
+from lft.consensus.events import ReceiveDataEvent, VoteTimeoutEvent
+from lft.consensus.epoch import Epoch, VoterIndexer, VoterBitset
 from lft.consensus.election import Election
-from lft.consensus.exceptions import InvalidRound, InvalidEpoch, AlreadyProposed, AlreadyVoted
-from lft.event import EventSystem
-from lft.event.mediators import DelayedEventMediator
+from lft.consensus.admission import AdmissionResult
+from lft.event import Event, EventSystem
+from lft.event.mediators import DelayedEventMediator, DelayedHandler
 
 
 __all__ = ("Round", "RoundMessages", "RoundPool", "TIMEOUT_PROPOSE", "TIMEOUT_VOTE")
@@ -37,9 +37,10 @@ class Round:
         self._vote_factory = vote_factory
 
         self._logger = logging.getLogger(node_id.hex())
-        self._messages = RoundMessages()
+        self._messages = RoundMessages(epoch)
 
         self._vote_timeout_started = False
+        self._timers: List[DelayedHandler] = []
 
     @property
     def num(self):
@@ -64,59 +65,93 @@ class Round:
     async def round_start(self):
         await self._new_unreal_datums()
         await self._election.round_start()
+        self._cancel_timers_if_ended()
 
-    async def receive_data(self, data: Data):
-        try:
-            await self._receive_data(data)
-        except (InvalidEpoch, InvalidRound, AlreadyProposed):
-            pass
+    def new_lazy_votes(self) -> Sequence[Vote]:
+        return tuple(self._vote_factory.create_lazy_vote(voter, self._epoch.num, self._num)
+                     for voter in self._epoch.get_voters_id())
 
-    async def receive_vote(self, vote: Vote):
-        try:
-            await self._receive_vote(vote)
-        except (InvalidEpoch, InvalidRound, AlreadyVoted):
-            pass
+    def cancel_timers(self):
+        for timer in self._timers:
+            if timer:  # None if restored from a checkpoint
+                timer.cancel()
+        self._timers.clear()
 
-    async def _receive_data(self, data: Data):
-        self._verify_acceptable_data(data)
+    async def receive_data(self, data: Data) -> AdmissionResult:
+        return await self._receive_data(data)
 
-        self._messages.add_data(data)
-        await self._election.receive_data(data)
-        await self._receive_votes_if_exist(data)
+    async def receive_vote(self, vote: Vote) -> AdmissionResult:
+        return await self._receive_vote(vote)
 
-    async def _receive_vote(self, vote: Vote):
-        self._verify_acceptable_vote(vote)
+    async def receive_votes(self, votes: Sequence[Vote]) -> List[AdmissionResult]:
+        return await self._receive_votes(votes)
 
-        self._messages.add_vote(vote)
-        await self._receive_vote_if_data_exist(vote)
-        await self._raise_lazy_votes_if_available()
+    async def data_verified(self, data: Data, verified: bool):
+        await self._election.data_verified(data, verified)
 
-    async def _raise_receive_data(self, delay: float, data: Data):
-        event = ReceiveDataEvent(data)
-        event.deterministic = False
+    async def _receive_data(self, data: Data) -> AdmissionResult:
+        result = self._check_acceptable_data(data)
+        if result != AdmissionResult.ACCEPTED:
+            return result
 
-        mediator = self._event_system.get_mediator(DelayedEventMediator)
-        mediator.execute(delay, event)
-
-    async def _raise_receive_vote(self, delay: float, vote: Vote):
-        event = ReceiveVoteEvent(vote)
-        event.deterministic = False
+        self._messages.add_data(data)
+        await self._election.receive_data(data)
+        await self._receive_votes_if_exist(data)
+        self._cancel_timers_if_ended()
+        return result
+
+    async def _receive_vote(self, vote: Vote) -> AdmissionResult:
+        return (await self._receive_votes([vote]))[0]
+
+    async def _receive_votes(self, votes: Sequence[Vote]) -> List[AdmissionResult]:
+        # Votes of data are given to the election at once, the result is updated once.
+        results = []
+        votes_with_data = []
+        for vote in votes:
+            result = self._check_acceptable_vote(vote)
+            results.append(result)
+            if result != AdmissionResult.ACCEPTED:
+                continue
+            self._messages.add_vote(vote)
+            if self._messages.get_data(vote.data_id):
+                votes_with_data.append(vote)
+
+        if AdmissionResult.ACCEPTED not in results:
+            return results
+        if votes_with_data:
+            await self._election.receive_votes(votes_with_data)
+        self._cancel_timers_if_ended()
+        await self._start_vote_timeout_if_available()
+        return results
 
-        mediator = self._event_system.get_mediator(DelayedEventMediator)
-        mediator.execute(delay, event)
+    async def _raise_receive_data(self, delay: float, data: Data):
+        self._start_timer(delay, ReceiveDataEvent(data))
 
-    async def _raise_lazy_votes_if_available(self):
+    async def _start_vote_timeout_if_available(self):
         if self._vote_timeout_started:
             return
+        if self._election.is_ended:
+            return
         if not self._messages.reach_quorum(self._epoch.quorum_num):
             return
         if self._messages.reach_quorum_consensus(self._epoch.quorum_num):
             return
 
+        # Lazy votes of all voters are made at once when it is timed out.
         self._vote_timeout_started = True
-        for voter in self._epoch.get_voters_id():
-            vote = self._vote_factory.create_lazy_vote(voter, self._epoch.num, self._num)
-            await self._raise_receive_vote(delay=TIMEOUT_VOTE, vote=vote)
+        self._start_timer(TIMEOUT_VOTE, VoteTimeoutEvent(self._epoch.num, self._num))
+
+    def _start_timer(self, delay: float, event: Event):
+        event.deterministic = False
+
+        mediator = self._event_system.get_mediator(DelayedEventMediator)
+        timer = mediator.execute(delay, event)
+        if timer:
+            self._timers.append(timer)
+
+    def _cancel_timers_if_ended(self):
+        if self._timers and self._election.is_ended:
+            self.cancel_timers()
 
     async def _new_unreal_datums(self):
         none_data = self._data_factory.create_none_data(epoch_num=self._epoch.num,
@@ -136,25 +171,23 @@ class Round:
         for vote in votes_by_data_id.values():
             await self._election.receive_vote(vote)
 
-    async def _receive_vote_if_data_exist(self, vote: Vote):
-        if self._messages.get_data(vote.data_id):
-            await self._election.receive_vote(vote)
-
-    def _verify_acceptable_data(self, data: Data):
+    def _check_acceptable_data(self, data: Data) -> AdmissionResult:
         if self._epoch.num != data.epoch_num:
-            raise InvalidEpoch(data.epoch_num, self._epoch.num)
+            return AdmissionResult.INVALID_EPOCH
         if self._num != data.round_num:
-            raise InvalidRound(data.epoch_num, data.round_num, self._epoch.num, self._num)
+            return AdmissionResult.INVALID_ROUND
         if data in self._messages:
-            raise AlreadyProposed(data.id, data.proposer_id)
+            return AdmissionResult.ALREADY_PROPOSED
+        return AdmissionResult.ACCEPTED
 
-    def _verify_acceptable_vote(self, vote: Vote):
+    def _check_acceptable_vote(self, vote: Vote) -> AdmissionResult:
         if self._epoch.num != vote.epoch_num:
-            raise InvalidEpoch(vote.epoch_num, self._epoch.num)
+            return AdmissionResult.INVALID_EPOCH
         if self._num != vote.round_num:
-            raise InvalidRound(vote.epoch_num, vote.round_num, self._epoch.num, self._num)
+            return AdmissionResult.INVALID_ROUND
         if vote in self._messages:
-            raise AlreadyVoted(vote.id, vote.voter_id)
+            return AdmissionResult.ALREADY_VOTED
+        return AdmissionResult.ACCEPTED
 
     def is_newer_than(self, epoch_num: int, round_num: int):
         return (self.epoch_num, self.num) > (epoch_num, round_num)
@@ -181,19 +214,20 @@ Datums = OrderedDict[bytes, Data]
 Votes = OrderedDict[bytes, Vote]
 VotesByDataID = DefaultDict[bytes, OrderedDict[bytes, Vote]]
 
-Voters = Set[bytes]
-VotersByDataID = DefaultDict[bytes, Set[bytes]]
+VotersByDataID = DefaultDict[bytes, VoterBitset]
 
 
 class RoundMessages:
-    def __init__(self):
+    def __init__(self, epoch: Optional[Epoch] = None):
         self._datums: Datums = Datums()
 
         self._votes: Votes = Votes()
         self._votes_by_data_id: VotesByDataID = DefaultDict(OrderedDict)
 
-        self._voters = set()
-        self._voters_by_data_id = DefaultDict(set)
+        self._voter_indexer = VoterIndexer(epoch)
+        self._voters = VoterBitset()
+        self._voters_by_data_id: VotersByDataID = DefaultDict(VoterBitset)
+        self._max_data_voter_count = 0  # The most voters for a data id
 
     @property
     def datums(self):
@@ -213,17 +247,20 @@ class RoundMessages:
         self._votes[vote.id] = vote
         self._votes_by_data_id[vote.data_id][vote.id] = vote
 
-        self._voters.add(vote.voter_id)
-        self._voters_by_data_id[vote.data_id].add(vote.voter_id)
+        voter_index = self._voter_indexer.get_index(vote.voter_id)
+        self._voters.add(voter_index)
+        voters = self._voters_by_data_id[vote.data_id]
+        if voters.add(voter_index) and voters.count > self._max_data_voter_count:
+            self._max_data_voter_count = voters.count
 
     def get_votes(self, data_id: bytes):
         return self._votes_by_data_id[data_id]
 
     def reach_quorum(self, quorum: int):
-        return len(self._voters) >= quorum
+        return self._voters.count >= quorum
 
     def reach_quorum_consensus(self, quorum: int):
-        return any(len(voters) >= quorum for voters in self._voters_by_data_id.values())
+        return self._max_data_voter_count >= quorum
 
     def __contains__(self, item: Union[Data, Vote]):
         if isinstance(item, Data):
@@ -234,33 +271,48 @@ class RoundMessages:
 
 
 class RoundPool:
+    # Rounds in order of (epoch_num, round_num) with a dict for lookup.
     def __init__(self):
         self._rounds: List[Round] = []
+        self._keys: List[Tuple[int, int]] = []
+        self._rounds_by_key: Dict[Tuple[int, int], Round] = {}
 
     @property
     def rounds(self) -> Sequence[Round]:
         return self._rounds
 
+    def __len__(self):
+        return len(self._rounds)
+
     def first_round(self):
         return self._rounds[0]
 
     def add_round(self, round_: Round):
-        insort(self._rounds, round_)
+        key = (round_.epoch_num, round_.num)
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._rounds.insert(i, round_)
+        self._rounds_by_key.setdefault(key, round_)
 
     def get_round(self, epoch_num: int, round_num: int):
         try:
-            return next(round_ for round_ in self._rounds
-                        if round_.epoch_num == epoch_num and round_.num == round_num)
-        except StopIteration:
+            return self._rounds_by_key[epoch_num, round_num]
+        except KeyError:
             raise KeyError(epoch_num, round_num)
 
     def prune_round(self, latest_epoch_num: int, latest_round_num: int):
-        self._rounds = [round_ for round_ in self._rounds
-                        if (round_.is_newer_than(latest_epoch_num, latest_round_num) or
-                            round_.is_equal_to(latest_epoch_num, latest_round_num))]
+        i = bisect_left(self._keys, (latest_epoch_num, latest_round_num))
+        for key in self._keys[:i]:
+            self._rounds_by_key.pop(key, None)
+        for round_ in self._rounds[:i]:
+            round_.cancel_timers()
+        # Not in place, rounds may be being iterated.
+        self._keys = self._keys[i:]
+        self._rounds = self._rounds[i:]
 
     def change_candidate(self, commit_id: bytes):
         candidate_round = self.first_round()
         candidate_round.candidate_id = commit_id
+        candidate_id = candidate_round.result_id
         for round_ in self._rounds[1:]:
-            round_.candidate_id = candidate_round.result_id
+            round_.candidate_id = candidate_id
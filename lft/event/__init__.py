@@ -1,5 +1,13 @@
 from .event import Event, AnyEvent
+from .event_queue import EventQueue
+from .virtual_clock import VirtualClock, VirtualTimerHandle
+from .event_stats import EventStats, EventTypeStats
+from .timing_wheel import TimingWheel, TimingWheelHandle, TimingWheelStats, get_timing_wheel
 from .event_simulator import EventSimulator
+from .event_record_format import RecordFormat, convert_records
+from .event_record_buffer import RecordBuffer, RecordBufferConfig, RecordBufferStats
+from .event_record_index import RecordIndex
+from .event_checkpoint import EventCheckpointable, EventCheckpointer
 from .event_recorder import EventRecorder, EventRecord
 from .event_replayer import EventReplayer
 from .event_register import EventRegister
@@ -0,0 +1,97 @@
+import pickle
+from abc import ABC, abstractmethod
+from typing import IO, Dict, Optional, Tuple
+from lft.serialization.binary_serializer import write_varint, read_varint_from_io
+
+__all__ = ("EventCheckpointable", "EventCheckpointer")
+
+
+class EventCheckpointable(ABC):
+    @abstractmethod
+    def snapshot(self) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def restore(self, snapshot: bytes):
+        raise NotImplementedError
+
+
+class EventCheckpointer:
+    # Snapshots of checkpointables tied to the record event number.
+    # A checkpoint of number N is the state right before the event N is executed.
+    # Each checkpoint is a varint number, a varint length and the pickled snapshots.
+    def __init__(self, interval: int = 1000):
+        self.interval = interval  # Minimum events between checkpoints
+        self.checkpointables: Dict[str, EventCheckpointable] = {}
+        self.io: Optional[IO] = None
+
+        self._requested = False
+        self._last_number: Optional[int] = None
+
+    @property
+    def requested(self):
+        return self._requested
+
+    def register(self, name: str, checkpointable: EventCheckpointable):
+        self.checkpointables[name] = checkpointable
+
+    def unregister(self, name: str):
+        del self.checkpointables[name]
+
+    def start(self, io: IO):
+        self.io = io
+        self._requested = False
+        self._last_number = None
+
+    def stop(self):
+        self.io = None
+        self._requested = False
+
+    def request(self):
+        # The recorder writes the checkpoint at the next clean point.
+        if self.io:
+            self._requested = True
+
+    def write(self, number: int):
+        self._requested = False
+        if self._last_number is not None and number - self._last_number < self.interval:
+            return
+        self._last_number = number
+
+        payload = pickle.dumps({name: checkpointable.snapshot()
+                                for name, checkpointable in self.checkpointables.items()})
+        frame = bytearray()
+        write_varint(frame, number)
+        write_varint(frame, len(payload))
+        frame += payload
+        self.io.write(frame)
+
+    def restore(self, io: IO, number: int) -> int:
+        # Restores the nearest checkpoint at or before the number. Returns the number of the checkpoint.
+        found = self._find(io, number)
+        if not found:
+            return 0
+
+        checkpoint_number, offset, length = found
+        io.seek(offset)
+        snapshots = pickle.loads(io.read(length))
+        for name, snapshot in snapshots.items():
+            self.checkpointables[name].restore(snapshot)
+        return checkpoint_number
+
+    def _find(self, io: IO, number: int) -> Optional[Tuple[int, int, int]]:
+        end = io.seek(0, 2)
+        io.seek(0)
+
+        found = None
+        while True:
+            checkpoint_number = read_varint_from_io(io)
+            length = read_varint_from_io(io)
+            if checkpoint_number is None or length is None or checkpoint_number > number:
+                return found
+
+            offset = io.tell()
+            if offset + length > end:
+                return found
+            found = checkpoint_number, offset, length
+            io.seek(length, 1)
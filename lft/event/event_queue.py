@@ -0,0 +1,63 @@
+import asyncio
+import heapq
+import itertools
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+from lft.event import Event
+
+__all__ = ("EventQueue", )
+
+
+class EventQueue:
+    # Single consumer queue of EventSimulator.
+    # Deterministic events go first, then the order of raising by a monotonic sequence.
+    def __init__(self, use_priority=True):
+        self._use_priority = use_priority
+        self._heap: List[Tuple[bool, int, Event]] = []
+        self._fifo: Deque[Event] = deque()
+        self._sequence = itertools.count()
+        self._deterministic_count = 0
+        self._waiter: Optional[asyncio.Future] = None
+
+    def __len__(self):
+        return len(self._heap) if self._use_priority else len(self._fifo)
+
+    def empty(self):
+        return not len(self)
+
+    def has_deterministic(self):
+        return self._deterministic_count > 0
+
+    def put(self, event: Event):
+        self._deterministic_count += event.deterministic
+        if self._use_priority:
+            heapq.heappush(self._heap, (not event.deterministic, next(self._sequence), event))
+        else:
+            self._fifo.append(event)
+        self.wakeup()
+
+    def pop(self) -> Event:
+        if self._use_priority:
+            event = heapq.heappop(self._heap)[-1]
+        else:
+            event = self._fifo.popleft()
+        self._deterministic_count -= event.deterministic
+        return event
+
+    def clear(self):
+        self._heap.clear()
+        self._fifo.clear()
+        self._deterministic_count = 0
+
+    async def wait(self):
+        if not self.empty():
+            return
+        self._waiter = asyncio.get_event_loop().create_future()
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
+
+    def wakeup(self):
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
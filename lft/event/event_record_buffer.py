@@ -0,0 +1,159 @@
+import io
+import os
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import IO, AnyStr, List
+
+__all__ = ("RecordBufferConfig", "RecordBufferStats", "RecordBuffer")
+
+
+@dataclass
+class RecordBufferConfig:
+    flush_interval: float = 0.1  # seconds
+    flush_bytes: int = 64 * 1024
+    max_bytes: int = 16 * 1024 * 1024  # write() blocks while the buffer is over it
+
+
+@dataclass
+class RecordBufferStats:
+    depth: int = 0
+    depth_bytes: int = 0
+    max_depth: int = 0
+    flush_count: int = 0
+    flushed_bytes: int = 0
+    sync_count: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+    total_flush_latency: float = 0.0
+
+    @property
+    def avg_flush_latency(self):
+        return self.total_flush_latency / self.flush_count if self.flush_count else 0.0
+
+
+class RecordBuffer:
+    # Write-behind IO for event records.
+    # write() only appends to the buffer. A background thread writes the buffered records at once
+    # every flush_interval or when flush_bytes are buffered, so the event loop never waits for the disk.
+    def __init__(self, io_: IO, config: RecordBufferConfig = None):
+        self.io = io_
+        self.config = config or RecordBufferConfig()
+        self.stats = RecordBufferStats()
+
+        self._buffer: List[AnyStr] = []
+        self._buffer_bytes = 0
+        self._written_count = 0
+        self._flushed_count = 0
+        self._flush_requested = False
+        self._sync_requested = False
+        self._closed = False
+
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="RecordBuffer", daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def write(self, data: AnyStr):
+        with self._condition:
+            if self._closed:
+                raise ValueError("write to closed RecordBuffer")
+            while self._buffer_bytes >= self.config.max_bytes and self._thread.is_alive():
+                self._condition.wait()
+
+            self._buffer.append(data)
+            self._buffer_bytes += len(data)
+            self._written_count += 1
+
+            self.stats.depth = len(self._buffer)
+            self.stats.depth_bytes = self._buffer_bytes
+            self.stats.max_depth = max(self.stats.max_depth, self.stats.depth)
+            if self._buffer_bytes >= self.config.flush_bytes:
+                self._condition.notify_all()
+
+    def flush(self):
+        # Blocks until every record written so far reaches the io.
+        with self._condition:
+            target_count = self._written_count
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._flushed_count < target_count and self._thread.is_alive():
+                self._condition.wait()
+
+    def sync(self):
+        # Requests fsync after the next flush without waiting for it.
+        with self._condition:
+            self._sync_requested = True
+            self._condition.notify_all()
+
+    def close(self):
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._is_flushable, self.config.flush_interval)
+
+                buffer = self._buffer
+                written_count = self._written_count
+                sync = self._sync_requested
+                closed = self._closed
+
+                self._buffer = []
+                self._buffer_bytes = 0
+                self._flush_requested = False
+                self._sync_requested = False
+                self.stats.depth = 0
+                self.stats.depth_bytes = 0
+                self._condition.notify_all()
+
+            try:
+                self._write(buffer, sync)
+            except Exception:
+                traceback.print_exc()
+
+            with self._condition:
+                self._flushed_count = written_count
+                self._condition.notify_all()
+            if closed:
+                return
+
+    def _is_flushable(self):
+        return (self._closed or self._flush_requested or self._sync_requested or
+                self._buffer_bytes >= self.config.flush_bytes)
+
+    def _write(self, buffer: List[AnyStr], sync: bool):
+        if not buffer and not sync:
+            return
+
+        start_time = time.perf_counter()
+        if buffer:
+            self.io.write(buffer[0][:0].join(buffer))
+        self.io.flush()
+        if sync:
+            _fsync(self.io)
+        latency = time.perf_counter() - start_time
+
+        self.stats.flush_count += 1
+        self.stats.flushed_bytes += sum(len(data) for data in buffer)
+        self.stats.sync_count += sync
+        self.stats.last_flush_latency = latency
+        self.stats.max_flush_latency = max(self.stats.max_flush_latency, latency)
+        self.stats.total_flush_latency += latency
+
+
+def _fsync(io_: IO):
+    try:
+        fileno = io_.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return
+    os.fsync(fileno)
@@ -0,0 +1,151 @@
+import os
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import TYPE_CHECKING, IO, Optional
+from lft.serialization import Serializer
+from lft.serialization.binary_serializer import BinarySerializer, write_varint, read_varint_from_io
+
+if TYPE_CHECKING:
+    from lft.event import EventRecord, RecordIndex
+
+__all__ = ("RecordFormat", "EventRecordWriter", "EventRecordReader",
+           "JsonEventRecordWriter", "JsonEventRecordReader", "BinaryEventRecordWriter", "BinaryEventRecordReader",
+           "create_record_writer", "create_record_reader", "convert_records")
+
+
+class RecordFormat(Enum):
+    json = "json"
+    binary = "binary"
+
+    @property
+    def io_mode(self):
+        return "" if self == RecordFormat.json else "b"
+
+
+class EventRecordWriter(ABC):
+    def __init__(self, io: IO):
+        self.io = io
+        self.offset = _tell(io)
+
+    @property
+    def symbol_count(self):
+        return 0
+
+    @abstractmethod
+    def write(self, record: 'EventRecord'):
+        raise NotImplementedError
+
+
+class EventRecordReader(ABC):
+    def __init__(self, io: IO):
+        self.io = io
+
+    @abstractmethod
+    def read(self) -> Optional['EventRecord']:
+        raise NotImplementedError
+
+    def seek(self, offset: int, index: 'RecordIndex'):
+        self.io.seek(offset)
+
+
+class JsonEventRecordWriter(EventRecordWriter):
+    def __init__(self, io: IO):
+        super().__init__(io)
+        self._serializer = Serializer()
+
+    def write(self, record: 'EventRecord'):
+        # Serialized records are ASCII, so the length is the size in bytes.
+        line = self._serializer.serialize(record) + os.linesep
+        self.io.write(line)
+        self.offset += len(line)
+
+
+class JsonEventRecordReader(EventRecordReader):
+    def __init__(self, io: IO):
+        super().__init__(io)
+        self._serializer = Serializer()
+
+    def read(self) -> Optional['EventRecord']:
+        while self.io.readable():
+            line = self.io.readline()
+            if not line:
+                return None
+            elif line == os.linesep:
+                continue
+            else:
+                return self._serializer.deserialize(line)
+        return None
+
+
+class BinaryEventRecordWriter(EventRecordWriter):
+    # Each record is a varint length followed by the record serialized by BinarySerializer.
+    def __init__(self, io: IO):
+        super().__init__(io)
+        self._serializer = BinarySerializer()
+
+    @property
+    def symbol_count(self):
+        return self._serializer.symbol_count
+
+    def write(self, record: 'EventRecord'):
+        serialized = self._serializer.serialize(record)
+        frame = bytearray()
+        write_varint(frame, len(serialized))
+        frame += serialized
+        self.io.write(frame)
+        self.offset += len(frame)
+
+
+class BinaryEventRecordReader(EventRecordReader):
+    def __init__(self, io: IO):
+        super().__init__(io)
+        self._serializer = BinarySerializer()
+
+    def read(self) -> Optional['EventRecord']:
+        length = read_varint_from_io(self.io)
+        if length is None:
+            return None
+        serialized = self.io.read(length)
+        if len(serialized) < length:
+            return None
+        return self._serializer.deserialize(serialized)
+
+    def seek(self, offset: int, index: 'RecordIndex'):
+        # Symbols are defined by the first records using them. Read those records again before jumping.
+        self._serializer = BinarySerializer()
+        for symbol_offset in index.get_symbol_offsets(offset):
+            self.io.seek(symbol_offset)
+            self.read()
+        self.io.seek(offset)
+
+
+def _tell(io: IO) -> int:
+    try:
+        return io.tell()
+    except (AttributeError, OSError):
+        return 0
+
+
+def create_record_writer(io: IO, record_format: RecordFormat = RecordFormat.json) -> EventRecordWriter:
+    if record_format == RecordFormat.binary:
+        return BinaryEventRecordWriter(io)
+    return JsonEventRecordWriter(io)
+
+
+def create_record_reader(io: IO, record_format: RecordFormat = RecordFormat.json) -> EventRecordReader:
+    if record_format == RecordFormat.binary:
+        return BinaryEventRecordReader(io)
+    return JsonEventRecordReader(io)
+
+
+def convert_records(src_io: IO, src_format: RecordFormat, dst_io: IO, dst_format: RecordFormat) -> int:
+    reader = create_record_reader(src_io, src_format)
+    writer = create_record_writer(dst_io, dst_format)
+
+    count = 0
+    record = reader.read()
+    while record is not None:
+        writer.write(record)
+        count += 1
+        record = reader.read()
+    return count
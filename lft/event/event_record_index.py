@@ -0,0 +1,77 @@
+import bisect
+import struct
+from typing import IO, Dict, List, Optional, Tuple
+
+__all__ = ("RecordIndex", )
+
+_RECORD = 0
+_MARK = 1
+
+
+class RecordIndex:
+    # Sidecar of a record file. Entries are fixed size, (kind, key, value0, value1).
+    # Record entry : (number, offset, symbol count after the record)
+    # Mark entry : (key, number of the record the mark points, unused)
+    ENTRY = struct.Struct(">BQQQ")
+
+    def __init__(self, io: IO = None):
+        self.io = io
+        self._symbol_count = 0
+
+        self._numbers: List[int] = []
+        self._offsets: List[int] = []
+        self._symbol_offsets: List[int] = []
+        self._marks: Dict[int, int] = {}
+        self._mark_keys: List[int] = []
+
+    @classmethod
+    def load(cls, io: IO) -> 'RecordIndex':
+        index = cls()
+        buffer = io.read()
+        buffer = buffer[:len(buffer) - len(buffer) % cls.ENTRY.size]  # Drop a torn entry
+        for kind, key, value0, value1 in cls.ENTRY.iter_unpack(buffer):
+            if kind == _RECORD:
+                index._add_record(key, value0, value1)
+            elif kind == _MARK:
+                index._add_mark(key, value0)
+        index._mark_keys.sort()
+        return index
+
+    def add_record(self, number: int, offset: int, symbol_count: int = 0):
+        self.io.write(self.ENTRY.pack(_RECORD, number, offset, symbol_count))
+
+    def add_mark(self, key: int, number: int):
+        self.io.write(self.ENTRY.pack(_MARK, key, number, 0))
+
+    def find_record(self, number: int) -> Optional[Tuple[int, int]]:
+        # The first record whose number is not less than the number, (number, offset)
+        i = bisect.bisect_left(self._numbers, number)
+        if i == len(self._numbers):
+            return None
+        return self._numbers[i], self._offsets[i]
+
+    def find_mark(self, key: int) -> Optional[int]:
+        # The record number of the mark or of the first mark after the key
+        try:
+            return self._marks[key]
+        except KeyError:
+            i = bisect.bisect_left(self._mark_keys, key)
+            if i == len(self._mark_keys):
+                return None
+            return self._marks[self._mark_keys[i]]
+
+    def get_symbol_offsets(self, offset: int) -> List[int]:
+        # Offsets of the records defining symbols before the offset
+        return self._symbol_offsets[:bisect.bisect_left(self._symbol_offsets, offset)]
+
+    def _add_record(self, number: int, offset: int, symbol_count: int):
+        self._numbers.append(number)
+        self._offsets.append(offset)
+        if symbol_count > self._symbol_count:
+            self._symbol_offsets.append(offset)
+            self._symbol_count = symbol_count
+
+    def _add_mark(self, key: int, number: int):
+        if key not in self._marks:
+            self._marks[key] = number
+            self._mark_keys.append(key)
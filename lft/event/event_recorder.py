@@ -1,45 +1,111 @@
-import os
-from typing import Any, IO
+from typing import Any, IO, List, Optional
 from lft.event import EventSimulator, Event, AnyEvent
-from lft.serialization import Serializer, Serializable
+from lft.event.event_record_format import RecordFormat, EventRecordWriter, create_record_writer
+from lft.event.event_record_buffer import RecordBuffer, RecordBufferConfig, RecordBufferStats
+from lft.event.event_record_index import RecordIndex
+from lft.event.event_checkpoint import EventCheckpointer
+from lft.serialization import Serializable
 
 __all__ = ("EventRecorder", )
 
 
 class EventRecorder:
-    def __init__(self, event_simulator: EventSimulator):
+    def __init__(self, event_simulator: EventSimulator, checkpointer: Optional[EventCheckpointer] = None):
         self.event_simulator = event_simulator
+        self.checkpointer = checkpointer
         self.number = 0
         self.io: IO = None
+        self.index_io: IO = None
+        self.checkpoint_io: IO = None
 
-        self._serializer = Serializer()
+        self._writer: EventRecordWriter = None
+        self._buffers: List[RecordBuffer] = []
+        self._index: Optional[RecordIndex] = None
+        self._last_record_number = 0
         self._handler = None
 
     def __del__(self):
         self.close()
 
-    def start(self, io: IO):
+    @property
+    def buffer_stats(self) -> Optional[RecordBufferStats]:
+        return self._buffers[0].stats if self._buffers else None
+
+    def start(self, io: IO, record_format: RecordFormat = RecordFormat.json,
+              buffer_config: Optional[RecordBufferConfig] = None,
+              index_io: Optional[IO] = None, checkpoint_io: Optional[IO] = None):
         self.stop()
+        self._close_buffers()
         self.io = io
+        self.index_io = index_io
+        self.checkpoint_io = checkpoint_io
+
+        self._writer = create_record_writer(self._buffer(io, buffer_config), record_format)
+        self._index = RecordIndex(self._buffer(index_io, buffer_config)) if index_io else None
+        if self.checkpointer and checkpoint_io:
+            self.checkpointer.start(self._buffer(checkpoint_io, buffer_config))
         self._handler = self.event_simulator.register_handler(AnyEvent, self.on_event_record)
 
     def stop(self):
         if self._handler:
             self.event_simulator.unregister_handler(AnyEvent, self._handler)
             self._handler = None
+        if self.checkpointer:
+            self.checkpointer.stop()
+
+    def mark(self, key: int):
+        # Marks the last record, replay can start from the mark.
+        if self._index:
+            self._index.add_mark(key, self._last_record_number)
+
+    def flush(self):
+        for buffer in self._buffers:
+            buffer.flush()
+        for io in self._ios():
+            io.flush()
+
+    def sync(self):
+        # Durable point. It does not wait for the disk if records are buffered.
+        for buffer in self._buffers:
+            buffer.sync()
 
     def close(self):
         self.stop()
-        if self.io and not self.io.closed:
-            self.io.close()
-            self.io = None
+        self._close_buffers()
+        for io in self._ios():
+            io.close()
+        self.io = None
+        self.index_io = None
+        self.checkpoint_io = None
+        self._index = None
+
+    def _buffer(self, io: IO, buffer_config: Optional[RecordBufferConfig]):
+        if not buffer_config:
+            return io
+        buffer = RecordBuffer(io, buffer_config)
+        self._buffers.append(buffer)
+        return buffer
+
+    def _close_buffers(self):
+        for buffer in self._buffers:
+            buffer.close()
+        self._buffers.clear()
+
+    def _ios(self):
+        return [io for io in (self.io, self.index_io, self.checkpoint_io) if io and not io.closed]
 
     def on_event_record(self, event: Any):
         if not event.deterministic:
-            record = EventRecord(self.number, event)
-            record_serialized = self._serializer.serialize(record)
-            self.io.write(record_serialized)
-            self.io.write(os.linesep)
+            if (self.checkpointer and self.checkpointer.requested and
+                    not self.event_simulator.has_deterministic_events):
+                # Nothing but recorded events remains to replay from here.
+                self.checkpointer.write(self.number)
+
+            offset = self._writer.offset
+            self._writer.write(EventRecord(self.number, event))
+            if self._index:
+                self._index.add_record(self.number, offset, self._writer.symbol_count)
+            self._last_record_number = self.number
         self.number += 1
 
 
@@ -16,24 +16,28 @@
 from functools import partial
 from typing import Type, Dict
 from lft.event import EventSimulator
-from lft.event.event_simulator import TEvent, HandlerCallable, HandlerAwaitable
+from lft.event.event_simulator import TEvent, HandlerCallable, EventFilter
 
 __all__ = ("EventRegister", )
 
 
 class EventRegister:
     _handler_prototypes: Dict[Type[TEvent], HandlerCallable] = {}
+    _filter_prototypes: Dict[Type[TEvent], EventFilter] = {}
 
     def __init__(self, event_simulator: EventSimulator):
         self._event_simulator = event_simulator
-        self._handlers: Dict[Type[TEvent], HandlerAwaitable] = {}
+        self._handlers: Dict[Type[TEvent], HandlerCallable] = {}
+        self._filters: Dict[Type[TEvent], EventFilter] = {}
         self._register_handlers()
+        self._register_filters()
 
     def __del__(self):
         self.close()
 
     def close(self):
         self._unregister_handlers()
+        self._unregister_filters()
 
     def _register_handler(self, event_type: Type[TEvent]):
         handler = partial(self._handler_prototypes[event_type], self)
@@ -51,3 +55,12 @@ class EventRegister:
         for event_type, handler in self._handlers.items():
             self._event_simulator.unregister_handler(event_type, handler)
         self._handlers.clear()
+
+    def _register_filters(self):
+        for event_type, event_filter in self._filter_prototypes.items():
+            self._filters[event_type] = self._event_simulator.register_filter(event_type, partial(event_filter, self))
+
+    def _unregister_filters(self):
+        for event_type, event_filter in self._filters.items():
+            self._event_simulator.unregister_filter(event_type, event_filter)
+        self._filters.clear()
@@ -1,7 +1,8 @@
-import os
-from typing import IO
+from typing import IO, Optional
 from lft.event import EventSimulator, EventRecord, Event, AnyEvent
-from lft.serialization import Serializer
+from lft.event.event_record_format import RecordFormat, EventRecordReader, create_record_reader
+from lft.event.event_record_index import RecordIndex
+from lft.event.event_checkpoint import EventCheckpointer
 
 
 __all__ = ("EventReplayer", )
@@ -10,22 +11,41 @@ __all__ = ("EventReplayer", )
 class EventReplayer:
     INIT_EVENT_COUNT = 1
 
-    def __init__(self, event_simulator: EventSimulator):
+    def __init__(self, event_simulator: EventSimulator, checkpointer: Optional[EventCheckpointer] = None):
         self.event_simulator = event_simulator
+        self.checkpointer = checkpointer
         self.number = -self.INIT_EVENT_COUNT  # EventReplayer raises a trash event(AnyEvent) first to start event system
 
-        self._serializer = Serializer()
+        self._reader: EventRecordReader = None
         self._record: EventRecord = None
         self._records: IO = None
+        self._stop_at_end = False
         self._handler = None
 
     def __del__(self):
         self.close()
 
-    def start(self, records: IO):
+    def start(self, records: IO, record_format: RecordFormat = RecordFormat.json,
+              index_io: Optional[IO] = None, start_number: int = 0, start_mark: Optional[int] = None,
+              checkpoint_io: Optional[IO] = None, stop_at_end: bool = False):
         self.stop()
 
         self._records = records
+        self._reader = create_record_reader(records, record_format)
+        self._record = None
+        self._stop_at_end = stop_at_end
+
+        index = RecordIndex.load(index_io) if index_io else None
+        if start_mark is not None:
+            start_number = index.find_mark(start_mark) if index else None
+            if start_number is None:
+                raise RuntimeError(f"Cannot find mark. {start_mark}")
+        if start_number and self.checkpointer and checkpoint_io:
+            # Events from the nearest checkpoint to the start are replayed again.
+            start_number = self.checkpointer.restore(checkpoint_io, start_number)
+        if start_number:
+            self._seek(start_number, index)
+
         self._handler = self.event_simulator.register_handler(AnyEvent, self.on_event_replay)
         self.event_simulator.raise_event(AnyEvent())
 
@@ -42,7 +62,12 @@ class EventReplayer:
     def on_event_replay(self, event: Event):
         while True:
             self._record = self._get_record_if_not_exist()
-            if self._record and self._record.number <= self.number + 1:
+            if not self._record:
+                if self._stop_at_end:
+                    # Events raised by the last records are executed before stopping.
+                    self.event_simulator.stop_when_idle()
+                break
+            if self._record.number <= self.number + 1:
                 self.event_simulator.raise_event(self._record.event)
                 self._record = None
             else:
@@ -50,16 +75,18 @@ class EventReplayer:
 
         self.number += 1
 
+    def _seek(self, number: int, index: Optional[RecordIndex]):
+        # Events before the number are skipped, without index records are skipped one by one.
+        found = index.find_record(number) if index else None
+        if found:
+            self._reader.seek(found[1], index)
+
+        self._record = self._reader.read()
+        while self._record and self._record.number < number:
+            self._record = self._reader.read()
+        self.number = number - self.INIT_EVENT_COUNT
+
     def _get_record_if_not_exist(self):
         if self._record:
             return self._record
-
-        while self._records.readable():
-            line = self._records.readline()
-            if not line:
-                return None
-            elif line == os.linesep:
-                continue
-            else:
-                return self._serializer.deserialize(line)
-
+        return self._reader.read()
@@ -1,25 +1,40 @@
 import asyncio
+import inspect
 import logging
 import time
 import traceback
 from collections import defaultdict
-from typing import DefaultDict, Type, TypeVar, List, Callable, Awaitable, Union, Optional
-from lft.event import Event, AnyEvent
+from functools import partial
+from typing import DefaultDict, Dict, Type, TypeVar, List, Tuple, Callable, Awaitable, Union, Optional
+from lft.event import Event, AnyEvent, EventQueue, VirtualClock
+from lft.event.event_stats import EventStats
 
-__all__ = ("EventSimulator", "TEvent", "HandlerAwaitable", "HandlerFunction", "HandlerCallable")
+__all__ = ("EventSimulator", "TEvent", "HandlerAwaitable", "HandlerFunction", "HandlerCallable", "EventFilter")
 
 TEvent = TypeVar("TEvent", bound=Event)
 
 HandlerAwaitable = Callable[[TEvent], Awaitable]
 HandlerFunction = Callable[[TEvent], None]
 HandlerCallable = Union[HandlerFunction, HandlerAwaitable]
+EventFilter = Callable[[TEvent], bool]
+Dispatch = Tuple[Tuple[HandlerCallable, bool], ...]  # ((handler, is_coroutine_function), ...)
 
 
 class EventSimulator:
-    def __init__(self, logger: Optional[logging.Logger] = None, use_priority=True):
-        self._event_tasks = asyncio.PriorityQueue() if use_priority else asyncio.Queue()
+    def __init__(self, logger: Optional[logging.Logger] = None, use_priority=True,
+                 clock: Optional[VirtualClock] = None):
+        self._event_tasks = EventQueue(use_priority)
         self._running = False
-        self._handlers: DefaultDict[Type[TEvent], List[HandlerAwaitable]] = defaultdict(list)
+        self._executing = False
+        self._stop_when_idle = False
+        self._stats: Optional[EventStats] = None
+        self._handlers: DefaultDict[Type[TEvent], List[HandlerCallable]] = defaultdict(list)
+        self._dispatches: Dict[Type[TEvent], Dispatch] = {}
+        self._filters: Dict[Type[TEvent], List[EventFilter]] = {}
+
+        self._clock = clock
+        if self._clock:
+            self._clock.add_simulator(self)
 
         if logger is None:
             logger = logging.getLogger(__name__)
@@ -28,52 +43,127 @@ class EventSimulator:
     def __del__(self):
         self.stop()
 
+    @property
+    def clock(self) -> Optional[VirtualClock]:
+        return self._clock
+
+    @property
+    def is_running(self):
+        return self._running
+
+    @property
+    def is_idle(self):
+        return not self._running or (self._event_tasks.empty() and not self._executing)
+
+    @property
+    def has_deterministic_events(self):
+        return self._event_tasks.has_deterministic()
+
+    @property
+    def stats(self) -> Optional[EventStats]:
+        return self._stats
+
+    def profile(self) -> EventStats:
+        # Measures handler time per event type from now on.
+        self._stats = EventStats()
+        return self._stats
+
+    def stop_when_idle(self):
+        # Stops instead of waiting for new events. No one raises events from outside, e.g. replaying.
+        self._stop_when_idle = True
+        self._event_tasks.wakeup()
+
     def register_handler(self, event_type: Type[TEvent], handler: HandlerCallable):
-        handler = asyncio.coroutine(handler)
         self._handlers[event_type].append(handler)
+        self._dispatches.clear()
         return handler
 
-    def unregister_handler(self, event_type: Type[TEvent], handler: HandlerAwaitable):
+    def unregister_handler(self, event_type: Type[TEvent], handler: HandlerCallable):
         self._handlers[event_type].remove(handler)
+        self._dispatches.clear()
+
+    def register_filter(self, event_type: Type[TEvent], event_filter: EventFilter):
+        # Events the filter returns False for are dropped before any handler, including the recorder's.
+        self._filters.setdefault(event_type, []).append(event_filter)
+        return event_filter
+
+    def unregister_filter(self, event_type: Type[TEvent], event_filter: EventFilter):
+        self._filters[event_type].remove(event_filter)
+        if not self._filters[event_type]:
+            del self._filters[event_type]
 
     def raise_event(self, event: Event):
-        event_task = (not event.deterministic, time.perf_counter(), event)
-        self._event_tasks.put_nowait(event_task)
+        self._event_tasks.put(event)
+        if self._clock and self._running:
+            self._clock.set_idle(self, False)
 
     async def execute_events(self):
         while self._running:
+            if self._event_tasks.empty():
+                if self._stop_when_idle:
+                    self.stop()
+                    break
+                if self._clock:
+                    self._clock.set_idle(self, True)
+                try:
+                    await self._event_tasks.wait()
+                except RuntimeError:
+                    break
+                continue
+
+            event = self._event_tasks.pop()
+            self._executing = True
             try:
-                event_task = await self._event_tasks.get()
-            except RuntimeError:
-                break
-
-            non_deterministic, mono_ns, event = event_task
-            if not event:
-                break
-            if not self._running:
-                self._event_tasks.put_nowait(event_task)
-                break
-
-            await self._execute_event(event)
+                if self._stats is None:
+                    await self._execute_event(event)
+                else:
+                    started = time.perf_counter()
+                    await self._execute_event(event)
+                    self._stats.add(type(event), time.perf_counter() - started)
+            finally:
+                self._executing = False
 
     async def _execute_event(self, event: Event):
+        event_filters = self._filters.get(type(event))
+        if event_filters and not all(event_filter(event) for event_filter in event_filters):
+            return
+
         if not isinstance(event, AnyEvent):
             self._logger.debug(event)
-        if type(event) is AnyEvent:
-            handlers = self._handlers[AnyEvent][:]
-        else:
-            handlers = self._handlers[AnyEvent] + self._handlers[type(event)]
 
-        for handler in handlers:
+        for handler, is_coroutine_function in self._get_dispatch(type(event)):
             try:
-                await handler(event)
+                if is_coroutine_function:
+                    await handler(event)
+                else:
+                    result = handler(event)
+                    if result is not None and inspect.isawaitable(result):
+                        await result
             except Exception:
                 traceback.print_exc()
 
+    def _get_dispatch(self, event_type: Type[TEvent]) -> Dispatch:
+        try:
+            return self._dispatches[event_type]
+        except KeyError:
+            pass
+
+        if event_type is AnyEvent:
+            handlers = self._handlers[AnyEvent]
+        else:
+            handlers = self._handlers[AnyEvent] + self._handlers[event_type]
+        dispatch = tuple((handler, _is_coroutine_function(handler)) for handler in handlers)
+        self._dispatches[event_type] = dispatch
+        return dispatch
+
     def start(self, blocking=True, loop: Optional[asyncio.AbstractEventLoop] = None) -> Optional[asyncio.Task]:
         self._running = True
+        self._stop_when_idle = False
 
         loop = loop or asyncio.get_event_loop()
+        if self._clock:
+            self._clock.set_idle(self, self.is_idle)
+            self._clock.start(loop)
         if blocking:
             return loop.run_until_complete(self.execute_events())
         else:
@@ -81,7 +171,17 @@ class EventSimulator:
 
     def stop(self):
         self._running = False
+        self._event_tasks.wakeup()
+        if self._clock:
+            self._clock.set_idle(self, True)
+            self._clock.wakeup()
 
     def clear(self):
-        self._event_tasks = self._event_tasks.__class__()
-        self._running = False
+        self._event_tasks.clear()
+        self.stop()
+
+
+def _is_coroutine_function(handler: HandlerCallable):
+    while isinstance(handler, partial):
+        handler = handler.func
+    return asyncio.iscoroutinefunction(handler)
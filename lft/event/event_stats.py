@@ -0,0 +1,43 @@
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import DefaultDict, Type
+from lft.event import Event
+
+__all__ = ("EventStats", "EventTypeStats")
+
+
+@dataclass
+class EventTypeStats:
+    count: int = 0
+    time: float = 0.0  # Seconds spent in handlers
+
+    @property
+    def avg_time(self):
+        return self.time / self.count if self.count else 0.0
+
+
+class EventStats:
+    # Handler time of EventSimulator per event type.
+    def __init__(self):
+        self.types: DefaultDict[Type[Event], EventTypeStats] = defaultdict(EventTypeStats)
+        self.started = time.perf_counter()
+        self.finished = self.started
+
+    @property
+    def count(self):
+        return sum(stats.count for stats in self.types.values())
+
+    @property
+    def elapsed(self):
+        return self.finished - self.started
+
+    def get_count(self, event_type: Type[Event]):
+        stats = self.types.get(event_type)
+        return stats.count if stats else 0
+
+    def add(self, event_type: Type[Event], elapsed: float):
+        stats = self.types[event_type]
+        stats.count += 1
+        stats.time += elapsed
+        self.finished = time.perf_counter()
@@ -1,44 +1,59 @@
 import asyncio
 import logging
 from typing import Dict, Type, IO, Optional
-from lft.event import EventSimulator, EventRecorder, EventReplayer, EventMediator
+from lft.event import EventSimulator, EventRecorder, EventReplayer, EventMediator, VirtualClock, RecordFormat
+from lft.event import RecordBufferConfig, EventCheckpointer
 
 __all__ = ("EventSystem", )
 
 
 class EventSystem:
-    def __init__(self, logger: Optional[logging.Logger] = None, use_priority=True):
-        self.simulator = EventSimulator(logger, use_priority)
-        self.recorder = EventRecorder(self.simulator)
-        self.replayer = EventReplayer(self.simulator)
+    def __init__(self, logger: Optional[logging.Logger] = None, use_priority=True,
+                 clock: Optional[VirtualClock] = None):
+        self.simulator = EventSimulator(logger, use_priority, clock)
+        self.checkpointer = EventCheckpointer()
+        self.recorder = EventRecorder(self.simulator, self.checkpointer)
+        self.replayer = EventReplayer(self.simulator, self.checkpointer)
         self.mediators: Dict[Type[EventMediator], EventMediator] = {}
 
     def start_record(self,
                      record_io: IO, mediator_ios: Dict[Type[EventMediator], IO]=None,
-                     blocking=True, loop: asyncio.AbstractEventLoop=None):
+                     blocking=True, loop: asyncio.AbstractEventLoop=None,
+                     record_format: RecordFormat = RecordFormat.json,
+                     buffer_config: Optional[RecordBufferConfig] = None,
+                     index_io: Optional[IO] = None, mediator_index_ios: Dict[Type[EventMediator], IO]=None,
+                     checkpoint_io: Optional[IO] = None):
         if not mediator_ios:
             mediator_ios = {}
+        if not mediator_index_ios:
+            mediator_index_ios = {}
         for mediator in self.mediators.values():
             io = mediator_ios.get(type(mediator))
             if io:
-                mediator.switch_recorder(self.recorder, io=io)
+                mediator.switch_recorder(self.recorder, io=io, **_index_kwargs(mediator, mediator_index_ios))
             else:
                 mediator.switch_recorder(self.recorder)
-        self.recorder.start(record_io)
+        self.recorder.start(record_io, record_format, buffer_config, index_io, checkpoint_io)
         return self.simulator.start(blocking, loop)
 
     def start_replay(self,
                      record_io: IO, mediator_ios: Dict[Type[EventMediator], IO]=None,
-                     blocking=True, loop: asyncio.AbstractEventLoop=None):
+                     blocking=True, loop: asyncio.AbstractEventLoop=None,
+                     record_format: RecordFormat = RecordFormat.json,
+                     index_io: Optional[IO] = None, mediator_index_ios: Dict[Type[EventMediator], IO]=None,
+                     start_number: int = 0, start_mark: Optional[int] = None, checkpoint_io: Optional[IO] = None,
+                     stop_at_end: bool = False):
         if not mediator_ios:
             mediator_ios = {}
+        if not mediator_index_ios:
+            mediator_index_ios = {}
         for mediator in self.mediators.values():
             io = mediator_ios.get(type(mediator))
             if io:
-                mediator.switch_replayer(self.replayer, io=io)
+                mediator.switch_replayer(self.replayer, io=io, **_index_kwargs(mediator, mediator_index_ios))
             else:
                 mediator.switch_replayer(self.replayer)
-        self.replayer.start(record_io)
+        self.replayer.start(record_io, record_format, index_io, start_number, start_mark, checkpoint_io, stop_at_end)
         return self.simulator.start(blocking, loop)
 
     def start(self, blocking=True, loop: asyncio.AbstractEventLoop=None):
@@ -64,3 +79,8 @@ class EventSystem:
 
     def del_mediator(self, mediator_type: Type[EventMediator]):
         del self.mediators[mediator_type]
+
+
+def _index_kwargs(mediator: EventMediator, mediator_index_ios: Dict[Type[EventMediator], IO]):
+    index_io = mediator_index_ios.get(type(mediator))
+    return {"index_io": index_io} if index_io else {}
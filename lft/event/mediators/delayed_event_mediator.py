@@ -1,6 +1,6 @@
 import asyncio
 from typing import Set, Optional
-from lft.event import (Event, EventSimulator, EventMediator,
+from lft.event import (Event, EventSimulator, EventMediator, TimingWheel, TimingWheelHandle, get_timing_wheel,
                        EventInstantMediatorExecutor, EventReplayerMediatorExecutor, EventRecorderMediatorExecutor)
 
 __all__ = ("DelayedHandlerMixin", "DelayedEventMediator", "DelayedHandler", "DelayedEventInstantMediatorExecutor",
@@ -10,28 +10,30 @@ __all__ = ("DelayedHandlerMixin", "DelayedEventMediator", "DelayedHandler", "Del
 class DelayedHandlerMixin:
     def __init__(self):
         self.handlers: Set['DelayedHandler'] = set()
+        self.timing_wheel: Optional[TimingWheel] = None
 
     def _handle(self,
                 loop: asyncio.AbstractEventLoop,
                 delay: float,
                 event: Event,
                 event_simulator: EventSimulator):
-        delayed_handler = DelayedHandler()
-        self.handlers.add(delayed_handler)
-
-        loop = loop or asyncio.get_event_loop()
-        timer_handler = loop.call_later(delay, delayed_handler)
+        if not self.timing_wheel:
+            self.timing_wheel = get_timing_wheel(event_simulator.clock, loop)
 
+        delayed_handler = DelayedHandler()
         delayed_handler.event = event
         delayed_handler.event_simulator = event_simulator
-        delayed_handler.timer_handler = timer_handler
         delayed_handler.handlers = self.handlers
+        delayed_handler.timer_handler = self.timing_wheel.call_later(delay, delayed_handler)
+
+        self.handlers.add(delayed_handler)
+        return delayed_handler
 
 
 class DelayedEventInstantMediatorExecutor(EventInstantMediatorExecutor, DelayedHandlerMixin):
     def execute(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
         _is_valid_event(event)
-        self._handle(loop, delay, event, self._event_simulator)
+        return self._handle(loop, delay, event, self._event_simulator)
 
     async def execute_async(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
         return self.execute(delay, event, loop)
@@ -40,7 +42,7 @@ class DelayedEventInstantMediatorExecutor(EventInstantMediatorExecutor, DelayedH
 class DelayedEventRecorderMediatorExecutor(EventRecorderMediatorExecutor, DelayedHandlerMixin):
     def execute(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
         _is_valid_event(event)
-        self._handle(loop, delay, event, self._event_recorder.event_simulator)
+        return self._handle(loop, delay, event, self._event_recorder.event_simulator)
 
     async def execute_async(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
         return self.execute(delay, event, loop)
@@ -48,8 +50,9 @@ class DelayedEventRecorderMediatorExecutor(EventRecorderMediatorExecutor, Delaye
 
 class DelayedEventReplayerMediatorExecutor(EventReplayerMediatorExecutor):
     def execute(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
-        # do nothing
+        # do nothing, the event is replayed from the record
         _is_valid_event(event)
+        return None
 
     async def execute_async(self, delay: float, event: Event, loop: asyncio.AbstractEventLoop=None):
         return self.execute(delay, event, loop)
@@ -70,13 +73,20 @@ def _is_valid_event(event: Event):
 
 
 class DelayedHandler:
+    __slots__ = ("event", "event_simulator", "timer_handler", "handlers")
+
     def __init__(self):
         self.event: Optional[Event] = None
         self.event_simulator: Optional[EventSimulator] = None
-        self.timer_handler: Optional[asyncio.TimerHandle] = None
+        self.timer_handler: Optional[TimingWheelHandle] = None
         self.handlers: Optional[Set['DelayedHandler']] = None
 
     def __call__(self):
         self.handlers.remove(self)
         self.event_simulator.raise_event(self.event)
 
+    def cancel(self):
+        if self.handlers is not None and self in self.handlers:
+            self.timer_handler.cancel()
+            self.handlers.remove(self)
+
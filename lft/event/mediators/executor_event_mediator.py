@@ -0,0 +1,111 @@
+import asyncio
+import traceback
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Optional, Sequence
+from lft.event import (Event, EventSimulator, EventMediator,
+                       EventInstantMediatorExecutor, EventReplayerMediatorExecutor, EventRecorderMediatorExecutor)
+
+__all__ = ("ExecutorEventMediator", "ExecutorEventInstantMediatorExecutor",
+           "ExecutorEventRecorderMediatorExecutor", "ExecutorEventReplayerMediatorExecutor", "run_verify_batch")
+
+EventFactory = Callable[[Any], Event]
+
+
+class ExecutorHandlerMixin:
+    # Runs func in the pool, off the loop. Its result comes back as the event made by event_factory.
+    # The event is recorded as it is, so the replayer does not run func again.
+    # A VirtualClock is held busy until the event is raised, virtual time does not pass while func runs.
+    def _handle(self,
+                loop: Optional[asyncio.AbstractEventLoop],
+                pool: Executor,
+                func: Callable[[], Any],
+                event_factory: EventFactory,
+                event_simulator: EventSimulator):
+        loop = loop or asyncio.get_event_loop()
+        future = loop.run_in_executor(pool, func)
+        if event_simulator.clock:
+            # Virtual time must not pass while func runs in the pool.
+            event_simulator.clock.set_idle(future, False)
+        future.add_done_callback(lambda f: _raise_result(f, event_factory, event_simulator))
+        return future
+
+
+class ExecutorEventInstantMediatorExecutor(EventInstantMediatorExecutor, ExecutorHandlerMixin):
+    def execute(self, pool: Executor, func: Callable[[], Any], event_factory: EventFactory,
+                loop: asyncio.AbstractEventLoop=None):
+        return self._handle(loop, pool, func, event_factory, self._event_simulator)
+
+    async def execute_async(self, pool: Executor, func: Callable[[], Any], event_factory: EventFactory,
+                            loop: asyncio.AbstractEventLoop=None):
+        return self.execute(pool, func, event_factory, loop)
+
+
+class ExecutorEventRecorderMediatorExecutor(EventRecorderMediatorExecutor, ExecutorHandlerMixin):
+    def execute(self, pool: Executor, func: Callable[[], Any], event_factory: EventFactory,
+                loop: asyncio.AbstractEventLoop=None):
+        return self._handle(loop, pool, func, event_factory, self._event_recorder.event_simulator)
+
+    async def execute_async(self, pool: Executor, func: Callable[[], Any], event_factory: EventFactory,
+                            loop: asyncio.AbstractEventLoop=None):
+        return self.execute(pool, func, event_factory, loop)
+
+
+class ExecutorEventReplayerMediatorExecutor(EventReplayerMediatorExecutor):
+    def execute(self, pool: Executor, func: Callable[[], Any], event_factory: EventFactory,
+                loop: asyncio.AbstractEventLoop=None):
+        # do nothing, the result event is replayed from the record
+        return None
+
+    async def execute_async(self, pool: Executor, func: Callable[[], Any], event_factory: EventFactory,
+                            loop: asyncio.AbstractEventLoop=None):
+        return self.execute(pool, func, event_factory, loop)
+
+
+class ExecutorEventMediator(EventMediator):
+    InstantExecutorType = ExecutorEventInstantMediatorExecutor
+    RecorderExecutorType = ExecutorEventRecorderMediatorExecutor
+    ReplayerExecutorType = ExecutorEventReplayerMediatorExecutor
+
+    def execute(self, pool: Executor, func: Callable[[], Any], event_factory: EventFactory,
+                loop: asyncio.AbstractEventLoop=None):
+        return super().execute(pool=pool, func=func, event_factory=event_factory, loop=loop)
+
+    def execute_verify_batch(self, pool: Executor, verifier: Any, messages: Sequence[Any],
+                             event_factory: Callable[[Sequence[bool]], Event],
+                             loop: asyncio.AbstractEventLoop=None):
+        # verifier.verify_batch(messages) runs in the pool, event_factory makes the event of the results.
+        def _event_factory(results):
+            event = event_factory(list(results))
+            event.deterministic = False
+            return event
+
+        return self.execute(pool, partial(run_verify_batch, verifier, messages), _event_factory, loop=loop)
+
+
+def run_verify_batch(verifier: Any, messages: Sequence[Any]) -> Sequence[bool]:
+    # Entry of a worker of the pool. The worker does not have a running loop.
+    return asyncio.run(verifier.verify_batch(messages))
+
+
+def _raise_result(future: asyncio.Future, event_factory: EventFactory, event_simulator: EventSimulator):
+    try:
+        _raise_result_event(future, event_factory, event_simulator)
+    finally:
+        # The simulator is busy with the result event already, if it is raised.
+        if event_simulator.clock:
+            event_simulator.clock.set_idle(future, True)
+
+
+def _raise_result_event(future: asyncio.Future, event_factory: EventFactory, event_simulator: EventSimulator):
+    if future.cancelled():
+        return
+    try:
+        event = event_factory(future.result())
+    except Exception:
+        traceback.print_exc()
+        return
+
+    if event.deterministic:
+        raise RuntimeError(f"Executor event must not be deterministic :{event.serialize()}")
+    event_simulator.raise_event(event)
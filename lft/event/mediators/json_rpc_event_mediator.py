@@ -1,9 +1,9 @@
 import aiohttp
 from jsonrpcclient.clients.http_client import HTTPClient
 from jsonrpcclient.clients.aiohttp_client import AiohttpClient
-from typing import IO
+from typing import IO, Optional
 from lft.event import EventMediator, EventInstantMediatorExecutor, EventRecorder, EventReplayer
-from lft.event import EventReplayerMediatorExecutor, EventRecorderMediatorExecutor
+from lft.event import EventReplayerMediatorExecutor, EventRecorderMediatorExecutor, RecordIndex
 from lft.event.mediators.mixin import EventMediatorRecorderMixin
 
 __all__ = ("JsonRpcEventMediator", "JsonRpcEventInstantMediatorExecutor",
@@ -18,9 +18,10 @@ class JsonRpcEventInstantMediatorExecutor(EventInstantMediatorExecutor):
 
 
 class JsonRpcEventRecorderMediatorExecutor(EventRecorderMediatorExecutor, EventMediatorRecorderMixin):
-    def __init__(self, event_recorder: EventRecorder, io: IO):
+    def __init__(self, event_recorder: EventRecorder, io: IO, index_io: Optional[IO] = None):
         super().__init__(event_recorder)
         self._io = io
+        self._index = RecordIndex(index_io) if index_io else None
         self._number = 0
 
     def execute(self, url: str, method: str, params: dict=None):
@@ -33,7 +34,7 @@ class JsonRpcEventRecorderMediatorExecutor(EventRecorderMediatorExecutor, EventM
         else:
             return result
         finally:
-            self._write(self._io, self._event_recorder.number, result)
+            self._write(self._io, self._event_recorder.number, result, self._index)
 
     async def execute_async(self, url: str, method: str, params: dict=None):
         result = None
@@ -45,16 +46,17 @@ class JsonRpcEventRecorderMediatorExecutor(EventRecorderMediatorExecutor, EventM
         else:
             return result
         finally:
-            self._write(self._io, self._event_recorder.number, result)
+            self._write(self._io, self._event_recorder.number, result, self._index)
 
 
 class JsonRpcEventReplayerMediatorExecutor(EventReplayerMediatorExecutor, EventMediatorRecorderMixin):
-    def __init__(self, event_replayer: EventReplayer, io: IO):
+    def __init__(self, event_replayer: EventReplayer, io: IO, index_io: Optional[IO] = None):
         super().__init__(event_replayer)
         self._io = io
+        self._index = RecordIndex.load(index_io) if index_io else None
 
     def execute(self, url: str, method: str, params: dict=None):
-        result = self._read(self._io, self._event_replayer.number)
+        result = self._read(self._io, self._event_replayer.number, self._index)
 
         if isinstance(result, Exception):
             raise result
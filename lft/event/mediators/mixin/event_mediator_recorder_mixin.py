@@ -2,18 +2,20 @@ import base64
 import json
 import os
 import pickle
-from typing import Any, IO
+from typing import Any, IO, Optional
+from lft.event import RecordIndex
 
 __all__ = ("EventMediatorRecorderMixin")
 
 
 class EventMediatorRecorderMixin:
-    def _write(self, io: IO, number: int, result: Any):
+    def _write(self, io: IO, number: int, result: Any, index: Optional[RecordIndex] = None):
         serialized = self._serialize(number, result)
         dumped = json.dumps(serialized)
 
-        io.write(dumped)
-        io.write(os.linesep)
+        if index:
+            index.add_record(number, io.tell())
+        io.write(dumped + os.linesep)
 
     def _serialize(self, number: int, result: Any):
         if isinstance(result, Exception):
@@ -31,7 +33,14 @@ class EventMediatorRecorderMixin:
             "!data": data
         }
 
-    def _read(self, io: IO, number: int) -> Any:
+    def _read(self, io: IO, number: int, index: Optional[RecordIndex] = None) -> Any:
+        if index and number != getattr(self, "_read_number", None):
+            # Results of the same number are read in a row.
+            found = index.find_record(number)
+            if found:
+                io.seek(found[1])
+        self._read_number = number
+
         cur_number = -1
         cur_result = None
 
@@ -1,7 +1,7 @@
 import time
-from typing import IO
+from typing import IO, Optional
 from lft.event import EventMediator, EventInstantMediatorExecutor, EventRecorder, EventReplayer
-from lft.event import EventReplayerMediatorExecutor, EventRecorderMediatorExecutor
+from lft.event import EventReplayerMediatorExecutor, EventRecorderMediatorExecutor, RecordIndex
 from lft.event.mediators.mixin import EventMediatorRecorderMixin
 
 __all__ = ("TimestampEventMediator", "TimestampEventInstantMediatorExecutor",
@@ -17,9 +17,10 @@ class TimestampEventInstantMediatorExecutor(EventInstantMediatorExecutor):
 
 
 class TimestampEventRecorderMediatorExecutor(EventRecorderMediatorExecutor, EventMediatorRecorderMixin):
-    def __init__(self, event_recorder: EventRecorder, io: IO):
+    def __init__(self, event_recorder: EventRecorder, io: IO, index_io: Optional[IO] = None):
         super().__init__(event_recorder)
         self._io = io
+        self._index = RecordIndex(index_io) if index_io else None
 
     def execute(self):
         result = None
@@ -31,19 +32,20 @@ class TimestampEventRecorderMediatorExecutor(EventRecorderMediatorExecutor, Even
         else:
             return result
         finally:
-            self._write(self._io, self._event_recorder.number, result)
+            self._write(self._io, self._event_recorder.number, result, self._index)
 
     async def execute_async(self):
         return super().execute()
 
 
 class TimestampEventReplayerMediatorExecutor(EventReplayerMediatorExecutor, EventMediatorRecorderMixin):
-    def __init__(self, event_replayer: EventReplayer, io: IO):
+    def __init__(self, event_replayer: EventReplayer, io: IO, index_io: Optional[IO] = None):
         super().__init__(event_replayer)
         self._io = io
+        self._index = RecordIndex.load(index_io) if index_io else None
 
     def execute(self):
-        return self._read(self._io, self._event_replayer.number)
+        return self._read(self._io, self._event_replayer.number, self._index)
 
     async def execute_async(self):
         return self.execute()
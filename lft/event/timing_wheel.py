@@ -0,0 +1,136 @@
+import asyncio
+import math
+import traceback
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+from lft.event import VirtualClock, VirtualTimerHandle
+
+__all__ = ("TimingWheel", "TimingWheelHandle", "TimingWheelStats", "get_timing_wheel")
+
+
+@dataclass
+class TimingWheelStats:
+    pending: int = 0
+    max_pending: int = 0
+    buckets: int = 0
+    scheduled: int = 0
+    fired: int = 0
+    cancelled: int = 0
+
+
+class TimingWheelHandle:
+    __slots__ = ("_wheel", "_tick", "_callback", "_args", "_done")
+
+    def __init__(self, wheel: 'TimingWheel', tick: int, callback: Callable, args: tuple):
+        self._wheel = wheel
+        self._tick = tick
+        self._callback = callback
+        self._args = args
+        self._done = False
+
+    def when(self) -> float:
+        return self._tick / self._wheel.ticks_per_second
+
+    def cancel(self):
+        if not self._done:
+            self._done = True
+            self._wheel._cancel(self)
+
+    def cancelled(self) -> bool:
+        return self._done
+
+
+class _Bucket:
+    __slots__ = ("handles", "live", "timer")
+
+    def __init__(self):
+        self.handles: List[TimingWheelHandle] = []
+        self.live = 0
+        self.timer: Optional[Union[asyncio.TimerHandle, VirtualTimerHandle]] = None
+
+
+class TimingWheel:
+    # Delayed callbacks hashed into buckets of coarse ticks.
+    # One timer of the clock or the loop per bucket fires every callback of the tick at once.
+    # Callbacks are never called earlier than their delay, at most one tick later.
+    def __init__(self, resolution: float = 0.01, clock: Optional[VirtualClock] = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.ticks_per_second = round(1 / resolution)
+        self.stats = TimingWheelStats()
+
+        self._clock = clock
+        self._loop = loop
+        self._buckets: Dict[int, _Bucket] = {}
+
+    def time(self) -> float:
+        return self._clock.time() if self._clock else self._get_loop().time()
+
+    def call_later(self, delay: float, callback: Callable, *args) -> TimingWheelHandle:
+        due = self.time() + max(delay, 0.0)
+        tick = math.ceil(round(due * self.ticks_per_second, 6))
+
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = _Bucket()
+            when = tick / self.ticks_per_second
+            if self._clock:
+                bucket.timer = self._clock.call_at(when, self._fire, tick)
+            else:
+                bucket.timer = self._get_loop().call_at(when, self._fire, tick)
+            self.stats.buckets += 1
+
+        handle = TimingWheelHandle(self, tick, callback, args)
+        bucket.handles.append(handle)
+        bucket.live += 1
+
+        stats = self.stats
+        stats.scheduled += 1
+        stats.pending += 1
+        if stats.pending > stats.max_pending:
+            stats.max_pending = stats.pending
+        return handle
+
+    def _cancel(self, handle: TimingWheelHandle):
+        self.stats.pending -= 1
+        self.stats.cancelled += 1
+
+        bucket = self._buckets[handle._tick]
+        bucket.live -= 1
+        if not bucket.live:
+            bucket.timer.cancel()
+            del self._buckets[handle._tick]
+            self.stats.buckets -= 1
+
+    def _fire(self, tick: int):
+        bucket = self._buckets.pop(tick)
+        self.stats.buckets -= 1
+        for handle in bucket.handles:
+            if handle._done:
+                continue
+            handle._done = True
+            self.stats.pending -= 1
+            self.stats.fired += 1
+            try:
+                handle._callback(*handle._args)
+            except Exception:
+                traceback.print_exc()
+
+    def _get_loop(self):
+        if not self._loop:
+            self._loop = asyncio.get_event_loop()
+        return self._loop
+
+
+_wheels: 'weakref.WeakKeyDictionary[Any, TimingWheel]' = weakref.WeakKeyDictionary()
+
+
+def get_timing_wheel(clock: Optional[VirtualClock] = None,
+                     loop: Optional[asyncio.AbstractEventLoop] = None) -> TimingWheel:
+    # Wheels are shared by the clock or the loop, so deliveries to many nodes in a tick share a timer.
+    key = clock or loop or asyncio.get_event_loop()
+    try:
+        return _wheels[key]
+    except KeyError:
+        wheel = _wheels[key] = TimingWheel(clock=clock, loop=None if clock else key)
+        return wheel
@@ -0,0 +1,126 @@
+import asyncio
+import heapq
+import itertools
+import traceback
+from typing import TYPE_CHECKING, Any, Callable, Hashable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from lft.event import EventSimulator
+
+__all__ = ("VirtualClock", "VirtualTimerHandle")
+
+
+class VirtualTimerHandle:
+    def __init__(self, when: float, callback: Callable, args: Tuple[Any, ...]):
+        self._when = when
+        self._callback = callback
+        self._args = args
+        self._cancelled = False
+
+    def when(self) -> float:
+        return self._when
+
+    def cancel(self):
+        self._cancelled = True
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def _run(self):
+        try:
+            self._callback(*self._args)
+        except Exception:
+            traceback.print_exc()
+
+
+class VirtualClock:
+    # Simulated time shared by EventSimulators.
+    # It jumps to the next due timer only when every simulator is idle,
+    # the same moment a real event loop would get a chance to run its timers.
+    # Anything else which will raise events later, e.g. a pending future of a pool, can hold it busy as well.
+
+    def __init__(self, start_time: float = 0.0):
+        self._time = start_time
+        self._timers: List[Tuple[float, int, VirtualTimerHandle]] = []
+        self._sequence = itertools.count()
+
+        self._simulators: List['EventSimulator'] = []
+        self._busy_simulators: Set[Hashable] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def time(self) -> float:
+        return self._time
+
+    def call_later(self, delay: float, callback: Callable, *args) -> VirtualTimerHandle:
+        return self.call_at(self._time + max(delay, 0.0), callback, *args)
+
+    def call_at(self, when: float, callback: Callable, *args) -> VirtualTimerHandle:
+        handle = VirtualTimerHandle(when, callback, args)
+        heapq.heappush(self._timers, (when, next(self._sequence), handle))
+        self.wakeup()
+        return handle
+
+    async def sleep(self, delay: float, result: Any = None):
+        future = asyncio.get_event_loop().create_future()
+        self.call_later(delay, _set_result_unless_done, future, result)
+        return await future
+
+    def add_simulator(self, simulator: 'EventSimulator'):
+        self._simulators.append(simulator)
+
+    def remove_simulator(self, simulator: 'EventSimulator'):
+        self._simulators.remove(simulator)
+        self.set_idle(simulator, True)
+
+    def set_idle(self, simulator: Hashable, idle: bool):
+        if not idle:
+            self._busy_simulators.add(simulator)
+        elif simulator in self._busy_simulators:
+            self._busy_simulators.remove(simulator)
+            if not self._busy_simulators:
+                self.wakeup()
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        if self._task and not self._task.done():
+            return
+        loop = loop or asyncio.get_event_loop()
+        self._task = loop.create_task(self._run())
+
+    def wakeup(self):
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def _run(self):
+        self._wakeup = asyncio.Event()
+        while self._is_running():
+            self._wakeup.clear()
+            if not self._is_idle() or not self._fire_due_timers():
+                await self._wakeup.wait()
+            else:
+                # Let the simulators and the waiters pick up what was fired.
+                await asyncio.sleep(0)
+
+    def _is_running(self):
+        return any(simulator.is_running for simulator in self._simulators)
+
+    def _is_idle(self):
+        return not self._busy_simulators
+
+    def _fire_due_timers(self) -> bool:
+        while self._timers and self._timers[0][-1].cancelled():
+            heapq.heappop(self._timers)
+        if not self._timers:
+            return False
+
+        self._time = max(self._time, self._timers[0][0])
+        while self._timers and self._timers[0][0] <= self._time:
+            _, _, handle = heapq.heappop(self._timers)
+            if not handle.cancelled():
+                handle._run()
+        return True
+
+
+def _set_result_unless_done(future: asyncio.Future, result: Any):
+    if not future.done():
+        future.set_result(result)
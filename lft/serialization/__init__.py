@@ -1,2 +1,3 @@
 from .serializable import Serializable
 from .serializer import Serializer
+from .binary_serializer import BinarySerializer
@@ -0,0 +1,191 @@
+import struct
+from typing import IO, Any, Dict, List, Optional, Tuple
+from lft.serialization import Serializable
+from lft.serialization.serializable import get_type_name
+
+__all__ = ("BinarySerializer", "write_varint", "read_varint", "read_varint_from_io")
+
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_BYTES = 5
+_STR = 6
+_LIST = 7
+_DICT = 8
+_OBJECT = 9
+
+_double = struct.Struct(">d")
+
+
+class BinarySerializer:
+    # Compact counterpart of Serializer.
+    # Type names and dict keys are symbols. A symbol is spelled out the first time
+    # and referred by its index after that, so both sides must handle values in the same order.
+    def __init__(self):
+        self._symbol_ids: Dict[str, int] = {}
+        self._symbols: List[str] = []
+
+    @property
+    def symbols(self) -> Tuple[str, ...]:
+        return tuple(self._symbols)
+
+    @property
+    def symbol_count(self) -> int:
+        return len(self._symbols)
+
+    def serialize(self, value: Any) -> bytes:
+        buffer = bytearray()
+        self._write(buffer, value)
+        return bytes(buffer)
+
+    def deserialize(self, serialized: bytes) -> Any:
+        value, _ = self._read(serialized, 0)
+        return value
+
+    def _write(self, buffer: bytearray, value: Any):
+        if value is None:
+            buffer.append(_NONE)
+        elif value is True:
+            buffer.append(_TRUE)
+        elif value is False:
+            buffer.append(_FALSE)
+        elif isinstance(value, int):
+            buffer.append(_INT)
+            write_varint(buffer, (value << 1) if value >= 0 else ((-value << 1) - 1))
+        elif isinstance(value, float):
+            buffer.append(_FLOAT)
+            buffer += _double.pack(value)
+        elif isinstance(value, bytes):
+            buffer.append(_BYTES)
+            write_varint(buffer, len(value))
+            buffer += value
+        elif isinstance(value, str):
+            buffer.append(_STR)
+            encoded = value.encode()
+            write_varint(buffer, len(encoded))
+            buffer += encoded
+        elif isinstance(value, (list, tuple)):
+            buffer.append(_LIST)
+            write_varint(buffer, len(value))
+            for item in value:
+                self._write(buffer, item)
+        elif isinstance(value, dict):
+            buffer.append(_DICT)
+            self._write_items(buffer, value)
+        elif isinstance(value, Serializable):
+            buffer.append(_OBJECT)
+            self._write_symbol(buffer, get_type_name(value.__class__))
+            self._write_items(buffer, value._serialize())
+        else:
+            raise TypeError(f"Object of type {value.__class__.__name__} is not serializable")
+
+    def _write_items(self, buffer: bytearray, items: dict):
+        write_varint(buffer, len(items))
+        for k, v in items.items():
+            self._write_symbol(buffer, k)
+            self._write(buffer, v)
+
+    def _write_symbol(self, buffer: bytearray, symbol: str):
+        try:
+            write_varint(buffer, self._symbol_ids[symbol] << 1)
+        except KeyError:
+            symbol_id = self._symbol_ids[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+
+            encoded = symbol.encode()
+            write_varint(buffer, (symbol_id << 1) | 1)
+            write_varint(buffer, len(encoded))
+            buffer += encoded
+
+    def _read(self, buffer: bytes, offset: int) -> Tuple[Any, int]:
+        tag = buffer[offset]
+        offset += 1
+        if tag == _NONE:
+            return None, offset
+        elif tag == _TRUE:
+            return True, offset
+        elif tag == _FALSE:
+            return False, offset
+        elif tag == _INT:
+            zigzag, offset = read_varint(buffer, offset)
+            return (zigzag >> 1) if not zigzag & 1 else -((zigzag + 1) >> 1), offset
+        elif tag == _FLOAT:
+            return _double.unpack_from(buffer, offset)[0], offset + _double.size
+        elif tag == _BYTES:
+            length, offset = read_varint(buffer, offset)
+            return bytes(buffer[offset:offset + length]), offset + length
+        elif tag == _STR:
+            length, offset = read_varint(buffer, offset)
+            return bytes(buffer[offset:offset + length]).decode(), offset + length
+        elif tag == _LIST:
+            length, offset = read_varint(buffer, offset)
+            items = []
+            for _ in range(length):
+                item, offset = self._read(buffer, offset)
+                items.append(item)
+            return items, offset
+        elif tag == _DICT:
+            return self._read_items(buffer, offset)
+        elif tag == _OBJECT:
+            type_name, offset = self._read_symbol(buffer, offset)
+            data, offset = self._read_items(buffer, offset)
+            return Serializable.types[type_name]._deserialize(**data), offset
+        else:
+            raise ValueError(f"Unknown tag {tag} at {offset - 1}")
+
+    def _read_items(self, buffer: bytes, offset: int) -> Tuple[dict, int]:
+        length, offset = read_varint(buffer, offset)
+        items = {}
+        for _ in range(length):
+            k, offset = self._read_symbol(buffer, offset)
+            items[k], offset = self._read(buffer, offset)
+        return items, offset
+
+    def _read_symbol(self, buffer: bytes, offset: int) -> Tuple[str, int]:
+        symbol_ref, offset = read_varint(buffer, offset)
+        symbol_id = symbol_ref >> 1
+        if symbol_ref & 1:
+            length, offset = read_varint(buffer, offset)
+            symbol = bytes(buffer[offset:offset + length]).decode()
+            offset += length
+            if symbol_id == len(self._symbols):
+                self._symbol_ids[symbol] = symbol_id
+                self._symbols.append(symbol)
+            elif self._symbols[symbol_id] != symbol:
+                raise ValueError(f"Symbol conflict {symbol_id}: {self._symbols[symbol_id]} / {symbol}")
+            return symbol, offset
+        return self._symbols[symbol_id], offset
+
+
+def write_varint(buffer: bytearray, value: int):
+    while value > 0x7f:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(buffer: bytes, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def read_varint_from_io(io: IO) -> Optional[int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = io.read(1)
+        if not byte:
+            return None
+        value |= (byte[0] & 0x7f) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
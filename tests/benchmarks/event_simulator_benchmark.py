@@ -0,0 +1,138 @@
+import argparse
+import asyncio
+import logging
+import time
+from types import MethodType
+from lft.app import InstantApp
+from lft.event import AnyEvent, Event, EventSimulator
+
+
+class BaselineEventQueue:
+    # The scheduler before EventQueue, asyncio.PriorityQueue keyed by (not deterministic, time).
+    # The consumer awaits get() once per event.
+    def __init__(self):
+        self._queue = asyncio.PriorityQueue()
+        self._deterministic_count = 0
+
+    def __len__(self):
+        return self._queue.qsize()
+
+    def empty(self):
+        return self._queue.empty()
+
+    def has_deterministic(self):
+        return self._deterministic_count > 0
+
+    def put(self, event: Event):
+        self._deterministic_count += event.deterministic
+        self._queue.put_nowait((not event.deterministic, time.perf_counter(), event))
+
+    async def get(self):
+        event = (await self._queue.get())[-1]
+        if event is not None:
+            self._deterministic_count -= event.deterministic
+        return event
+
+    def clear(self):
+        # In place, the consumer may be waiting on the queue.
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._deterministic_count = 0
+
+    def wakeup(self):
+        self._queue.put_nowait((False, 0.0, None))
+
+
+async def _execute_events_baseline(simulator: EventSimulator):
+    queue = simulator._event_tasks
+    while simulator._running:
+        if queue.empty():
+            if simulator._stop_when_idle:
+                simulator.stop()
+                break
+            if simulator.clock:
+                simulator.clock.set_idle(simulator, True)
+        try:
+            event = await queue.get()
+        except RuntimeError:
+            break
+        if event is None:
+            continue
+
+        simulator._executing = True
+        try:
+            await simulator._execute_event(event)
+        finally:
+            simulator._executing = False
+
+
+def use_baseline(simulator: EventSimulator):
+    simulator._event_tasks = BaselineEventQueue()
+    simulator.execute_events = MethodType(_execute_events_baseline, simulator)
+
+
+def benchmark(node_num: int, duration: float, virtual_clock: bool, baseline: bool) -> float:
+    app = InstantApp(node_num, virtual_clock=virtual_clock)
+    app.nodes = app._gen_nodes()
+    app._connect_nodes()
+
+    counter = [0]
+
+    def _count(event):
+        counter[0] += 1
+
+    for node in app.nodes:
+        node.logger.setLevel(logging.WARNING)
+        node.event_system.simulator.register_handler(AnyEvent, _count)
+        if baseline:
+            use_baseline(node.event_system.simulator)
+
+    loop = asyncio.get_event_loop()
+    start_time = time.perf_counter()
+    app._start(app.nodes)
+    loop.run_until_complete(app.clock.sleep(duration) if app.clock else asyncio.sleep(duration))
+    elapsed = time.perf_counter() - start_time
+
+    for node in app.nodes:
+        node.close()
+    loop.run_until_complete(asyncio.sleep(0.01))  # Let the simulators finish
+
+    events_per_sec = counter[0] / elapsed
+    commits = min(len(node.commit_datums) for node in app.nodes)
+    print(f"nodes={node_num:<3} clock={'virtual' if virtual_clock else 'real':<7} "
+          f"scheduler={'baseline' if baseline else 'current':<8} duration={duration:g}s wall={elapsed:.2f}s "
+          f"events={counter[0]} events/sec={events_per_sec:.0f} commits={commits}")
+    return events_per_sec
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", "-n", type=int, nargs="+", default=[4, 64],
+                        help="Number of nodes, (default: %(default)s)")
+    parser.add_argument("--duration", "-d", type=float, default=None,
+                        help="Virtual seconds to run on the virtual clock, (default: 1200 / number of nodes)")
+    parser.add_argument("--real-duration", "-r", type=float, default=5.0,
+                        help="Seconds to run on the real clock, (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per case, events/sec is averaged, (default: %(default)s)")
+    args = parser.parse_args()
+
+    results = []
+    for node_num in args.number:
+        virtual_duration = args.duration or 1200 / node_num
+        for virtual_clock, duration in ((True, virtual_duration), (False, args.real_duration)):
+            # Interleaved, so both schedulers see the same warm-up and noise
+            runs = [tuple(benchmark(node_num, duration, virtual_clock, baseline) for baseline in (True, False))
+                    for _ in range(args.repeat)]
+            baseline, current = (sum(events_per_sec) / args.repeat for events_per_sec in zip(*runs))
+            results.append((node_num, virtual_clock, baseline, current))
+
+    print()
+    print(f"{'nodes':<6} {'clock':<8} {'baseline':>10} {'current':>10} {'change':>8}")
+    for node_num, virtual_clock, baseline, current in results:
+        print(f"{node_num:<6} {'virtual' if virtual_clock else 'real':<8} "
+              f"{baseline:>10.0f} {current:>10.0f} {(current / baseline - 1) * 100:>+7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import asyncio
+import time
+from lft.app.data import DefaultData, DefaultDataFactory
+from lft.app.epoch import RotateEpoch
+from lft.app.vote import DefaultVoteFactory
+from lft.consensus import Consensus
+from lft.consensus.admission import AdmissionResult
+from lft.consensus.exceptions import InvalidEpoch, InvalidVoter
+from lft.event import EventSystem
+from lft.event.mediators import DelayedEventMediator
+
+
+async def setup_consensus(voter_num: int):
+    voters = [bytes([x]) for x in range(voter_num)]
+    event_system = EventSystem()
+    event_system.set_mediator(DelayedEventMediator)
+    event_system.get_mediator(DelayedEventMediator).switch_instant(event_system.simulator)
+    consensus = Consensus(event_system, voters[0], DefaultDataFactory(voters[0]), DefaultVoteFactory(voters[0]))
+
+    genesis_data = DefaultData(id_=b"genesis", prev_id=b"", proposer_id=b"",
+                               number=0, epoch_num=0, round_num=0, prev_votes=[])
+    await consensus.initialize(commit_id=genesis_data.prev_id, epoch_pool=[RotateEpoch(0, []), RotateEpoch(1, voters)],
+                               data_pool=[genesis_data], vote_pool=[])
+    await consensus.round_start(RotateEpoch(1, voters), 0)
+    return consensus, voters, genesis_data
+
+
+def measure(name: str, count: int, func):
+    start_time = time.perf_counter()
+    for _ in range(count):
+        func()
+    _report(name, count, time.perf_counter() - start_time)
+
+
+async def measure_async(name: str, count: int, func):
+    start_time = time.perf_counter()
+    for _ in range(count):
+        await func()
+    _report(name, count, time.perf_counter() - start_time)
+
+
+def _report(name: str, count: int, elapsed: float):
+    print(f"{name:<24} {elapsed / count * 1_000_000:.2f}us")
+
+
+async def benchmark(count: int):
+    consensus, voters, genesis_data = await setup_consensus(4)
+    round_ = consensus._round_pool.get_round(1, 0)
+
+    vote = await DefaultVoteFactory(voters[1]).create_vote(b"data", genesis_data.id, 1, 0)
+    await consensus.receive_vote(vote)
+    invalid_voter_vote = await DefaultVoteFactory(b"invalid").create_vote(b"data", genesis_data.id, 1, 0)
+    invalid_epoch_vote = await DefaultVoteFactory(voters[1]).create_vote(b"data", genesis_data.id, 3, 0)
+
+    def check_and_raise(vote_):
+        # The way the rejection was signaled before, the same checks but raised and caught
+        try:
+            result = consensus._check_acceptable_vote(vote_)
+            if result == AdmissionResult.INVALID_VOTER:
+                raise InvalidVoter(vote_.voter_id, bytes(0))
+            if result == AdmissionResult.INVALID_EPOCH:
+                raise InvalidEpoch(vote_.epoch_num, 1)
+        except (InvalidVoter, InvalidEpoch):
+            pass
+
+    measure("check invalid voter", count, lambda: consensus._check_acceptable_vote(invalid_voter_vote))
+    measure("raise invalid voter", count, lambda: check_and_raise(invalid_voter_vote))
+    measure("check invalid epoch", count, lambda: consensus._check_acceptable_vote(invalid_epoch_vote))
+    measure("raise invalid epoch", count, lambda: check_and_raise(invalid_epoch_vote))
+    measure("check valid vote", count, lambda: consensus._check_acceptable_vote(vote))
+    await measure_async("invalid voter", count, lambda: consensus.receive_vote(invalid_voter_vote))
+    await measure_async("invalid epoch", count, lambda: consensus.receive_vote(invalid_epoch_vote))
+    await measure_async("duplicated vote", count, lambda: consensus.receive_vote(vote))
+    await measure_async("already voted in round", count, lambda: round_.receive_vote(vote))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", "-c", type=int, default=100_000,
+                        help="Number of rejections per case, (default: %(default)s)")
+    args = parser.parse_args()
+
+    asyncio.get_event_loop().run_until_complete(benchmark(args.count))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,8 @@ from typing import Optional
 
 import pytest
 
-from lft.app import RecordApp
+from lft.app import InstantApp, RecordApp
+from lft.consensus.events import ReceiveVotesEvent
 from lft.consensus.messages.data import Data
 from tests.byzantine.double_propoer import DoubleProposer
 from tests.byzantine.double_voter import DoubleVoter
@@ -91,6 +92,62 @@ async def test_run_networks_with_byzantine_and_stop_network_and_restore_network_
     await verify_commit_datums(non_fault_nodes, max(second_min_num, commit_number))
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("node_num,duration,min_data_number", [(4, 1000, 500), (7, 300, 150)])
+async def test_run_nodes_on_virtual_clock(node_num, duration, min_data_number):
+    app = InstantApp(node_num, virtual_clock=True)
+    app.nodes = app._gen_nodes()
+    app._connect_nodes()
+
+    app._start(app.nodes)
+    await app.clock.sleep(duration)
+
+    await close_nodes(app.nodes)
+    await verify_commit_datums(app.nodes, min_data_number)
+
+
+@pytest.mark.asyncio
+async def test_run_nodes_on_virtual_clock_with_vote_batch():
+    app = InstantApp(7, virtual_clock=True, vote_batch_size=4)
+    app.nodes = app._gen_nodes()
+    app._connect_nodes()
+
+    batch_sizes = []
+    for node in app.nodes:
+        consensus = node._consensus
+
+        async def _votes_verified(votes, results, votes_verified=consensus.votes_verified):
+            batch_sizes.append(len(votes))
+            await votes_verified(votes, results)
+        consensus.votes_verified = _votes_verified
+
+    app._start(app.nodes)
+    await app.clock.sleep(300)
+
+    await close_nodes(app.nodes)
+    await verify_commit_datums(app.nodes, 150)
+    assert max(batch_sizes) > 1
+
+
+@pytest.mark.asyncio
+async def test_run_nodes_on_virtual_clock_with_received_votes():
+    app = InstantApp(7, virtual_clock=True)
+    app.nodes = app._gen_nodes()
+    app._connect_nodes()
+
+    received_sizes = []
+    for node in app.nodes:
+        node.event_system.simulator.register_handler(
+            ReceiveVotesEvent, lambda event: received_sizes.append(len(event.votes)))
+
+    app._start(app.nodes)
+    await app.clock.sleep(300)
+
+    await close_nodes(app.nodes)
+    await verify_commit_datums(app.nodes, 150)
+    assert max(received_sizes) > 1
+
+
 async def verify_commit_datums(nodes, expected_number):
     min_commit = (99, 9999999999)
     max_commit = (99, 0)
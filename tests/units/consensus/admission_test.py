@@ -0,0 +1,60 @@
+import pytest
+
+from lft.app.data import DefaultData
+from lft.consensus.events import ReceiveDataEvent, ReceiveVoteEvent
+from tests.units.consensus.setup_consensus import setup_consensus
+
+
+@pytest.mark.asyncio
+async def test_admit_duplicated_messages():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    data = DefaultData(
+        id_=b"data",
+        prev_id=genesis_data.id,
+        proposer_id=voters[0],
+        number=1,
+        epoch_num=1,
+        round_num=0,
+        prev_votes=[]
+    )
+    vote = await vote_factories[1].create_vote(data.id, genesis_data.id, 1, 0)
+    invalid_vote = await vote_factories[1].create_vote(data.id, genesis_data.id, 3, 0)
+
+    # WHEN
+    for message in (data, vote, invalid_vote):
+        assert _admit(consensus, message)
+    await consensus.receive_data(data)
+    await consensus.receive_vote(vote)
+    await consensus.receive_vote(invalid_vote)
+
+    # THEN
+    assert not _admit(consensus, data)
+    assert not _admit(consensus, vote)
+    assert _admit(consensus, invalid_vote)  # Not accepted, it may be acceptable later
+    assert consensus._admission.stats.duplicated == 2
+    assert consensus._admission.stats.admitted == 4
+
+
+@pytest.mark.asyncio
+async def test_admit_stale_messages():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    consensus._admission.watermark = (1, 2)
+
+    # WHEN
+    stale_vote = await vote_factories[1].create_vote(b"data", genesis_data.id, 1, 2)
+    vote = await vote_factories[1].create_vote(b"data", genesis_data.id, 1, 3)
+
+    # THEN
+    assert not _admit(consensus, stale_vote)
+    assert _admit(consensus, vote)
+    assert consensus._admission.stats.stale == 1
+    assert consensus._admission.stats.dropped == 1
+
+
+def _admit(consensus, message):
+    if isinstance(message, DefaultData):
+        return consensus._admit_receive_data(ReceiveDataEvent(message))
+    else:
+        return consensus._admit_receive_vote(ReceiveVoteEvent(message))
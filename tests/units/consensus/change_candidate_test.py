@@ -129,6 +129,40 @@ async def test_candidate_change_recursively():
     verify_round_end_event(round_end_event12, data12)
 
 
+@pytest.mark.asyncio
+async def test_candidate_change_long_connected_chain():
+    event_system, consensus, genesis_data = await setup_consensus()
+
+    datums = []
+    candidate = genesis_data
+    for round_num in range(1000):
+        candidate = await new_data(consensus=consensus,
+                                   candidate=candidate,
+                                   new_epoch_num=1,
+                                   new_round_num=round_num)
+        datums.append(candidate)
+
+    for data in reversed(datums[1:]):
+        await receive_data(consensus, data)
+    event_system.simulator.raise_event.assert_not_called()
+
+    advanced = []
+    advance_candidate = consensus._advance_candidate
+
+    async def _advance_candidate():
+        advanced.append(await advance_candidate())
+        return advanced[-1]
+    consensus._advance_candidate = _advance_candidate
+
+    await receive_data(consensus, datums[0])
+    assert advanced == [len(datums) - 1]
+    assert len(event_system.simulator.raise_event.call_args_list) == len(datums) - 1
+
+    last_round_end_event = event_system.simulator.raise_event.call_args_list[-1][0][0]
+    verify_round_end_event(last_round_end_event, datums[-2])
+    assert consensus._get_candidate_round().num == datums[-2].round_num
+
+
 async def new_data(consensus: Consensus, candidate: Data, new_epoch_num: int, new_round_num: int):
     epoch = consensus._epoch_pool.get_epoch(new_epoch_num)
     proposer = epoch.get_proposer_id(new_round_num)
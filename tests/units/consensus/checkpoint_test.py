@@ -0,0 +1,31 @@
+import pytest
+from lft.consensus import Consensus
+from .change_candidate_test import (setup_consensus, new_and_receive_data, new_and_receive_votes,
+                                    verify_round_end_event)
+
+
+@pytest.mark.asyncio
+async def test_consensus_restore():
+    event_system, consensus, genesis_data = await setup_consensus()
+
+    # Genesis(E0R0) -> Data10(E1R0)
+    data10 = await new_and_receive_data(consensus=consensus,
+                                        candidate=genesis_data,
+                                        new_epoch_num=1,
+                                        new_round_num=0)
+    snapshot = consensus.snapshot()
+
+    restored = Consensus(event_system, node_id=consensus._node_id,
+                         data_factory=consensus._data_factory,
+                         vote_factory=consensus._vote_factory)
+    restored.restore(snapshot)
+    assert restored._data_pool.get_data(data10.id) == data10
+    assert restored._epoch_pool.get_epoch(1) == consensus._epoch_pool.get_epoch(1)
+    event_system.simulator.raise_event.assert_not_called()
+
+    await new_and_receive_votes(consensus=restored,
+                                data=data10)
+    event_system.simulator.raise_event.assert_called_once()
+
+    round_end_event = event_system.simulator.raise_event.call_args_list[0][0][0]
+    verify_round_end_event(round_end_event, data10)
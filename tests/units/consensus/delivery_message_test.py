@@ -2,7 +2,8 @@ from typing import Tuple, List
 
 import pytest
 
-from lft.app.data import DefaultData
+from lft.app.data import DefaultData, DefaultDataFactory
+from lft.app.vote import DefaultVoteFactory
 from lft.consensus.messages.data import Data
 from lft.consensus.messages.vote import Vote, VoteFactory
 from tests.units.consensus.setup_consensus import setup_consensus
@@ -31,13 +32,17 @@ async def test_delivery_message():
         assert consensus._data_pool.get_data(data.id) == data
         for vi, vote in enumerate(votes):
             assert vote == consensus._vote_pool.get_vote(vote.id)
-            assert vote == round_.receive_vote.call_args_list[vi][0][0]
+            assert vote == received_votes(round_)[vi]
 
         if i != 0:
             prev_round = consensus._round_pool.get_round(epoch.num, i -1)
             for vi, vote in enumerate(data.prev_votes):
                 assert vote == consensus._vote_pool.get_vote(vote.id)
-                assert vote == prev_round.receive_vote.call_args_list[vi][0][0]
+                assert vote == received_votes(prev_round)[vi]
+
+
+def received_votes(round_) -> List[Vote]:
+    return [vote for call_args in round_.receive_votes.call_args_list for vote in call_args[0][0]]
 
 
 async def create_sample_items_by_index(index: int, vote_factories: List[VoteFactory],
@@ -64,3 +69,24 @@ async def create_sample_items_by_index(index: int, vote_factories: List[VoteFact
     votes = [await vote_factory.create_vote(data_id, prev_id, 1, index) for vote_factory in vote_factories]
 
     return data, votes
+
+
+@pytest.mark.asyncio
+async def test_delivery_prev_votes_certificate():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    consensus._vote_factory = DefaultVoteFactory(voters[0])
+    prev_votes = [await vote_factory.create_vote(genesis_data.id, bytes(16), 1, 0)
+                  for vote_factory in vote_factories[1:]]
+
+    # WHEN
+    data_factory = DefaultDataFactory(voters[1], compact_prev_votes=True)
+    data = await data_factory.create_data(1, genesis_data.id, 1, 1, [None] + prev_votes)
+    await consensus.receive_data(data)
+
+    # THEN
+    assert data.prev_votes_certificate
+    prev_round = consensus._round_pool.get_round(epoch.num, 0)
+    assert received_votes(prev_round) == prev_votes
+    for vote in prev_votes:
+        assert vote == consensus._vote_pool.get_vote(vote.id)
@@ -2,7 +2,7 @@ import pytest
 import random
 from mock import MagicMock
 from lft.app.data import DefaultDataFactory, DefaultData
-from lft.app.vote import DefaultVoteFactory, DefaultVote
+from lft.app.vote import DefaultVoteFactory, DefaultVote, DefaultVoteVerifier
 from lft.app.epoch import RotateEpoch
 from lft.consensus import Consensus
 from lft.consensus.events import RoundEndEvent
@@ -131,6 +131,7 @@ async def setup_consensus():
     event_system = MagicMock(EventSystem())
     data_factory = MagicMock(DefaultDataFactory(node_id))
     vote_factory = MagicMock(DefaultVoteFactory(node_id))
+    vote_factory.create_vote_verifier.return_value = DefaultVoteVerifier()
     consensus = Consensus(event_system, node_id=node_id, data_factory=data_factory, vote_factory=vote_factory)
     return event_system, consensus
 
@@ -18,6 +18,7 @@ class RoundMock(Round):
         self._event_system = MagicMock()
         self._data_factory = MagicMock()
         self._vote_factory = MagicMock()
+        self._timers = []
 
         self._logger = MagicMock()
         self._messages = MagicMock()
@@ -26,4 +27,5 @@ class RoundMock(Round):
 
         self.round_start = AsyncMock()
         self.receive_vote = AsyncMock()
+        self.receive_votes = AsyncMock()
         self.receive_data = AsyncMock()
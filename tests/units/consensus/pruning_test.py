@@ -0,0 +1,58 @@
+import pytest
+from lft.consensus.events import PruneMessagesEvent, RoundEndEvent
+from .change_candidate_test import setup_consensus, new_and_receive_data, new_and_receive_votes
+
+
+@pytest.mark.asyncio
+async def test_prune_stats():
+    event_system, consensus, genesis_data = await setup_consensus()
+
+    data10 = await new_and_receive_data(consensus, genesis_data, 1, 0)
+    await new_and_receive_votes(consensus, data10)
+    data11 = await new_and_receive_data(consensus, data10, 1, 1)
+    await new_and_receive_votes(consensus, data11)
+
+    prune_stats = consensus.prune_stats
+    assert prune_stats.prunes > 0
+    assert prune_stats.deferred == 0
+    assert prune_stats.messages_before.datums == 3
+    assert prune_stats.messages_after.datums == 2
+    assert prune_stats.messages_after.votes == len(consensus._vote_pool)
+    assert prune_stats.rounds_before.rounds == 2
+    assert prune_stats.rounds_after.rounds == len(consensus._round_pool) == 1
+    assert genesis_data.id not in consensus._data_pool
+
+
+@pytest.mark.asyncio
+async def test_deferred_pruning():
+    event_system, consensus, genesis_data = await setup_consensus()
+    consensus._deferred_pruning = True
+
+    data10 = await new_and_receive_data(consensus, genesis_data, 1, 0)
+    await new_and_receive_votes(consensus, data10)
+    data11 = await new_and_receive_data(consensus, data10, 1, 1)
+    await new_and_receive_votes(consensus, data11)
+
+    # THEN messages are not pruned yet
+    assert genesis_data.id in consensus._data_pool
+    assert consensus.prune_stats.deferred == 2
+    assert consensus.prune_stats.rounds_after.rounds == len(consensus._round_pool)
+    assert consensus.prune_stats.messages_after.datums == 0
+
+    events = [call[0][0] for call in event_system.simulator.raise_event.call_args_list]
+    prune_events = [event for event in events if isinstance(event, PruneMessagesEvent)]
+    assert prune_events == [PruneMessagesEvent(genesis_data.epoch_num, genesis_data.round_num),
+                            PruneMessagesEvent(data10.epoch_num, data10.round_num)]
+    assert all(event.deterministic for event in prune_events)
+    assert isinstance(events[-2], RoundEndEvent)
+
+    # WHEN
+    for event in prune_events:
+        await consensus._on_event_prune_messages(event)
+
+    # THEN
+    assert genesis_data.id not in consensus._data_pool
+    assert data10.id in consensus._data_pool
+    assert consensus.prune_stats.messages_before.datums == 3
+    assert consensus.prune_stats.messages_after.datums == 2
+    assert consensus.prune_stats.rounds_after.rounds == len(consensus._round_pool)
@@ -3,7 +3,7 @@ from functools import partial
 
 from lft.app.data import DefaultData, DefaultDataFactory
 from lft.app.epoch import RotateEpoch
-from lft.app.vote import DefaultVoteFactory
+from lft.app.vote import DefaultVoteFactory, DefaultVoteVerifier
 from lft.consensus import Consensus
 from lft.event import EventSystem
 from tests.units.consensus.mocks import RoundMock
@@ -23,6 +23,7 @@ async def setup_consensus():
     event_system = MagicMock(EventSystem())
     data_factory = MagicMock(DefaultDataFactory(voters[0]))
     vote_factory = MagicMock(DefaultVoteFactory(voters[0]))
+    vote_factory.create_vote_verifier.return_value = DefaultVoteVerifier()
     consensus = Consensus(event_system,
                           voters[0],
                           data_factory,
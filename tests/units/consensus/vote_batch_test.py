@@ -0,0 +1,187 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from mock import AsyncMock
+
+from lft.app.data import DefaultData
+from lft.consensus.events import VoteBatchTimeoutEvent, VotesVerifiedEvent, ReceiveVotesEvent
+from lft.event.mediators import ExecutorEventMediator
+from tests.units.consensus.setup_consensus import setup_consensus
+
+
+@pytest.mark.asyncio
+async def test_vote_batch_flushed_on_size():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    consensus._vote_batch_size = 3
+    verify_batch = mocking_vote_verifier(consensus, invalid_voter=voters[1])
+    votes = [await vote_factory.create_vote(b"data", genesis_data.id, 1, 0) for vote_factory in vote_factories]
+
+    # WHEN
+    await consensus.receive_vote(votes[0])
+    await consensus.receive_vote(votes[1])
+
+    # THEN
+    assert verify_batch.call_count == 0
+    assert not consensus._vote_pool.get_votes(1, 0)
+
+    mediator = consensus._event_system.get_mediator.return_value
+    delay, event = mediator.execute.call_args[0]
+    assert delay == consensus._vote_batch_delay
+    assert isinstance(event, VoteBatchTimeoutEvent)
+    assert not event.deterministic
+
+    # WHEN
+    await consensus.receive_vote(votes[2])
+
+    # THEN
+    verify_batch.assert_called_once_with(votes[:3])
+    mediator.execute.return_value.cancel.assert_called_once()
+    assert set(consensus._vote_pool.get_votes(1, 0)) == {votes[0], votes[2]}
+
+
+@pytest.mark.asyncio
+async def test_vote_batch_flushed_on_timeout():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    consensus._vote_batch_size = 3
+    verify_batch = mocking_vote_verifier(consensus)
+    vote = await vote_factories[1].create_vote(b"data", genesis_data.id, 1, 0)
+    await consensus.receive_vote(vote)
+
+    # WHEN
+    await consensus._on_event_vote_batch_timeout(VoteBatchTimeoutEvent())
+
+    # THEN
+    verify_batch.assert_called_once_with([vote])
+    assert tuple(consensus._vote_pool.get_votes(1, 0)) == (vote, )
+
+
+@pytest.mark.asyncio
+async def test_vote_batch_flushed_with_prev_votes():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    consensus._vote_batch_size = 10
+    verify_batch = mocking_vote_verifier(consensus)
+    pending_vote = await vote_factories[0].create_vote(b"other", genesis_data.id, 1, 0)
+    await consensus.receive_vote(pending_vote)
+
+    # WHEN
+    prev_votes = [await vote_factory.create_vote(genesis_data.id, bytes(16), 0, 0)
+                  for vote_factory in vote_factories]
+    data = DefaultData(
+        id_=b"data",
+        prev_id=genesis_data.id,
+        proposer_id=voters[0],
+        number=1,
+        epoch_num=1,
+        round_num=0,
+        prev_votes=prev_votes
+    )
+    await consensus.receive_data(data)
+
+    # THEN
+    verify_batch.assert_called_once_with([pending_vote] + prev_votes)
+    assert not consensus._vote_batch
+
+
+def mocking_vote_verifier(consensus, invalid_voter: bytes = None):
+    async def _verify_batch(votes):
+        return [vote.voter_id != invalid_voter for vote in votes]
+
+    verify_batch = AsyncMock(side_effect=_verify_batch)
+    consensus._vote_factory.create_vote_verifier.return_value.verify_batch = verify_batch
+    return verify_batch
+
+
+@pytest.mark.asyncio
+async def test_vote_batch_verified_in_pool():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    consensus._verify_pool = ThreadPoolExecutor(1)
+    mediator = consensus._event_system.get_mediator.return_value
+    mediator.execute_verify_batch.side_effect = partial(ExecutorEventMediator.execute_verify_batch, mediator)
+    vote = await vote_factories[1].create_vote(b"data", genesis_data.id, 1, 0)
+
+    # WHEN
+    await consensus.receive_vote(vote)
+
+    # THEN
+    assert not consensus._vote_pool.get_votes(1, 0)
+
+    pool, func, event_factory = mediator.execute.call_args[0]
+    assert pool is consensus._verify_pool
+
+    # WHEN
+    event = event_factory(pool.submit(func).result())
+    await consensus._on_event_votes_verified(event)
+
+    # THEN
+    assert isinstance(event, VotesVerifiedEvent)
+    assert not event.deterministic
+    assert event.verified == [True]
+    assert tuple(consensus._vote_pool.get_votes(1, 0)) == (vote, )
+
+
+@pytest.mark.asyncio
+async def test_accepted_vote_not_verified_again():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    verify_batch = mocking_vote_verifier(consensus)
+    vote = await vote_factories[1].create_vote(b"data", genesis_data.id, 1, 0)
+    await consensus.receive_vote(vote)
+
+    # WHEN
+    await consensus.receive_vote(vote)
+    await consensus.receive_data(DefaultData(
+        id_=b"next",
+        prev_id=b"data",
+        proposer_id=voters[1],
+        number=2,
+        epoch_num=1,
+        round_num=1,
+        prev_votes=[vote]
+    ))
+
+    # THEN
+    verify_batch.assert_called_once_with([vote])
+    assert consensus._vote_cache.stats.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_receive_votes_round_by_round():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    verify_batch = mocking_vote_verifier(consensus, invalid_voter=voters[3])
+    votes0 = [await vote_factory.create_vote(b"data0", genesis_data.id, 1, 0) for vote_factory in vote_factories]
+    votes1 = [await vote_factory.create_vote(b"data1", genesis_data.id, 1, 1) for vote_factory in vote_factories]
+    votes = [vote for pair in zip(votes0, votes1) for vote in pair]
+
+    # WHEN
+    await consensus.receive_votes(votes + votes0[:1])
+
+    # THEN
+    verify_batch.assert_called_once_with(votes + votes0[:1])
+    round0 = consensus._round_pool.get_round(1, 0)
+    round0.receive_votes.assert_called_once_with(votes0[:3])
+    round1 = consensus._round_pool.get_round(1, 1)
+    round1.receive_votes.assert_called_once_with(votes1[:3])
+    round0.receive_vote.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_receive_votes_event_admits_each_vote():
+    # GIVEN
+    consensus, voters, vote_factories, epoch, genesis_data = await setup_consensus()
+    verify_batch = mocking_vote_verifier(consensus)
+    votes = [await vote_factory.create_vote(b"data", genesis_data.id, 1, 0) for vote_factory in vote_factories]
+    await consensus.receive_vote(votes[0])
+    verify_batch.reset_mock()
+
+    # WHEN
+    await consensus._on_event_receive_votes(ReceiveVotesEvent(votes))
+
+    # THEN
+    verify_batch.assert_called_once_with(votes[1:])
+    assert consensus._admission.stats.duplicated == 1
+    assert set(consensus._vote_pool.get_votes(1, 0)) == set(votes)
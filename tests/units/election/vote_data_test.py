@@ -1,8 +1,11 @@
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from lft.app.data import DefaultData
 from lft.app.vote import DefaultVoteFactory
-from lft.consensus.events import RoundEndEvent
+from lft.consensus.events import RoundEndEvent, BroadcastVoteEvent, ReceiveVoteEvent, DataVerifiedEvent
+from lft.event.mediators import ExecutorEventMediator
 from tests.units.election.setup_election import setup_election, CANDIDATE_ID, LEADER_ID
 
 PEER_NUM = 7
@@ -65,6 +68,72 @@ async def test_not_determinative_to_determinative(additional_success_num, additi
     assert election.result_id == expected_result
 
 
+@pytest.mark.asyncio
+async def test_vote_after_data_verified_in_pool():
+    # GIVEN
+    event_system, election, voters = await setup_election(PEER_NUM)
+    election._verify_pool = ThreadPoolExecutor(1)
+    mediator = event_system.get_mediator.return_value
+    mediator.execute_verify_batch.side_effect = partial(ExecutorEventMediator.execute_verify_batch, mediator)
+    await election.round_start()
+    event_system.simulator.raise_event.reset_mock()
+
+    # WHEN
+    await election.receive_data(data=DefaultData(
+        id_=PROPOSE_ID,
+        prev_id=CANDIDATE_ID,
+        proposer_id=LEADER_ID,
+        number=1,
+        epoch_num=0,
+        round_num=1,
+        prev_votes=[]
+    ))
+
+    # THEN
+    event_system.simulator.raise_event.assert_not_called()
+    pool, func, event_factory = mediator.execute.call_args[0]
+
+    # WHEN
+    event = event_factory(pool.submit(func).result())
+    assert isinstance(event, DataVerifiedEvent)
+    assert not event.deterministic
+    assert event.verified
+    await election.data_verified(event.data, event.verified)
+
+    # THEN
+    broadcast_vote = event_system.simulator.raise_event.call_args_list[0][0][0]
+    assert isinstance(broadcast_vote, BroadcastVoteEvent)
+    assert broadcast_vote.vote.data_id == PROPOSE_ID
+
+
+@pytest.mark.asyncio
+async def test_no_vote_after_round_end_in_pool():
+    # GIVEN
+    event_system, election, voters = await setup_election(PEER_NUM)
+    election._verify_pool = ThreadPoolExecutor(1)
+    await election.round_start()
+    data = DefaultData(
+        id_=PROPOSE_ID,
+        prev_id=CANDIDATE_ID,
+        proposer_id=LEADER_ID,
+        number=1,
+        epoch_num=0,
+        round_num=1,
+        prev_votes=[]
+    )
+    await election.receive_data(data=data)
+
+    # WHEN the round ends before the data is verified
+    await do_votes(election, 0, 5, 0, voters)
+    assert election.is_ended
+    event_system.simulator.raise_event.reset_mock()
+    await election.data_verified(data, True)
+
+    # THEN
+    events = [call[0][0] for call in event_system.simulator.raise_event.call_args_list]
+    assert not any(isinstance(event, (BroadcastVoteEvent, ReceiveVoteEvent)) for event in events)
+
+
 async def set_election_for_receive_vote():
     event_system, election, voters = await setup_election(PEER_NUM)
     await election.round_start()
@@ -19,6 +19,29 @@ async def test_round_success():
     assert candidate.proposer_id == voters[0]
 
 
+@pytest.mark.asyncio
+async def test_quorum_reached_once():
+    epoch, round_num, election_messages, data, voters = await setup()
+
+    # Votes before the data are counted when the data comes.
+    other_data = await DefaultDataFactory(voters[1]).create_data(1, b'', epoch.num, round_num, [])
+    reached = [election_messages.add_vote(await DefaultVoteFactory(voter).create_vote(other_data.id, b'',
+                                                                                      epoch.num, round_num))
+               for voter in voters]
+    assert reached == [False] * (epoch.quorum_num - 1) + [True] + [False] * (len(voters) - epoch.quorum_num)
+
+    election_messages.add_data(other_data)
+    election_messages.update()
+    assert election_messages.result == other_data
+
+    # The same vote again is not counted twice.
+    last_vote = await DefaultVoteFactory(voters[epoch.quorum_num - 2]).create_vote(data.id, b'', epoch.num, round_num)
+    assert not election_messages.add_vote(last_vote)
+    last_vote = await DefaultVoteFactory(voters[-1]).create_vote(data.id, b'', epoch.num, round_num)
+    assert election_messages.add_vote(last_vote)
+    assert not election_messages.add_vote(last_vote)
+
+
 @pytest.mark.asyncio
 async def test_round_failure_none():
     epoch, round_num, election_messages, data, voters = await setup()
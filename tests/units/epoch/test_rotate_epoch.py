@@ -1,6 +1,8 @@
 import pytest
 from typing import Sequence
 from lft.app.epoch import RotateEpoch
+from lft.consensus.epoch import Epoch, EpochPool, VoterIndexer, VoterBitset
+from lft.consensus.exceptions import InvalidVoter
 from lft.consensus.messages.data import Data
 from lft.consensus.messages.vote import Vote
 
@@ -52,3 +54,54 @@ def test_rotate_epoch(round_num, rotate_epoch, leader_num):
     epoch = RotateEpoch(0, rotate_bound=rotate_epoch, voters=validators)
     consensus_data_mock = MockData(leader=validators[leader_num], round_=round_num)
     epoch.verify_data(consensus_data_mock)
+
+
+def test_voter_index():
+    validators = [b'0', b'1', b'2', b'3', b'1']
+    epoch = RotateEpoch(0, voters=validators)
+    assert [epoch.get_voter_index(voter) for voter in validators[:4]] == [0, 1, 2, 3]
+    assert epoch.get_voter_index(b'1') == 1
+    with pytest.raises(KeyError):
+        epoch.get_voter_index(b'4')
+
+    # Default of Epoch
+    assert Epoch.get_voter_index(epoch, b'3') == 3
+    with pytest.raises(KeyError):
+        Epoch.get_voter_index(epoch, b'4')
+
+    epoch.verify_voter(b'3')
+    with pytest.raises(InvalidVoter):
+        epoch.verify_voter(b'4')
+
+    voter_indexer = VoterIndexer(epoch)
+    assert voter_indexer.get_index(b'2') == 2
+    assert voter_indexer.get_index(b'x') == 5
+    assert voter_indexer.get_index(b'y') == 6
+    assert voter_indexer.get_index(b'x') == 5
+    assert VoterIndexer().get_index(b'x') == 0
+
+
+def test_voter_bitset():
+    voters = VoterBitset()
+    assert voters.add(3)
+    assert voters.add(300)
+    assert not voters.add(3)
+    assert len(voters) == 2
+    assert 3 in voters and 300 in voters
+    assert 4 not in voters
+
+
+def test_epoch_pool_prune():
+    epoch_pool = EpochPool()
+    for epoch_num in (3, 0, 2, 1):
+        epoch_pool.add_epoch(RotateEpoch(epoch_num, []))
+    epoch_pool.add_epoch(RotateEpoch(2, [b"voter"]))
+    assert len(epoch_pool) == 4
+
+    epoch_pool.prune_epoch(2)
+    assert len(epoch_pool) == 2
+    assert epoch_pool.find_epoch(1) is None
+    assert epoch_pool.get_epoch(2).voters == (b"voter", )
+
+    epoch_pool.prune_epoch(2)
+    assert len(epoch_pool) == 2
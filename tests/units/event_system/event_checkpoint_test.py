@@ -0,0 +1,104 @@
+import os
+import pickle
+from io import BytesIO, StringIO
+from lft.consensus.events import RoundEndEvent
+from lft.event import EventCheckpointable, EventCheckpointer, EventRecorder, EventReplayer, EventSimulator
+
+
+class Counter(EventCheckpointable):
+    def __init__(self):
+        self.value = 0
+
+    def snapshot(self) -> bytes:
+        return pickle.dumps(self.value)
+
+    def restore(self, snapshot: bytes):
+        self.value = pickle.loads(snapshot)
+
+
+def test_checkpointer():
+    counter = Counter()
+    checkpointer = EventCheckpointer(interval=10)
+    checkpointer.register("counter", counter)
+
+    checkpoint_io = BytesIO()
+    checkpointer.start(checkpoint_io)
+    for number in range(0, 100, 3):
+        counter.value = number
+        checkpointer.write(number)
+    checkpointer.stop()
+
+    # Interval skips 3, 6 and 9 after 0
+    checkpoint_io = BytesIO(checkpoint_io.getvalue()[:-1])  # Torn tail
+    for number, expected in ((0, 0), (11, 0), (12, 12), (50, 48), (95, 84), (1000, 84)):
+        counter.value = -1
+        assert checkpointer.restore(checkpoint_io, number) == expected
+        assert counter.value == expected
+
+    counter.value = -1
+    assert checkpointer.restore(BytesIO(), 100) == 0
+    assert counter.value == -1
+
+
+def test_checkpoint_at_clean_point():
+    counter = Counter()
+    checkpointer = EventCheckpointer(interval=0)
+    checkpointer.register("counter", counter)
+
+    event_simulator = EventSimulator()
+    event_recorder = EventRecorder(event_simulator, checkpointer)
+    checkpoint_io = BytesIO()
+    event_recorder.start(StringIO(), checkpoint_io=checkpoint_io)
+
+    deterministic_event = RoundEndEvent(True, 1, 0, os.urandom(16), os.urandom(16))
+    event_simulator.raise_event(deterministic_event)
+
+    counter.value = 10
+    checkpointer.request()
+    event_recorder.number = 10
+    event_recorder.on_event_record(_create_event())
+    assert checkpointer.requested
+
+    event_simulator.clear()
+    counter.value = 20
+    event_recorder.number = 20
+    event_recorder.on_event_record(_create_event())
+    assert not checkpointer.requested
+    event_recorder.stop()
+
+    counter.value = -1
+    assert checkpointer.restore(BytesIO(checkpoint_io.getvalue()), 100) == 20
+    assert counter.value == 20
+
+
+def test_replay_from_checkpoint():
+    counter = Counter()
+    checkpointer = EventCheckpointer(interval=0)
+    checkpointer.register("counter", counter)
+
+    record_io = StringIO()
+    index_io = BytesIO()
+    checkpoint_io = BytesIO()
+    event_recorder = EventRecorder(EventSimulator(), checkpointer)
+    event_recorder.start(record_io, index_io=index_io, checkpoint_io=checkpoint_io)
+    for number in range(0, 100, 5):
+        counter.value = number
+        if number % 20 == 0:
+            checkpointer.request()
+        event_recorder.number = number
+        event_recorder.on_event_record(_create_event())
+    event_recorder.stop()
+
+    counter.value = -1
+    event_replayer = EventReplayer(EventSimulator(), checkpointer)
+    event_replayer.start(StringIO(record_io.getvalue()), index_io=BytesIO(index_io.getvalue()),
+                         start_number=50, checkpoint_io=BytesIO(checkpoint_io.getvalue()))
+    assert counter.value == 40
+    assert event_replayer.number == 40 - EventReplayer.INIT_EVENT_COUNT
+    assert event_replayer._get_record_if_not_exist().number == 40
+
+
+def _create_event():
+    event = RoundEndEvent(True, 1, 0, os.urandom(16), os.urandom(16))
+    event.deterministic = False
+    return event
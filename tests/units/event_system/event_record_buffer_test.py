@@ -0,0 +1,73 @@
+import os
+import tempfile
+from io import StringIO
+from lft.consensus.events import RoundEndEvent
+from lft.event import EventRecorder, EventReplayer, EventSimulator, RecordBuffer, RecordBufferConfig, RecordFormat
+
+
+def test_record_buffer_flush():
+    io = StringIO()
+    buffer = RecordBuffer(io, RecordBufferConfig(flush_interval=60, flush_bytes=1024))
+    for i in range(10):
+        buffer.write(f"{i}\n")
+    assert buffer.stats.depth == 10
+    assert io.getvalue() == ""
+
+    buffer.flush()
+    assert io.getvalue() == "".join(f"{i}\n" for i in range(10))
+    assert buffer.stats.depth == 0
+    assert buffer.stats.max_depth == 10
+    assert buffer.stats.flushed_bytes == 20
+    assert buffer.stats.flush_count == 1
+
+    buffer.close()
+    assert buffer.closed
+
+
+def test_record_buffer_flush_bytes():
+    io = StringIO()
+    buffer = RecordBuffer(io, RecordBufferConfig(flush_interval=60, flush_bytes=10, max_bytes=10))
+    for i in range(100):
+        buffer.write("0123456789")
+    buffer.close()
+    assert io.getvalue() == "0123456789" * 100
+    assert buffer.stats.max_depth == 1
+
+
+def test_record_buffer_sync():
+    with tempfile.TemporaryFile() as io:
+        buffer = RecordBuffer(io, RecordBufferConfig(flush_interval=60))
+        buffer.write(b"record")
+        buffer.sync()
+        buffer.flush()
+        buffer.close()
+        assert buffer.stats.sync_count == 1
+
+        io.seek(0)
+        assert io.read() == b"record"
+
+
+def test_event_recorder_buffer():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "record.log")
+        events = [RoundEndEvent(True, 1, i, os.urandom(16), os.urandom(16)) for i in range(100)]
+        for event in events:
+            event.deterministic = False
+
+        event_recorder = EventRecorder(EventSimulator())
+        event_recorder.start(open(path, "wb"), RecordFormat.binary, RecordBufferConfig(flush_interval=60))
+        for event in events:
+            event_recorder.on_event_record(event)
+        assert event_recorder.buffer_stats.depth == 100
+        event_recorder.sync()
+        event_recorder.close()
+
+        event_replayer = EventReplayer(EventSimulator())
+        event_replayer.start(open(path, "rb"), RecordFormat.binary)
+        records = []
+        record = event_replayer._get_record_if_not_exist()
+        while record:
+            records.append(record)
+            record = event_replayer._get_record_if_not_exist()
+        event_replayer.close()
+        assert [record.event for record in records] == events
@@ -0,0 +1,91 @@
+import os
+import pytest
+from io import BytesIO, StringIO
+from lft.app.data import DefaultData
+from lft.app.vote import DefaultVote
+from lft.consensus.events import ReceiveDataEvent, ReceiveVoteEvent, RoundEndEvent
+from lft.event import EventRecorder, EventReplayer, EventSimulator, EventRecord, RecordFormat, convert_records
+from lft.serialization import BinarySerializer
+
+
+def test_binary_serializer():
+    values = [None, True, False, 0, -1, 2 ** 70, -2 ** 70, 0.5, b"", os.urandom(32), "", "0x", "한글",
+              [1, [b"a", None]], {"key": {"nested": -300}}]
+
+    serializer = BinarySerializer()
+    deserializer = BinarySerializer()
+    for value in values:
+        assert deserializer.deserialize(serializer.serialize(value)) == value
+
+
+def test_binary_serializer_symbols():
+    serializer = BinarySerializer()
+    first = serializer.serialize(_create_events()[0])
+    second = serializer.serialize(_create_events()[0])
+    assert len(second) < len(first)
+    assert serializer.symbols[0] == "lft.consensus.events.ReceiveDataEvent"
+
+
+def test_event_record():
+    record = EventRecord(0, RoundEndEvent(False, 0, 0, None, None))
+    serializer = BinarySerializer()
+    assert BinarySerializer().deserialize(serializer.serialize(record)).event == record.event
+
+
+@pytest.mark.parametrize("record_format", [RecordFormat.json, RecordFormat.binary])
+def test_record_format(record_format: RecordFormat):
+    events = _create_events()
+
+    event_simulator = EventSimulator()
+    event_recorder = EventRecorder(event_simulator)
+    record_io = StringIO() if record_format == RecordFormat.json else BytesIO()
+    event_recorder.start(record_io, record_format)
+    for event in events:
+        event_recorder.on_event_record(event)
+
+    record_io.seek(0)
+    event_replayer = EventReplayer(event_simulator)
+    event_replayer.start(record_io, record_format)
+    event_replayer.stop()
+
+    records = []
+    record = event_replayer._get_record_if_not_exist()
+    while record:
+        records.append(record)
+        record = event_replayer._get_record_if_not_exist()
+    assert [record.number for record in records] == list(range(len(events)))
+    assert [record.event for record in records] == events
+
+
+def test_convert_records():
+    events = _create_events()
+
+    json_io = StringIO()
+    event_recorder = EventRecorder(EventSimulator())
+    event_recorder.start(json_io, RecordFormat.json)
+    for event in events:
+        event_recorder.on_event_record(event)
+
+    json_io.seek(0)
+    binary_io = BytesIO()
+    assert convert_records(json_io, RecordFormat.json, binary_io, RecordFormat.binary) == len(events)
+    assert len(binary_io.getvalue()) < len(json_io.getvalue()) / 2
+
+    binary_io.seek(0)
+    converted_io = StringIO()
+    assert convert_records(binary_io, RecordFormat.binary, converted_io, RecordFormat.json) == len(events)
+    assert converted_io.getvalue() == json_io.getvalue()
+
+
+def _create_events():
+    events = []
+    for i in range(10):
+        vote = DefaultVote(os.urandom(16), os.urandom(16), os.urandom(16), os.urandom(16), 1, i)
+        data = DefaultData(os.urandom(16), os.urandom(16), os.urandom(16), i, 1, i, (vote, None))
+        events.append(ReceiveDataEvent(data))
+        events.append(ReceiveVoteEvent(vote))
+        events.append(RoundEndEvent(True, 1, i, data.id, data.prev_id))
+    for event in events:
+        event.deterministic = False
+    return events
+
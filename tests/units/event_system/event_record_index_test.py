@@ -0,0 +1,135 @@
+import os
+import pytest
+from io import BytesIO, StringIO
+from lft.consensus.events import RoundEndEvent
+from lft.event import EventRecorder, EventReplayer, EventSimulator, RecordFormat, RecordIndex
+from lft.event.mediators import TimestampEventMediator
+
+
+def test_record_index():
+    index_io = BytesIO()
+    index = RecordIndex(index_io)
+    for number in range(0, 100, 2):
+        index.add_record(number, number * 10, number // 10)
+    index.add_mark(7, 20)
+    index.add_mark(9, 40)
+    index.add_mark(7, 60)
+
+    index_io.seek(0)
+    index = RecordIndex.load(index_io)
+    assert index.find_record(0) == (0, 0)
+    assert index.find_record(31) == (32, 320)
+    assert index.find_record(98) == (98, 980)
+    assert index.find_record(99) is None
+
+    assert index.find_mark(7) == 20
+    assert index.find_mark(8) == 40
+    assert index.find_mark(10) is None
+
+    assert index.get_symbol_offsets(0) == []
+    assert index.get_symbol_offsets(200) == [100]
+    assert index.get_symbol_offsets(201) == [100, 200]
+
+
+@pytest.mark.parametrize("record_format", [RecordFormat.json, RecordFormat.binary])
+@pytest.mark.parametrize("start_number", [0, 1, 150, 299, 300])
+def test_replay_from_number(record_format: RecordFormat, start_number: int):
+    events = _create_events(100)
+    record_io, index_io = _record(events, record_format)
+
+    event_replayer = EventReplayer(EventSimulator())
+    event_replayer.start(record_io, record_format, index_io, start_number=start_number)
+    assert event_replayer.number == start_number - EventReplayer.INIT_EVENT_COUNT
+
+    records = _read_all(event_replayer)
+    assert [record.number for record in records] == [number for number in range(0, 300, 3)
+                                                     if number >= start_number]
+    assert [record.event for record in records] == events[(start_number + 2) // 3:]
+
+
+@pytest.mark.parametrize("record_format", [RecordFormat.json, RecordFormat.binary])
+def test_replay_from_mark(record_format: RecordFormat):
+    events = _create_events(100)
+    record_io, index_io = _record(events, record_format)
+
+    event_replayer = EventReplayer(EventSimulator())
+    event_replayer.start(record_io, record_format, index_io, start_mark=5)
+    records = _read_all(event_replayer)
+    assert records[0].number == 150
+    assert records[0].event == events[50]
+
+    index_io.seek(0)
+    with pytest.raises(RuntimeError):
+        event_replayer.start(record_io, record_format, index_io, start_mark=100)
+
+
+@pytest.mark.parametrize("record_format", [RecordFormat.json, RecordFormat.binary])
+def test_replay_stop_at_end(record_format: RecordFormat):
+    events = _create_events(10)
+    record_io, index_io = _record(events, record_format, step=1)
+
+    event_simulator = EventSimulator()
+    replayed = []
+    event_simulator.register_handler(RoundEndEvent, replayed.append)
+    event_replayer = EventReplayer(event_simulator)
+    event_replayer.start(record_io, record_format, index_io, start_number=4, stop_at_end=True)
+    event_simulator.start()
+
+    assert replayed == events[4:]
+    assert not event_simulator.is_running
+
+
+def test_mediator_index():
+    event_recorder = EventRecorder(EventSimulator())
+    timestamp_io = StringIO()
+    timestamp_index_io = BytesIO()
+
+    mediator = TimestampEventMediator()
+    mediator.switch_recorder(event_recorder, io=timestamp_io, index_io=timestamp_index_io)
+    results = {}
+    for number in range(100):
+        event_recorder.number = number
+        results[number] = [mediator.execute() for _ in range(number % 3)]
+
+    timestamp_io.seek(0)
+    timestamp_index_io.seek(0)
+    event_replayer = EventReplayer(EventSimulator())
+    mediator.switch_replayer(event_replayer, io=timestamp_io, index_io=timestamp_index_io)
+    for number in (50, 2, 98, 97, 4):
+        event_replayer.number = number
+        assert [mediator.execute() for _ in range(number % 3)] == results[number]
+
+
+def _create_events(count: int):
+    events = [RoundEndEvent(True, 1, i, os.urandom(16), os.urandom(16)) for i in range(count)]
+    for event in events:
+        event.deterministic = False
+    return events
+
+
+def _record(events: list, record_format: RecordFormat, step: int = 3):
+    record_io = StringIO() if record_format == RecordFormat.json else BytesIO()
+    index_io = BytesIO()
+
+    event_recorder = EventRecorder(EventSimulator())
+    event_recorder.start(record_io, record_format, index_io=index_io)
+    for i, event in enumerate(events):
+        event_recorder.number = i * step
+        event_recorder.on_event_record(event)
+        if i % 10 == 0:
+            event_recorder.mark(i // 10)
+    event_recorder.stop()
+
+    record_io = StringIO(record_io.getvalue()) if record_format == RecordFormat.json else BytesIO(record_io.getvalue())
+    return record_io, BytesIO(index_io.getvalue())
+
+
+def _read_all(event_replayer: EventReplayer):
+    event_replayer.stop()
+    records = []
+    record = event_replayer._get_record_if_not_exist()
+    while record:
+        records.append(record)
+        event_replayer._record = None
+        record = event_replayer._get_record_if_not_exist()
+    return records
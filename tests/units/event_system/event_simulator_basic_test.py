@@ -1,4 +1,4 @@
-from lft.event import EventSimulator, Event
+from lft.event import EventSimulator, Event, AnyEvent
 
 
 def test_event_simulator():
@@ -21,6 +21,75 @@ def test_event_simulator_unregister():
     assert results == [3]
 
 
+def test_event_simulator_dispatch():
+    event_simulator, results, handlers = _create_event_simulator()
+
+    def on_event1_register(event: Event1):
+        results.append("sync")
+        # Registered during dispatch, it must be called from the next Event1.
+        event_simulator.register_handler(Event1, lambda e: results.append("late"))
+
+    event_simulator.register_handler(Event1, on_event1_register)
+    event_simulator.raise_event(Event1())
+    event_simulator.start()
+    assert results == [1, "sync", 2, 3]
+
+    results.clear()
+    event_simulator.unregister_handler(Event1, on_event1_register)
+    event_simulator.raise_event(Event1())
+    event_simulator.start()
+    assert results == [1, "late", 2, 3]
+
+
+def test_event_simulator_stop_when_idle():
+    event_simulator = EventSimulator()
+    results = []
+    event_simulator.register_handler(Event1, lambda e: event_simulator.raise_event(Event2()))
+    event_simulator.register_handler(Event2, lambda e: results.append(e.value))
+
+    def on_event1_stop(event: Event1):
+        event_simulator.stop_when_idle()
+    event_simulator.register_handler(Event1, on_event1_stop)
+
+    stats = event_simulator.profile()
+    event_simulator.raise_event(Event1())
+    event_simulator.start()
+
+    assert results == [2]
+    assert not event_simulator.is_running
+    assert stats.count == 2
+    assert stats.get_count(Event1) == 1
+    assert stats.get_count(Event2) == 1
+    assert stats.get_count(Event3) == 0
+
+
+def test_event_simulator_filter():
+    event_simulator, results, _ = _create_event_simulator()
+    filtered = []
+
+    def event2_filter(event: Event2):
+        filtered.append(event.value)
+        return False
+    event_simulator.register_filter(Event2, event2_filter)
+    event_simulator.register_handler(AnyEvent, lambda e: results.append("any"))
+
+    def on_event1_stop(event: Event1):
+        event_simulator.stop_when_idle()
+    event_simulator.register_handler(Event1, on_event1_stop)
+
+    event_simulator.raise_event(Event1())
+    event_simulator.start()
+    assert results == ["any", 1]
+    assert filtered == [2]
+
+    results.clear()
+    event_simulator.unregister_handler(Event1, on_event1_stop)
+    event_simulator.unregister_filter(Event2, event2_filter)
+    event_simulator.raise_event(Event1())
+    event_simulator.start()
+    assert results == ["any", 1, "any", 2, "any", 3]
+
+
 class Event1(Event):
     value = 1
 
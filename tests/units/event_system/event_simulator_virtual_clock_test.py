@@ -0,0 +1,77 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from lft.event import EventSystem, Event, VirtualClock
+from lft.event.mediators import DelayedEventMediator
+
+
+def test_virtual_clock_delayed_events():
+    results = []
+
+    clock = VirtualClock()
+    event_system = EventSystem(clock=clock)
+    event_system.set_mediator(DelayedEventMediator)
+    event_system.simulator.register_handler(DelayedEvent, lambda e: on_delayed_event(e, results, clock))
+    event_system.simulator.register_handler(StopEvent, lambda e: event_system.stop())
+
+    mediator = event_system.get_mediator(DelayedEventMediator)
+    mediator.switch_instant(event_system.simulator)
+    for delay in (1000, 10, 500, 10):
+        mediator.execute(delay, delayed_event(delay))
+    mediator.execute(1001, delayed_event(None, StopEvent))
+
+    start_time = time.perf_counter()
+    event_system.start()
+
+    assert time.perf_counter() - start_time < 10
+    assert results == [(10, 10), (10, 10), (500, 500), (1000, 1000)]
+    assert clock.time() == 1001
+
+
+def test_virtual_clock_shared_by_simulators():
+    results = []
+
+    clock = VirtualClock()
+    event_systems = [EventSystem(clock=clock) for _ in range(2)]
+    for i, event_system in enumerate(event_systems):
+        event_system.set_mediator(DelayedEventMediator)
+        peer = event_systems[(i + 1) % len(event_systems)]
+        event_system.simulator.register_handler(DelayedEvent, lambda e, peer=peer: on_ping(e, results, clock, peer))
+        event_system.start(blocking=False)
+
+    mediator = event_systems[0].get_mediator(DelayedEventMediator)
+    mediator.execute(1.5, delayed_event(0))
+
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(clock.sleep(8.0))
+    for event_system in event_systems:
+        event_system.stop()
+
+    assert results[:5] == [(0, 1.5), (1, 3.0), (2, 4.5), (3, 6.0), (4, 7.5)]
+
+
+@dataclass
+class DelayedEvent(Event):
+    value: int
+
+
+@dataclass
+class StopEvent(Event):
+    value: int
+
+
+def delayed_event(value, event_type=DelayedEvent):
+    event = event_type(value)
+    event.deterministic = False
+    return event
+
+
+def on_delayed_event(event: DelayedEvent, results: list, clock: VirtualClock):
+    results.append((event.value, clock.time()))
+
+
+def on_ping(event: DelayedEvent, results: list, clock: VirtualClock, peer: EventSystem):
+    results.append((event.value, clock.time()))
+
+    mediator = peer.get_mediator(DelayedEventMediator)
+    mediator.execute(1.5, delayed_event(event.value + 1))
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import StringIO
+from lft.event import EventSystem, Event, VirtualClock
+from lft.event.mediators import DelayedEventMediator, ExecutorEventMediator
+
+
+def test_executor_event_mediator():
+    results = []
+
+    event_system = EventSystem()
+    event_system.set_mediator(ExecutorEventMediator)
+    event_system.simulator.register_handler(ResultEvent, lambda e: on_result(e, results, event_system))
+
+    pool = ThreadPoolExecutor(1)
+    mediator = event_system.get_mediator(ExecutorEventMediator)
+    mediator.switch_instant(event_system.simulator)
+    mediator.execute(pool, lambda: threading.current_thread().name, result_event)
+
+    event_system.start()
+    assert len(results) == 1
+    assert results[0] != threading.current_thread().name
+
+
+def test_executor_event_mediator_virtual_clock():
+    results = []
+
+    clock = VirtualClock()
+    event_system = EventSystem(clock=clock)
+    event_system.set_mediator(ExecutorEventMediator)
+    event_system.set_mediator(DelayedEventMediator)
+    event_system.simulator.register_handler(ResultEvent, lambda e: results.append((e.value, clock.time())))
+    event_system.simulator.register_handler(StopEvent, lambda e: event_system.stop())
+
+    executor_mediator = event_system.get_mediator(ExecutorEventMediator)
+    executor_mediator.switch_instant(event_system.simulator)
+    executor_mediator.execute(ThreadPoolExecutor(1), lambda: time.sleep(0.1) or "done", result_event)
+
+    delayed_mediator = event_system.get_mediator(DelayedEventMediator)
+    delayed_mediator.switch_instant(event_system.simulator)
+    stop_event = StopEvent()
+    stop_event.deterministic = False
+    delayed_mediator.execute(1.0, stop_event)
+
+    event_system.start()
+
+    # Virtual time does not pass while the pool is running
+    assert results == [("done", 0.0)]
+    assert clock.time() == 1.0
+
+
+def test_executor_event_mediator_replayer():
+    event_system = EventSystem()
+    event_system.set_mediator(ExecutorEventMediator)
+    event_system.start_replay(StringIO(), blocking=False)
+
+    called = []
+    mediator = event_system.get_mediator(ExecutorEventMediator)
+    assert mediator.execute(ThreadPoolExecutor(1), lambda: called.append(True), result_event) is None
+
+    asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.1))
+    event_system.stop()
+    assert not called
+
+
+def on_result(event: 'ResultEvent', results: list, event_system: EventSystem):
+    results.append(event.value)
+    event_system.stop()
+
+
+def result_event(value):
+    event = ResultEvent(value)
+    event.deterministic = False
+    return event
+
+
+@dataclass
+class ResultEvent(Event):
+    value: str
+
+
+@dataclass
+class StopEvent(Event):
+    pass
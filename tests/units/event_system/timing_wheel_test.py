@@ -0,0 +1,55 @@
+from lft.event import TimingWheel, VirtualClock, get_timing_wheel
+
+
+def test_timing_wheel_fires_tick_at_once():
+    results = []
+
+    clock = VirtualClock()
+    wheel = TimingWheel(resolution=0.1, clock=clock)
+    for value, delay in enumerate((0.25, 0.21, 0.3, 1.0, 0.3)):
+        wheel.call_later(delay, lambda value=value: results.append((value, clock.time())))
+
+    # 0.21, 0.25 and 0.3 share a tick. One timer of the clock per tick.
+    assert wheel.stats.buckets == 2
+    assert len(clock._timers) == 2
+    assert wheel.stats.pending == wheel.stats.max_pending == 5
+
+    _run_timers(clock)
+    assert results == [(0, 0.3), (1, 0.3), (2, 0.3), (4, 0.3), (3, 1.0)]
+    assert wheel.stats.fired == 5
+    assert wheel.stats.pending == wheel.stats.buckets == 0
+
+
+def test_timing_wheel_cancel():
+    results = []
+
+    clock = VirtualClock()
+    wheel = TimingWheel(resolution=0.1, clock=clock)
+    handles = [wheel.call_later(delay, results.append, delay) for delay in (0.5, 0.5, 1.5)]
+
+    handles[0].cancel()
+    handles[0].cancel()
+    assert handles[0].cancelled()
+    assert wheel.stats.buckets == 2
+
+    # An empty tick cancels its timer
+    handles[2].cancel()
+    assert wheel.stats.buckets == 1
+    assert len([timer for _, _, timer in clock._timers if not timer.cancelled()]) == 1
+
+    _run_timers(clock)
+    assert results == [0.5]
+    assert wheel.stats.fired == 1
+    assert wheel.stats.cancelled == 2
+    assert wheel.stats.pending == 0
+
+
+def test_timing_wheel_shared_by_clock():
+    clock = VirtualClock()
+    assert get_timing_wheel(clock) is get_timing_wheel(clock)
+    assert get_timing_wheel(clock) is not get_timing_wheel(VirtualClock())
+
+
+def _run_timers(clock: VirtualClock):
+    while clock._fire_due_timers():
+        pass
@@ -0,0 +1,41 @@
+import os
+import pytest
+from lft.app.data import DefaultDataFactory
+from lft.consensus.messages.message import MessageCache
+
+
+@pytest.mark.asyncio
+async def test_data_cache_check():
+    data_cache = MessageCache()
+    data = await _create_data(1, 0)
+
+    assert not data_cache.has(data)
+    assert not data_cache.check(data)
+    data_cache.add(data)
+    data_cache.add(data)
+    assert data_cache.has(data)
+    assert data_cache.check(data)
+    assert not data_cache.check(await _create_data(1, 1))
+
+    assert len(data_cache) == 1
+    assert data_cache.stats.hits == 1
+    assert data_cache.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_data_cache_prune():
+    data_cache = MessageCache(max_size=3)
+    datums = [await _create_data(1, round_num) for round_num in (0, 0, 1, 2)]
+    for data in datums:
+        data_cache.add(data)
+
+    assert [data.id in data_cache for data in datums] == [False, False, True, True]
+
+    data_cache.prune(1, 2)
+    assert [data.id in data_cache for data in datums] == [False, False, False, True]
+    assert len(data_cache) == 1
+
+
+async def _create_data(epoch_num: int, round_num: int):
+    data_factory = DefaultDataFactory(os.urandom(16))
+    return await data_factory.create_data(0, os.urandom(16), epoch_num, round_num, ())
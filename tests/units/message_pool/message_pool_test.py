@@ -0,0 +1,88 @@
+import os
+import pytest
+from lft.app.data import DefaultDataFactory
+from lft.app.vote import DefaultVoteFactory
+from lft.consensus.messages.data import DataPool
+from lft.consensus.messages.vote import VotePool
+
+
+@pytest.mark.asyncio
+async def test_get_votes():
+    vote_pool = VotePool()
+    votes = {}
+    for epoch_num in (2, 1):
+        for round_num in (3, 0, 1):
+            votes[epoch_num, round_num] = [await _create_vote(epoch_num, round_num) for _ in range(4)]
+            for vote in votes[epoch_num, round_num]:
+                vote_pool.add_vote(vote)
+
+    for (epoch_num, round_num), expected in votes.items():
+        assert list(vote_pool.get_votes(epoch_num, round_num)) == expected
+    assert list(vote_pool.get_votes(1, 2)) == []
+    assert list(vote_pool.get_votes(3, 0)) == []
+
+
+@pytest.mark.asyncio
+async def test_prune_vote():
+    vote_pool = VotePool()
+    votes = {}
+    for epoch_num in range(1, 3):
+        for round_num in range(4):
+            votes[epoch_num, round_num] = await _create_vote(epoch_num, round_num)
+            vote_pool.add_vote(votes[epoch_num, round_num])
+
+    assert len(vote_pool) == 8
+    vote_pool.prune_vote(1, 2)
+    assert len(vote_pool) == 6
+    for (epoch_num, round_num), vote in votes.items():
+        assert (vote.id in vote_pool) == ((epoch_num, round_num) >= (1, 2))
+    assert list(vote_pool.get_votes(1, 1)) == []
+    assert list(vote_pool.get_votes(1, 2)) == [votes[1, 2]]
+
+    vote_pool.prune_vote(3, 0)
+    assert not any(vote.id in vote_pool for vote in votes.values())
+    assert list(vote_pool.get_votes(2, 3)) == []
+
+
+@pytest.mark.asyncio
+async def test_prune_unreal_data():
+    data_factory = DefaultDataFactory(os.urandom(16))
+    data_pool = DataPool()
+    none_data = data_factory.create_none_data(1, 0, os.urandom(16))
+    lazy_data = data_factory.create_lazy_data(1, 1, os.urandom(16))
+    data_pool.add_data(none_data)
+    data_pool.add_data(lazy_data)
+
+    assert list(data_pool.get_datums(1, 0)) == [none_data]
+    assert list(data_pool.get_datums(1, 1)) == [lazy_data]
+
+    data_pool.prune_data(1, 1)
+    assert list(data_pool.get_datums(1, 0)) == []
+    assert list(data_pool.get_datums(1, 1)) == [lazy_data]
+
+
+@pytest.mark.asyncio
+async def test_get_datums_connected():
+    data_factory = DefaultDataFactory(os.urandom(16))
+    data_pool = DataPool()
+    prev_id = os.urandom(16)
+    datums = [await data_factory.create_data(1, prev_id, 1, round_num, ()) for round_num in range(3)]
+    other_data = await data_factory.create_data(1, os.urandom(16), 1, 0, ())
+    for data in datums + [other_data]:
+        data_pool.add_data(data)
+
+    assert list(data_pool.get_datums_connected(prev_id)) == datums
+    assert list(data_pool.get_datums_connected(other_data.prev_id)) == [other_data]
+    assert list(data_pool.get_datums_connected(os.urandom(16))) == []
+
+    data_pool.prune_data(1, 1)
+    assert list(data_pool.get_datums_connected(prev_id)) == datums[1:]
+    assert list(data_pool.get_datums_connected(other_data.prev_id)) == []
+
+    data_pool.prune_data(2, 0)
+    assert list(data_pool.get_datums_connected(prev_id)) == []
+
+
+async def _create_vote(epoch_num: int, round_num: int):
+    vote_factory = DefaultVoteFactory(os.urandom(16))
+    return await vote_factory.create_vote(os.urandom(16), os.urandom(16), epoch_num, round_num)
@@ -0,0 +1,48 @@
+import os
+import pytest
+from lft.app.vote import DefaultVoteFactory
+from lft.consensus.messages.message import MessageCache
+
+
+@pytest.mark.asyncio
+async def test_vote_cache_check():
+    vote_cache = MessageCache()
+    vote = await _create_vote(1, 0)
+
+    assert not vote_cache.check(vote)
+    vote_cache.add(vote)
+    vote_cache.add(vote)
+    assert vote_cache.check(vote)
+    assert not vote_cache.check(await _create_vote(1, 0))
+
+    assert len(vote_cache) == 1
+    assert vote_cache.stats.hits == 1
+    assert vote_cache.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_vote_cache_prune():
+    vote_cache = MessageCache()
+    votes = [await _create_vote(epoch_num, round_num) for epoch_num in (2, 1) for round_num in (1, 0)]
+    for vote in votes:
+        vote_cache.add(vote)
+
+    vote_cache.prune(2, 0)
+    assert [vote.id in vote_cache for vote in votes] == [True, True, False, False]
+    assert len(vote_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_vote_cache_drops_oldest_generation():
+    vote_cache = MessageCache(max_size=4)
+    votes = [await _create_vote(1, round_num) for round_num in (1, 0, 1, 2, 2)]
+    for vote in votes:
+        vote_cache.add(vote)
+
+    assert [vote.id in vote_cache for vote in votes] == [True, False, True, True, True]
+    assert len(vote_cache) == 4
+
+
+async def _create_vote(epoch_num: int, round_num: int):
+    vote_factory = DefaultVoteFactory(os.urandom(16))
+    return await vote_factory.create_vote(os.urandom(16), os.urandom(16), epoch_num, round_num)
@@ -0,0 +1,56 @@
+import os
+import pytest
+from lft.app.data import DefaultDataFactory, DefaultData
+from lft.app.vote import DefaultVoteFactory
+from lft.consensus.messages.vote import VoteCertificate
+from lft.serialization import Serializer, BinarySerializer
+
+
+async def _create_votes(voters, data_id=b"data", commit_id=b"commit"):
+    return [await DefaultVoteFactory(voter).create_vote(data_id, commit_id, 1, 2) for voter in voters]
+
+
+@pytest.mark.asyncio
+async def test_vote_certificate_expand():
+    voters = [os.urandom(16) for _ in range(7)]
+    votes = await _create_votes(voters)
+    votes[1] = votes[4] = None
+
+    certificate = VoteCertificate.from_votes(votes)
+    assert len(certificate) == 5
+    assert certificate.voter_indices() == (0, 2, 3, 5, 6)
+    assert certificate.expand(voters, DefaultVoteFactory(voters[0])) == tuple(votes)
+
+
+@pytest.mark.asyncio
+async def test_vote_certificate_not_shared():
+    voters = [os.urandom(16) for _ in range(4)]
+    votes = await _create_votes(voters)
+    votes[3] = (await _create_votes(voters[3:], commit_id=b"other"))[0]
+
+    assert VoteCertificate.from_votes(votes) is None
+    assert VoteCertificate.from_votes([None] * 4) is None
+    assert VoteCertificate.from_votes([DefaultVoteFactory(voters[0]).create_none_vote(1, 2)]) is None
+
+
+@pytest.mark.asyncio
+async def test_compact_prev_votes():
+    voters = [os.urandom(16) for _ in range(16)]
+    votes = await _create_votes(voters)
+    votes[0] = None
+
+    data = await DefaultDataFactory(voters[0]).create_data(3, b"data", 1, 3, votes)
+    compact_data = await DefaultDataFactory(voters[0], compact_prev_votes=True).create_data(3, b"data", 1, 3, votes)
+    assert data.prev_votes_certificate is None
+    assert compact_data.prev_votes == ()
+    assert compact_data.prev_votes_certificate == VoteCertificate.from_votes(votes)
+    assert compact_data.id != data.id
+
+    for serializer_type in (Serializer, BinarySerializer):
+        serialized = serializer_type().serialize(compact_data)
+        assert len(serialized) * 2 < len(serializer_type().serialize(data))
+
+        deserialized = serializer_type().deserialize(serialized)
+        assert isinstance(deserialized, DefaultData)
+        assert deserialized == compact_data
+        assert deserialized.prev_votes_certificate.expand(voters, DefaultVoteFactory(voters[0])) == tuple(votes)
@@ -0,0 +1,31 @@
+import pytest
+from lft.app.epoch import RotateEpoch
+from lft.consensus.round import RoundPool
+from tests.units.consensus.mocks import RoundMock
+
+
+def test_round_pool():
+    epochs = [RotateEpoch(1, []), RotateEpoch(2, [])]
+    round_pool = RoundPool()
+    rounds = {}
+    for epoch, round_num in ((epochs[1], 0), (epochs[0], 3), (epochs[0], 1), (epochs[1], 2), (epochs[0], 2)):
+        rounds[epoch.num, round_num] = RoundMock(epoch, round_num)
+        round_pool.add_round(rounds[epoch.num, round_num])
+
+    assert [(round_.epoch_num, round_.num) for round_ in round_pool.rounds] == sorted(rounds)
+    assert round_pool.first_round() is rounds[1, 1]
+    for key, round_ in rounds.items():
+        assert round_pool.get_round(*key) is round_
+    with pytest.raises(KeyError):
+        round_pool.get_round(1, 0)
+
+    assert len(round_pool) == 5
+    iterated_rounds = round_pool.rounds
+    round_pool.prune_round(1, 3)
+    assert len(round_pool) == 3
+    assert len(iterated_rounds) == 5  # Not pruned in place
+    assert [(round_.epoch_num, round_.num) for round_ in round_pool.rounds] == [(1, 3), (2, 0), (2, 2)]
+    assert round_pool.first_round() is rounds[1, 3]
+    with pytest.raises(KeyError):
+        round_pool.get_round(1, 2)
+    assert round_pool.get_round(2, 2) is rounds[2, 2]
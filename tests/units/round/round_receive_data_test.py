@@ -1,6 +1,6 @@
 import pytest
 from lft.app.vote import DefaultVoteFactory
-from lft.consensus.exceptions import InvalidEpoch, InvalidRound, AlreadyProposed
+from lft.consensus.admission import AdmissionResult
 from tests.units.round.setup_items import setup_items
 
 
@@ -18,8 +18,7 @@ async def test_round_invalid_epoch():
                                                       epoch_num=invalid_epoch_num,
                                                       round_num=round_num,
                                                       prev_votes=candidate_votes)
-        with pytest.raises(InvalidEpoch):
-            await round_._receive_data(data)
+        assert await round_._receive_data(data) == AdmissionResult.INVALID_EPOCH
 
 
 @pytest.mark.asyncio
@@ -36,8 +35,7 @@ async def test_round_invalid_round():
                                                       epoch_num=epoch.num,
                                                       round_num=invalid_round_num,
                                                       prev_votes=candidate_votes)
-        with pytest.raises(InvalidRound):
-            await round_._receive_data(data)
+        assert await round_._receive_data(data) == AdmissionResult.INVALID_ROUND
 
 
 @pytest.mark.asyncio
@@ -54,8 +52,7 @@ async def test_round_already_propose():
                                                       round_num=round_num,
                                                       prev_votes=candidate_votes)
         await round_._receive_data(data)
-        with pytest.raises(AlreadyProposed):
-            await round_._receive_data(data)
+        assert await round_._receive_data(data) == AdmissionResult.ALREADY_PROPOSED
 
 
 @pytest.mark.asyncio
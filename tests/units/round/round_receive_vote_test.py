@@ -2,8 +2,8 @@ import random
 import pytest
 from lft.app.vote import DefaultVoteFactory
 from lft.consensus.round import TIMEOUT_PROPOSE, TIMEOUT_VOTE
-from lft.consensus.events import ReceiveDataEvent, ReceiveVoteEvent
-from lft.consensus.exceptions import InvalidEpoch, InvalidRound, AlreadyVoted
+from lft.consensus.events import ReceiveDataEvent, VoteTimeoutEvent
+from lft.consensus.admission import AdmissionResult
 from lft.event.mediators import DelayedEventMediator
 from tests.units.round.setup_items import setup_items
 
@@ -18,8 +18,7 @@ async def test_round_invalid_epoch():
 
         invalid_epoch_num = epoch.num + 1
         vote = await round_._vote_factory.create_vote(b'test', candidate_data.id, invalid_epoch_num, round_num)
-        with pytest.raises(InvalidEpoch):
-            await round_._receive_vote(vote)
+        assert await round_._receive_vote(vote) == AdmissionResult.INVALID_EPOCH
 
 
 @pytest.mark.asyncio
@@ -32,8 +31,7 @@ async def test_round_invalid_round():
 
         invalid_round_num = round_num + 1
         vote = await round_._vote_factory.create_vote(b'test', candidate_data.id, epoch.num, invalid_round_num)
-        with pytest.raises(InvalidRound):
-            await round_._receive_vote(vote)
+        assert await round_._receive_vote(vote) == AdmissionResult.INVALID_ROUND
 
 
 @pytest.mark.asyncio
@@ -48,8 +46,7 @@ async def test_round_already_vote():
         await round_._receive_vote(vote)
 
         same_vote = await round_._vote_factory.create_vote(b'test', candidate_data.id, epoch.num, round_num)
-        with pytest.raises(AlreadyVoted):
-            await round_._receive_vote(same_vote)
+        assert await round_._receive_vote(same_vote) == AdmissionResult.ALREADY_VOTED
         same_vote._id = b'1'
         await round_._receive_vote(same_vote)
 
@@ -57,8 +54,7 @@ async def test_round_already_vote():
         await round_._receive_vote(none_vote)
 
         same_none_vote = round_._vote_factory.create_none_vote(epoch.num, round_num)
-        with pytest.raises(AlreadyVoted):
-            await round_._receive_vote(same_none_vote)
+        assert await round_._receive_vote(same_none_vote) == AdmissionResult.ALREADY_VOTED
         same_none_vote._id = b'3'
         await round_._receive_vote(same_none_vote)
 
@@ -80,10 +76,10 @@ async def test_round_none_vote_received():
             none_votes.append(none_vote)
             await round_.receive_vote(none_vote)
 
-        assert len(election.receive_vote.call_args_list) == epoch.quorum_num
-        for none_vote, call_args in zip(none_votes, election.receive_vote.call_args_list):
-            vote, = call_args[0]
-            assert vote is none_vote
+        assert len(election.receive_votes.call_args_list) == epoch.quorum_num
+        for none_vote, call_args in zip(none_votes, election.receive_votes.call_args_list):
+            votes, = call_args[0]
+            assert votes == [none_vote]
 
 
 @pytest.mark.asyncio
@@ -119,15 +115,18 @@ async def test_round_reach_quorum(voter_num: int):
         none_vote = quorum_vote_factories[-1].create_none_vote(epoch.num, round_num)
         await round_.receive_vote(none_vote)
 
-        assert len(mediator.execute.call_args_list) == len(voters)
+        mediator.execute.assert_called_once()
 
-        for voter, call_args in zip(voters, mediator.execute.call_args_list):
-            timeout, event = call_args[0]
-            assert timeout == TIMEOUT_VOTE
-            assert isinstance(event, ReceiveVoteEvent)
-            assert event.vote.is_lazy()
+        timeout, event = mediator.execute.call_args_list[0][0]
+        assert timeout == TIMEOUT_VOTE
+        assert isinstance(event, VoteTimeoutEvent)
+        assert (event.epoch_num, event.round_num) == (epoch.num, round_num)
         mediator.execute.reset_mock()
 
+        lazy_votes = round_.new_lazy_votes()
+        assert [vote.voter_id for vote in lazy_votes] == list(epoch.voters)
+        assert all(vote.is_lazy() for vote in lazy_votes)
+
         none_vote = vote_factories[-1].create_none_vote(epoch.num, round_num)
         await round_.receive_vote(none_vote)
 
@@ -163,3 +162,52 @@ async def test_round_reach_quorum_consensus(voter_num: int):
             await round_.receive_vote(vote)
 
         mediator.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_round_cancel_timers():
+    round_num = 0
+    voter_num = 7
+
+    async with setup_items(voter_num, round_num) as (
+            voters, event_system, round_, election, epoch, candidate_data, candidate_votes):
+        await round_.round_start()
+
+        mediator = event_system.get_mediator(DelayedEventMediator)
+        timer = mediator.execute.return_value
+        timer.cancel.assert_not_called()
+
+        election.is_ended = True
+        vote = await DefaultVoteFactory(voters[1]).create_vote(b'test', candidate_data.id, epoch.num, round_num)
+        await round_.receive_vote(vote)
+        timer.cancel.assert_called_once()
+
+        # Already cancelled timers are not cancelled again on pruning
+        round_.cancel_timers()
+        timer.cancel.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_round_receive_votes():
+    round_num = 0
+    voter_num = 7
+
+    async with setup_items(voter_num, round_num) as (
+            voters, event_system, round_, election, epoch, candidate_data, candidate_votes):
+        # Propose NoneData
+        await round_.round_start()
+        mediator = event_system.get_mediator(DelayedEventMediator)
+        mediator.execute.reset_mock()
+
+        none_votes = [DefaultVoteFactory(voter).create_none_vote(epoch.num, round_num)
+                      for voter in voters[:epoch.quorum_num]]
+        data_votes = [await DefaultVoteFactory(voter).create_vote(b'test', candidate_data.id, epoch.num, round_num)
+                      for voter in voters[epoch.quorum_num:]]
+        results = await round_.receive_votes(none_votes + data_votes + none_votes[:1])
+
+        assert results == [AdmissionResult.ACCEPTED] * voter_num + [AdmissionResult.ALREADY_VOTED]
+        election.receive_vote.assert_not_called()
+        election.receive_votes.assert_called_once_with(none_votes)
+
+        # Quorum consensus on NoneData, the vote timeout is not started
+        mediator.execute.assert_not_called()
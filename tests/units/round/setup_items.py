@@ -30,6 +30,7 @@ async def setup_items(voter_num: int, round_num: int):
                                   vote_factory,
                                   DataPool(),
                                   VotePool()))
+    election.is_ended = False
     round_ = Round(election,
                    voter,
                    epoch,